@@ -2,15 +2,41 @@
 Benchmark program
 """
 import copy
+import math
 import os
 import random
 import time
 import sys
+import tracemalloc
+from array import array
 import matplotlib.pyplot as plt
 
 from closest_pair import Point, bf_closest_pair_2d, closest_pair_2d,\
     closest_pair_2d_opt, bf_closest_pair_kd, closest_pair_kd,\
-    gen_unique_kd_points
+    gen_unique_kd_points, bf_closest_pair_geo, closest_pair_geo, RangeIndex,\
+    ProgressHook, closest_pair_array, bf_closest_pair_blocked,\
+    closest_pair_groups
+from closest_pair.analysis import GrowthError, check_growth
+from closest_pair.closest_pair_kd import closest_kd
+from closest_pair.closest_pair_array import _sweep_vec
+from closest_pair.morton import curve_seed, morton_order
+from closest_pair.results import save_run
+from run import Run
+
+try:
+    import numpy as np
+except ImportError:  # buffer benchmarks run without numpy
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # head to head runs without scipy
+    cKDTree = None
+
+try:
+    from sklearn.neighbors import NearestNeighbors
+except ImportError:  # head to head runs without scikit-learn
+    NearestNeighbors = None
 
 
 class Benchmark(object):
@@ -28,7 +54,16 @@ class Benchmark(object):
         "2D Bruteforce VS Recursion",
         "K-D Bruteforce",
         "K-D Recursion",
-        "K-D Bruteforce vs Recursion"
+        "K-D Bruteforce vs Recursion",
+        "K-D Recursion by Dimension",
+        "Globe Haversine Bruteforce vs Unit Vectors",
+        "2D Range Queries: Filter + Optimized vs Range Index",
+        "K-D Progress Hook Overhead",
+        "Buffers float64 vs float32",
+        "Head to Head vs SciPy cKDTree and scikit-learn",
+        "Buffers Morton Order and Curve Seeding",
+        "run.py Point Loading: One by One vs Set",
+        "Blocked and Groups Thread Scaling"
     ]
 
     def menu(self):
@@ -66,7 +101,16 @@ class Benchmark(object):
             self.bf_2d_vs_recursion_2d,
             self.bruteforce_kd,
             self.recursion_kd,
-            self.bf_kd_vs_recursion_kd
+            self.bf_kd_vs_recursion_kd,
+            self.recursion_kd_dimensions,
+            self.bf_geo_vs_geo,
+            self.filter_vs_range_index,
+            self.hook_overhead,
+            self.array_precision,
+            self.head_to_head,
+            self.array_morton,
+            self.run_loading,
+            self.thread_scaling
         ]
         menu = self.menu()
 
@@ -86,7 +130,14 @@ class Benchmark(object):
 
                 # run benchmark methods
                 if choice >= 1 and choice <= len(benchmarks):
-                    benchmarks[choice-1](choice)
+                    benchmark = benchmarks[choice-1]
+                    benchmark(choice)
+
+                    # store the plotted timings for report.py
+                    if plt.get_fignums():
+                        path = save_run(benchmark.__name__, [
+                            plt.figure(num) for num in plt.get_fignums()])
+                        print(f"\nSaved timings to {path}")
 
                     # show graph and close afterwards
                     plt.show()
@@ -828,6 +879,660 @@ class Benchmark(object):
         plt.title(f'Growth Rates: Bruteforce vs Recursion {dim}D')
         plt.legend()  # show legend
 
+    def recursion_kd_dimensions(self, fig=11):
+        """
+        Benchmarks recursion of closest pair of points for dimensions 3 to 6.
+        Runs the recursion directly, as closest_pair_kd() hands dimensions
+        from BLOCKED_MIN_DIM up to the blocked bruteforce when numpy is
+        installed.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        dimensions = [3, 4, 5, 6]
+        sample_size = 12
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 1) for i in range(sample_size)]
+        timings = {dim: [] for dim in dimensions}
+
+        # headings variables
+        heading1 = "n input"
+        heading2 = "timings (seconds)"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+
+        for dim in dimensions:
+            print(f"\nRECURSION {dim}D\n\n"
+                  f"{heading1:<{pad_size}} {heading2}\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * len(heading2)}")
+
+            for i in range(sample_size):
+                # create list of points
+                points = gen_unique_kd_points(n[i], dim)
+
+                # benchmarking, same steps as closest_pair_kd()
+                start_time = time.perf_counter()
+                points_xsorted = sorted(points, key=lambda p: p[0])
+                answer = closest_kd(points_xsorted, 0, n[i] - 1, dim)
+                end_time = time.perf_counter()
+
+                # add time diff to timings
+                duration = end_time - start_time
+                timings[dim].append(duration)
+
+                print(f"{n[i]:<{pad_size}} {duration}")
+
+        # graph results
+        plt.figure(fig)
+        for dim in dimensions:
+            plt.plot(n, timings[dim], label=f"Recursion {dim}D")
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: Recursion by Dimension')
+        plt.legend()  # show legend
+
+    def bf_geo_vs_geo(self, fig=12):
+        """
+        Benchmarks haversine bruteforce vs unit vector closest pair of
+        (lat, lon) points
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        sample_size = 11
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 1) for i in range(sample_size)]
+        timings_bf = []
+        timings_geo = []
+        bf_answers = []
+        geo_answers = []
+
+        # generate (lat, lon) points
+        lists = [[(random.uniform(-90, 90), random.uniform(-180, 180))
+                  for _ in range(n[i])] for i in range(sample_size)]
+
+        # headings variables
+        heading1 = "n input"
+        heading2 = "timings (seconds)"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+
+        for title, func, timings, answers in (
+                ("HAVERSINE BRUTEFORCE", bf_closest_pair_geo, timings_bf,
+                 bf_answers),
+                ("UNIT VECTORS", closest_pair_geo, timings_geo,
+                 geo_answers)):
+            print(f"\n{title}\n\n"
+                  f"{heading1:<{pad_size}} {heading2}\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * len(heading2)}")
+
+            for i in range(sample_size):
+                # benchmarking
+                start_time = time.perf_counter()
+                answer = func(lists[i])
+                end_time = time.perf_counter()
+
+                # add time diff to timings
+                duration = end_time - start_time
+                timings.append(duration)
+                answers.append(answer)
+
+                print(f"{n[i]:<{pad_size}} {duration}")
+
+        # verify both have the same answer within a micrometer
+        print("\nChecking pair distances matches from haversine bruteforce "
+              "against unit vectors...")
+
+        answer_dist_matches = all(
+            abs(bf["distance"] - geo["distance"]) < 1e-6
+            for bf, geo in zip(bf_answers, geo_answers))
+
+        print(f"All answers match? {answer_dist_matches}")
+
+        # graph results
+        plt.figure(fig)
+        plt.plot(n, timings_bf, label="Haversine Bruteforce")
+        plt.plot(n, timings_geo, label="Unit Vectors")
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: Haversine Bruteforce vs Unit Vectors')
+        plt.legend()  # show legend
+
+    def filter_vs_range_index(self, fig=13):
+        """
+        Benchmarks closest pair queries inside random boxes, filtering the
+        points and running recursion optimized on them vs a RangeIndex
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        sample_size = 14
+        queries = 100
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 1) for i in range(sample_size)]
+        timings_filter = []
+        timings_index = []
+        answer_dist_matches = True
+
+        # headings variables
+        heading1 = "n input"
+        heading2 = "timings (seconds)"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+
+        print(f"\nRANGE QUERIES 2D ({queries} boxes per n)\n\n"
+              f"{heading1:<{pad_size}} {'filter':<24} {'index':<24} "
+              f"{'index build'}\n"
+              f"{sep * pad_size:<{pad_size}} {sep * 24} {sep * 24} "
+              f"{sep * 11}")
+
+        for i in range(sample_size):
+            points = Point.get_unique_points(n[i])
+            boxes = []
+            for _ in range(queries):
+                x = sorted(random.uniform(-n[i] * 10, n[i] * 10)
+                           for _ in range(2))
+                y = sorted(random.uniform(-n[i] * 10, n[i] * 10)
+                           for _ in range(2))
+                boxes.append(((x[0], y[0]), (x[1], y[1])))
+
+            # filter then recursion optimized
+            start_time = time.perf_counter()
+            filter_answers = []
+            for low, high in boxes:
+                inside = [p for p in points if low[0] <= p.x <= high[0] and
+                          low[1] <= p.y <= high[1]]
+                filter_answers.append(closest_pair_2d_opt(inside)
+                                      if len(inside) > 1 else None)
+            duration_filter = time.perf_counter() - start_time
+
+            # range index, build timed separately
+            start_time = time.perf_counter()
+            index = RangeIndex(points)
+            duration_build = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            index_answers = [index.closest_pair_in_range(low, high)
+                             for low, high in boxes]
+            duration_index = time.perf_counter() - start_time
+
+            timings_filter.append(duration_filter)
+            timings_index.append(duration_index)
+
+            for a, b in zip(filter_answers, index_answers):
+                if (a is None) != (b is None) or \
+                        a is not None and a["distance"] != b["distance"]:
+                    answer_dist_matches = False
+
+            print(f"{n[i]:<{pad_size}} {duration_filter:<24} "
+                  f"{duration_index:<24} {duration_build}")
+
+        print(f"\nAll answers match? {answer_dist_matches}")
+
+        # graph results
+        plt.figure(fig)
+        plt.plot(n, timings_filter, label="Filter + Recursion Optimized")
+        plt.plot(n, timings_index, label="Range Index")
+        plt.xlabel('input size (n)')
+        plt.ylabel(f'timings of {queries} queries (seconds)')
+        plt.title('Growth Rates: 2D Range Queries')
+        plt.legend()  # show legend
+
+    def hook_overhead(self, fig=14):
+        """
+        Benchmarks 3D recursion and bruteforce with and without a progress
+        hook. Runs alternate and the best of repeats is kept, so the
+        overhead is not lost in timer noise.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        repeats = 5
+        tasks = [
+            ("RECURSION 3D", closest_pair_kd,
+             [2**(i + 1) for i in range(16)]),
+            ("BRUTEFORCE 3D", bf_closest_pair_kd,
+             [2**(i + 1) for i in range(11)])
+        ]
+
+        # headings variables
+        heading1 = "n input"
+        pad_size = len(heading1) if len(
+            str(2**16)) < len(heading1) else len(str(2**16))
+        sep = "-"
+
+        plt.figure(fig)
+        for title, func, n in tasks:
+            timings_plain = []
+            timings_hook = []
+
+            print(f"\n{title} ({repeats} repeats)\n\n"
+                  f"{heading1:<{pad_size}} {'no hook':<24} {'hook':<24} "
+                  f"{'overhead'}\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * 24} {sep * 24} "
+                  f"{sep * 8}")
+
+            for size in n:
+                points = gen_unique_kd_points(size, 3)
+                plain, hooked = [], []
+
+                for _ in range(repeats):
+                    start_time = time.perf_counter()
+                    func(points)
+                    plain.append(time.perf_counter() - start_time)
+
+                    hook = ProgressHook(lambda fraction: None)
+                    start_time = time.perf_counter()
+                    func(points, hook=hook)
+                    hooked.append(time.perf_counter() - start_time)
+
+                timings_plain.append(min(plain))
+                timings_hook.append(min(hooked))
+                overhead = (min(hooked) / min(plain) - 1) * 100
+
+                print(f"{size:<{pad_size}} {min(plain):<24} "
+                      f"{min(hooked):<24} {overhead:.1f}%")
+
+            plt.plot(n, timings_plain, label=f"{title.title()}")
+            plt.plot(n, timings_hook, label=f"{title.title()} + Hook")
+
+        # graph results
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: Progress Hook Overhead')
+        plt.legend()  # show legend
+
+    def array_precision(self, fig=15):
+        """
+        Benchmarks closest_pair_array() of 2D and 3D buffers in float64 vs
+        float32 precision, with the peak memory traced during each run
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        dimensions = [2, 3]
+        sample_size = 20
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 2) for i in range(sample_size)]
+        answer_dist_matches = True
+
+        # headings variables
+        heading1 = "n input"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+
+        plt.figure(fig)
+        for dim in dimensions:
+            timings = {"float64": [], "float32": []}
+
+            print(f"\nBUFFERS {dim}D (seconds, peak MiB)\n\n"
+                  f"{heading1:<{pad_size}} {'float64':<24} {'MiB':<8} "
+                  f"{'float32':<24} {'MiB'}\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * 24} {sep * 8} "
+                  f"{sep * 24} {sep * 8}")
+
+            for size in n:
+                buffer = array("d", (random.random()
+                                     for _ in range(size * dim)))
+                line = f"{size:<{pad_size}}"
+                answers = []
+
+                for precision, timing in timings.items():
+                    tracemalloc.start()
+                    start_time = time.perf_counter()
+                    answer = closest_pair_array(buffer, dim, precision)
+                    duration = time.perf_counter() - start_time
+                    peak = tracemalloc.get_traced_memory()[1] / 2**20
+                    tracemalloc.stop()
+
+                    timing.append(duration)
+                    answers.append(answer["distance"])
+                    line += f" {duration:<24} {peak:<8.1f}"
+
+                answer_dist_matches &= answers[0] == answers[1]
+                print(line)
+
+            for precision, timing in timings.items():
+                plt.plot(n, timing, label=f"{dim}D {precision}")
+
+        print(f"\nAll answers match? {answer_dist_matches}")
+
+        # graph results
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: Buffers float64 vs float32')
+        plt.legend()  # show legend
+
+    def head_to_head(self, fig=16):
+        """
+        Benchmarks recursion optimized in 2D and recursion in 3D against
+        the nearest neighbor of every point from scipy cKDTree and
+        scikit-learn NearestNeighbors, on the same points. Timings of the
+        libraries include converting the points and building the tree.
+        Ratios above 1 are how many times faster the library is. Skips a
+        library that can't be imported.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        libraries = {}
+        if cKDTree is not None:
+            libraries["cKDTree"] = _ckdtree_closest
+        if NearestNeighbors is not None:
+            libraries["sklearn"] = _sklearn_closest
+
+        if not libraries:
+            print("\nscipy and scikit-learn are not installed, skipping.")
+            return
+
+        sample_size = 18
+        tasks = [
+            ("RECURSION OPTIMIZED 2D", 2,
+             lambda points: closest_pair_2d_opt(
+                 [Point(*point) for point in points])),
+            ("RECURSION 3D", 3, closest_pair_kd)
+        ]
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 1) for i in range(sample_size)]
+        answer_dist_matches = True
+
+        # headings variables
+        heading1 = "n input"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+
+        plt.figure(fig)
+        for title, dim, func in tasks:
+            timings = {"closest_pair": []}
+            timings.update((name, []) for name in libraries)
+
+            print(f"\n{title} VS " + " VS ".join(libraries) + "\n\n"
+                  f"{heading1:<{pad_size}} {'closest_pair':<24}" +
+                  "".join(f" {name:<24} {'ratio':<8}" for name in libraries)
+                  + f"\n{sep * pad_size:<{pad_size}} {sep * 24}" +
+                  f" {sep * 24} {sep * 8}" * len(libraries))
+
+            for size in n:
+                points = gen_unique_kd_points(size, dim)
+
+                start_time = time.perf_counter()
+                answer = func(points)
+                duration = time.perf_counter() - start_time
+                timings["closest_pair"].append(duration)
+                line = f"{size:<{pad_size}} {duration:<24}"
+
+                for name, library in libraries.items():
+                    start_time = time.perf_counter()
+                    dist = library(points)
+                    library_duration = time.perf_counter() - start_time
+                    timings[name].append(library_duration)
+
+                    answer_dist_matches &= \
+                        abs(dist - answer["distance"]) < 1e-9
+                    line += f" {library_duration:<24} " \
+                        f"{duration / library_duration:<8.2f}"
+
+                print(line)
+
+            for name, timing in timings.items():
+                plt.plot(n, timing, label=f"{name} {dim}D")
+
+        print(f"\nAll answers match? {answer_dist_matches}")
+
+        # graph results
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: closest_pair vs SciPy and scikit-learn')
+        plt.legend()  # show legend
+
+    def array_morton(self, fig=17):
+        """
+        Benchmarks closest_pair_array() of 2D to 4D buffers without and with
+        curve=True. To show the memory effect alone, the sweep also runs
+        with the same curve seed on rows in input order and in Morton order.
+        The seed column is the sort axis seed over the curve seed.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        if np is None:
+            print("\nnumpy is not installed, skipping.")
+            return
+
+        dimensions = [2, 3, 4]
+        sample_size = 20
+
+        # x and y cooardinates for graphs
+        n = [2**(i + 2) for i in range(sample_size)]
+        answer_dist_matches = True
+
+        # headings variables
+        heading1 = "n input"
+        pad_size = len(heading1) if len(
+            str(n[-1])) < len(heading1) else len(str(n[-1]))
+        sep = "-"
+        columns = ["plain", "curve", "sweep input order",
+                   "sweep morton order"]
+
+        plt.figure(fig)
+        for dim in dimensions:
+            timings = {"plain": [], "curve": []}
+
+            print(f"\nBUFFERS MORTON ORDER {dim}D (seconds)\n\n"
+                  f"{heading1:<{pad_size}} " +
+                  " ".join(f"{c:<24}" for c in columns) + " seed\n"
+                  f"{sep * pad_size:<{pad_size}} " +
+                  " ".join(sep * 24 for _ in columns) + f" {sep * 8}")
+
+            for size in n:
+                coords = np.random.random((size, dim))
+
+                start_time = time.perf_counter()
+                plain = closest_pair_array(coords)
+                duration_plain = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                curve = closest_pair_array(coords, curve=True)
+                duration_curve = time.perf_counter() - start_time
+
+                timings["plain"].append(duration_plain)
+                timings["curve"].append(duration_curve)
+                answer_dist_matches &= \
+                    plain["distance"] == curve["distance"]
+
+                # same seed, rows in input order vs morton order
+                order = morton_order(coords)
+                rows = coords[order]
+                seed = curve_seed(rows)
+                input_seed = (seed[0], int(order[seed[1]]),
+                              int(order[seed[2]]))
+
+                start_time = time.perf_counter()
+                _sweep_vec(coords, seed=input_seed)
+                duration_input = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                _sweep_vec(rows, seed=seed)
+                duration_rows = time.perf_counter() - start_time
+
+                # distance of the sort axis seed over the curve seed
+                axis = max(range(dim), key=lambda d: np.ptp(coords[:, d]))
+                xsorted = coords[np.argsort(coords[:, axis])]
+                diff = xsorted[1:] - xsorted[:-1]
+                ratio = math.sqrt(np.einsum("ij,ij->i", diff, diff).min() /
+                                  seed[0]) if seed[0] else 1.0
+
+                print(f"{size:<{pad_size}} {duration_plain:<24} "
+                      f"{duration_curve:<24} {duration_input:<24} "
+                      f"{duration_rows:<24} {ratio:.1f}")
+
+            for name, timing in timings.items():
+                plt.plot(n, timing, label=f"{dim}D {name}")
+
+        print(f"\nAll answers match? {answer_dist_matches}")
+
+        # graph results
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: Buffers Morton Order and Curve Seeding')
+        plt.legend()  # show legend
+
+    def run_loading(self, fig=18):
+        """
+        Benchmarks loading points into run.py one at a time with
+        Run.add_point(), which scans the loaded points for duplicates, vs
+        Run.add_points() with a set, and checks their growth against n.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        sample_size = 6
+        tasks = [
+            ("ADD_POINT", _add_each, [2**(i + 8) for i in range(sample_size)]),
+            ("ADD_POINTS", lambda points: Run().add_points(points),
+             [2**(i + 12) for i in range(sample_size)])
+        ]
+
+        # headings variables
+        heading1 = "n input"
+        pad_size = len(heading1) if len(
+            str(2**17)) < len(heading1) else len(str(2**17))
+        sep = "-"
+
+        plt.figure(fig)
+        for title, func, n in tasks:
+            timings = []
+
+            print(f"\nRUN.PY LOADING {title} (seconds)\n\n"
+                  f"{heading1:<{pad_size}} {'timings':<24}\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * 24}")
+
+            for size in n:
+                points = gen_unique_kd_points(size, 2)
+
+                start_time = time.perf_counter()
+                func(points)
+                duration = time.perf_counter() - start_time
+
+                timings.append(duration)
+                print(f"{size:<{pad_size}} {duration:<24}")
+
+            try:
+                excess = check_growth(title, n, timings, "n")
+                print(f"\nGrows as n * n^{excess:.2f}, ok")
+            except GrowthError as err:
+                print(f"\n{err}")
+
+            plt.plot(n, timings, label=f"{title.title()}")
+
+        # graph results
+        plt.xlabel('input size (n)')
+        plt.ylabel('timings (seconds)')
+        plt.title('Growth Rates: run.py Point Loading')
+        plt.legend()  # show legend
+
+    def thread_scaling(self, fig=19):
+        """
+        Benchmarks bf_closest_pair_blocked() and closest_pair_groups() with
+        workers = 1 to the number of cpus. Speedup is the best of repeats
+        with 1 worker over the best with n workers, near n when the numpy
+        kernels release the GIL and scale linearly.
+
+        Parameters
+        ----------
+        fig (int): Figure number for plot
+        """
+        if np is None:
+            print("\nnumpy is not installed, skipping.")
+            return
+
+        repeats = 3
+        workers = list(range(1, (os.cpu_count() or 1) + 1))
+
+        points = gen_unique_kd_points(8192, 64)
+        coords = np.random.random((2**20, 2))
+        groups = np.random.randint(0, 4096, len(coords))
+        tasks = [
+            ("BLOCKED 8192 POINTS 64D",
+             lambda n: bf_closest_pair_blocked(points, workers=n)),
+            ("GROUPS 2^20 ROWS 2D IN 4096 GROUPS",
+             lambda n: closest_pair_groups(coords, groups, workers=n))
+        ]
+
+        # headings variables
+        heading1 = "workers"
+        pad_size = len(heading1)
+        sep = "-"
+
+        plt.figure(fig)
+        for title, func in tasks:
+            speedups = []
+
+            print(f"\n{title} ({repeats} repeats)\n\n"
+                  f"{heading1:<{pad_size}} {'timings':<24} speedup\n"
+                  f"{sep * pad_size:<{pad_size}} {sep * 24} {sep * 7}")
+
+            for n in workers:
+                durations = []
+                for _ in range(repeats):
+                    start_time = time.perf_counter()
+                    func(n)
+                    durations.append(time.perf_counter() - start_time)
+
+                if n == 1:
+                    single = min(durations)
+                speedups.append(single / min(durations))
+
+                print(f"{n:<{pad_size}} {min(durations):<24} "
+                      f"{speedups[-1]:.2f}")
+
+            plt.plot(workers, speedups, label=f"{title.title()}")
+
+        # graph results
+        plt.plot(workers, workers, "--", label="Linear")
+        plt.xlabel('workers')
+        plt.ylabel('speedup over 1 worker')
+        plt.title('Thread Scaling: Blocked and Groups')
+        plt.legend()  # show legend
+
+
+def _add_each(points):
+    """Load points into a Run one at a time, as it did before add_points"""
+    run = Run()
+    for point in points:
+        run.add_point(point)
+
+
+def _ckdtree_closest(points):
+    """Return the closest distance from a cKDTree 2 nearest neighbors"""
+    distances, _ = cKDTree(points).query(points, k=2)
+    return float(distances[:, 1].min())
+
+
+def _sklearn_closest(points):
+    """Return the closest distance from NearestNeighbors kneighbors"""
+    distances, _ = NearestNeighbors(n_neighbors=2).fit(points)\
+        .kneighbors(points)
+    return float(distances[:, 1].min())
+
 
 if __name__ == "__main__":
     Benchmark().run()
@@ -1,14 +1,57 @@
 """
 Closest Pair of Points
+    Line
+    ----
+    - closest_pair_1d: Sort and scan adjacent gaps on a line
+
     XY Plane
     --------
-    - closest_pair: Divide and Conquer in xy plane
-    - bf_closest_pair: Brute force in xy plane
+    - closest_pair_2d: Divide and Conquer in xy plane
+    - bf_closest_pair_2d: Brute force in xy plane
+    - closest_pair_sweep: Sweep line over x-sorted points in one pass
+    - sweep_closest_pairs: Generate the running closest pair of x-sorted points
 
     Kth Dimensions
     --------------
     - closest_pair_kd: Divide and Conquer in kth dimensions
     - bf_closest_pair_kd: Brute force in kth dimensions
+    - bf_closest_pair_blocked: Tiled matrix brute force for high dimensions
+    - nearest_neighbor_kd: Nearest point to a query point
+
+    Buffers
+    -------
+    - closest_pair_array: Closest pair of rows of an (n, dim) buffer by index
+    - closest_pair_groups: Closest pair of every group of rows in one call
+    - morton_order: Row indices of a buffer along the Z-order curve
+
+    Globe
+    -----
+    - closest_pair_geo: Closest pair of (lat, lon) points by great-circle
+    - bf_closest_pair_geo: Brute force with the haversine formula
+    - haversine: Great-circle distance between two (lat, lon) points
+
+    Prepared Points
+    ---------------
+    - PreparedPoints: Points with per-axis orderings kept between queries
+
+    Range Queries
+    -------------
+    - RangeIndex: k-d tree answering closest pair queries inside a box
+
+    Automatic
+    ---------
+    - closest_pair: Pick the fastest engine by n, dimension and data shape
+    - closest_pair_anytime: Best pair found within a deadline or until
+      cancelled, flagged when proven closest
+
+    Approximate
+    -----------
+    - approx_closest_pair_kd: Random projection search for high dimensions
+
+    Fixed Radius
+    ------------
+    - fixed_radius_pairs: Generate every pair of points within distance r
+    - k_closest_pairs: The k closest pairs of points
 
     Point class
     -----------
@@ -16,11 +59,27 @@ Closest Pair of Points
     Point.distance: Calculate distance between two Point objects
     Point.get_unique_points: Generate list of Point in XY plane
 
+    Streaming
+    ---------
+    - SlidingWindowClosestPair: Closest pair of the last W points or T seconds
+
+    Result Cache
+    ------------
+    - cached: Memoize an entry point on a content hash of the points
+
+    Progress
+    --------
+    - ProgressHook: Throttled progress callback and cancellation of engines
+    - Cancelled: Raised by an engine stopped by its hook
+
     Utilities
     ---------
+    PairResult: Immutable dict-compatible closest pair result
     distance: Calculate distance between two tuple of the same kth dimensions
     gen_unique_kd_points: Generate tuple points of size n in kth dimensions
 """
+from .closest_pair_1d import closest_pair_1d
+
 from .closest_pair_2d import bf_pairs_2d
 from .closest_pair_2d import bf_closest_pair_2d
 from .closest_pair_2d import closest_pair_2d
@@ -28,9 +87,43 @@ from .closest_pair_2d import closest_pair_2d_opt
 from .closest_pair_2d import closest_pair_2d_opt_plt
 from .closest_pair_2d import Point
 
+from .sweep import closest_pair_sweep
+from .sweep import sweep_closest_pairs
+
 from .closest_pair_kd import bf_pairlist_kd
 from .closest_pair_kd import bf_closest_pair_kd
 from .closest_pair_kd import closest_pair_kd
+from .closest_pair_kd import nearest_neighbor_kd
+
+from .blocked import bf_closest_pair_blocked
+
+from .approx import approx_closest_pair_kd
+
+from .closest_pair_array import closest_pair_array
+from .groups import closest_pair_groups
+from .morton import morton_order
+
+from .geo import closest_pair_geo
+from .geo import bf_closest_pair_geo
+from .geo import haversine
+
+from .prepared import PreparedPoints
+
+from .range_index import RangeIndex
+
+from .anytime import closest_pair_anytime
+from .dispatch import closest_pair
+
+from .radius import fixed_radius_pairs
+from .radius import k_closest_pairs
+
+from .streaming import SlidingWindowClosestPair
+
+from .cache import cached
+
+from .hooks import ProgressHook
+from .hooks import Cancelled
 
+from .utils import PairResult
 from .utils import distance
 from .utils import gen_unique_kd_points
@@ -0,0 +1,197 @@
+"""
+Empirical growth rates of the engines
+    - fit_exponent: Slope of timings against n on log-log scales
+    - fit_models: Fit timings to the n, nlogn and n^2 models
+    - check_growth: Raise GrowthError when timings outgrow a model
+    - measure: Fastest timings of an engine over input sizes
+
+Run the growth checks of every engine, exiting 1 when one fails:
+    python3 -m closest_pair.analysis
+"""
+import argparse
+import math
+import sys
+import time
+
+from .closest_pair_1d import closest_pair_1d
+from .closest_pair_2d import Point, closest_pair_2d, closest_pair_2d_opt
+from .closest_pair_kd import bf_closest_pair_kd, closest_pair_kd
+from .utils import gen_unique_kd_points
+
+MODELS = {
+    "n": lambda n: n,
+    "nlogn": lambda n: n * math.log2(n),
+    "n^2": lambda n: n * n
+}
+
+# most exponent of n allowed over a model. Caches add up to about 0.35 over
+# the default sizes, an n^2 engine checked against nlogn is about 0.9 over
+TOLERANCE = 0.5
+
+
+class GrowthError(AssertionError):
+    """Raised when timings grow faster than their model"""
+
+
+def fit_exponent(n, timings):
+    """
+    Fit timings = c * n^k by least squares on log-log scales.
+
+    Parameters
+    ----------
+    n (list): Input sizes
+    timings (list): Seconds of each input size
+
+    Return
+    ------
+    float: Exponent k
+    """
+    if len(n) < 2:
+        raise IndexError()
+
+    x = [math.log(size) for size in n]
+    y = [math.log(timing) for timing in timings]
+    mean_x, mean_y = sum(x) / len(x), sum(y) / len(y)
+
+    return sum((a - mean_x) * (b - mean_y) for a, b in zip(x, y)) / \
+        sum((a - mean_x)**2 for a in x)
+
+
+def fit_models(n, timings):
+    """
+    Fit timings = c * f(n) for each model f of MODELS on log-log scales.
+
+    Parameters
+    ----------
+    n (list): Input sizes
+    timings (list): Seconds of each input size
+
+    Return
+    ------
+    [(str, float, float)] of model name, constant c and root mean square
+    of the log residuals, best fit first
+    """
+    fits = []
+    for name, model in MODELS.items():
+        logs = [math.log(timing / model(size))
+                for size, timing in zip(n, timings)]
+        constant = sum(logs) / len(logs)
+        error = math.sqrt(sum((log - constant)**2 for log in logs) /
+                          len(logs))
+        fits.append((name, math.exp(constant), error))
+
+    return sorted(fits, key=lambda fit: fit[2])
+
+
+def check_growth(name, n, timings, model, tolerance=TOLERANCE):
+    """
+    Check timings grow no faster than a model, by fitting the exponent of
+    timings / model(n). The exponent is about 0 when the model holds, and
+    about 1 for an n^2 engine checked against nlogn.
+
+    Parameters
+    ----------
+    name (str): Name of the engine for the error message
+    n (list): Input sizes
+    timings (list): Seconds of each input size
+    model (str): Name of a model of MODELS
+    tolerance (float): Most exponent allowed over the model
+
+    Return
+    ------
+    float: Exponent over the model, else GrowthError is raised
+    """
+    excess = _excess(n, timings, model)
+
+    if excess > tolerance:
+        raise GrowthError(f"{name} grows as {model} * n^{excess:.2f}, above "
+                          f"the tolerance of n^{tolerance}.")
+    return excess
+
+
+def _excess(n, timings, model):
+    """Return the fitted exponent of timings / model(n)"""
+    return fit_exponent(n, [timing / MODELS[model](size)
+                            for size, timing in zip(n, timings)])
+
+
+def measure(func, gen_points, n, repeat=3):
+    """
+    Return the fastest run time of func(points) in seconds for each input
+    size, on points from gen_points(size).
+    """
+    timings = []
+    for size in n:
+        points = gen_points(size)
+        best = math.inf
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            func(points)
+            best = min(best, time.perf_counter() - start_time)
+        timings.append(best)
+
+    return timings
+
+
+def vertical_points(size):
+    """Generate unique Points all on the line x = 0"""
+    points = Point.get_unique_points(size)
+    for point in points:
+        point.x = 0
+    return points
+
+
+# (name, engine, points of a size, model) checked by main()
+CHECKS = [
+    ("closest_pair_1d", closest_pair_1d,
+     lambda n: gen_unique_kd_points(n, 1), "nlogn"),
+    ("closest_pair_2d", closest_pair_2d, Point.get_unique_points, "nlogn"),
+    ("closest_pair_2d vertical", closest_pair_2d, vertical_points, "nlogn"),
+    ("closest_pair_2d_opt", closest_pair_2d_opt, Point.get_unique_points,
+     "nlogn"),
+    ("closest_pair_2d_opt vertical", closest_pair_2d_opt, vertical_points,
+     "nlogn"),
+    ("closest_pair_kd 2D", closest_pair_kd,
+     lambda n: gen_unique_kd_points(n, 2), "nlogn"),
+    ("closest_pair_kd 3D", closest_pair_kd,
+     lambda n: gen_unique_kd_points(n, 3), "nlogn"),
+    ("bf_closest_pair_kd 2D", bf_closest_pair_kd,
+     lambda n: gen_unique_kd_points(n, 2), "n^2")
+]
+
+
+def main(argv=None):
+    """Print the fitted growth of every check, return 1 if any failed"""
+    parser = argparse.ArgumentParser(
+        description="Fit engine timings to n, nlogn and n^2")
+    parser.add_argument("--max-n", type=int, default=2**15,
+                        help="largest input size, n^2 engines use 1/16")
+    parser.add_argument("--sizes", type=int, default=6,
+                        help="input sizes per engine, halving from max n")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    print(f"{'engine':<30} {'exponent':>8} {'best fit':>8} {'model':>6} "
+          f"{'excess':>6}  check")
+    failed = 0
+
+    for name, func, gen_points, model in CHECKS:
+        max_n = args.max_n if model != "n^2" else args.max_n // 16
+        n = [max_n >> i for i in reversed(range(args.sizes))]
+        timings = measure(func, gen_points, n, args.repeat)
+
+        excess = _excess(n, timings, model)
+        if excess > args.tolerance:
+            failed += 1
+
+        print(f"{name:<30} {fit_exponent(n, timings):>8.2f} "
+              f"{fit_models(n, timings)[0][0]:>8} {model:>6} "
+              f"{excess:>6.2f}  "
+              f"{'FAIL' if excess > args.tolerance else 'ok'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Anytime Closest Pair of Points
+    - closest_pair_anytime: Best pair found within a deadline, with a flag
+      telling if it is proven closest
+"""
+import itertools
+import math
+import random
+import time
+
+from .closest_pair_kd import closest_pair_kd
+from .utils import PairResult, distance
+
+# cells probed and distances measured between deadline and cancellation
+# checks
+CHECK_EVERY = 1024
+
+# smallest sample for the first estimate
+SAMPLE_MIN = 64
+
+
+def closest_pair_anytime(points, budget=None, deadline=None, cancel=None,
+                         seed=None):
+    """
+    Find closest pair of points, returning the best pair found so far when
+    the time budget runs out or the search is cancelled.
+
+    The first estimate is the closest pair of a random sample of about
+    sqrt(n) points, a real pair whose distance delta bounds the answer. The
+    exact refinement then hashes every point into a grid of side delta and
+    compares it to points of neighboring cells, which finds any closer pair.
+    A sample of sqrt(n) points keeps O(1) points per cell at bounded
+    density. When there are fewer occupied cells than the 3^k neighbors of
+    a cell, the occupied cells are probed instead. The deadline and cancel
+    event are checked every CHECK_EVERY cells probed or distances measured,
+    so clustered points sharing a cell still stop on time.
+
+    Time Complexity: O(min(3^k, n) n) at bounded density
+
+    Parameters
+    ----------
+    points (list): List of Point or tuple of kth dimensions.
+    budget (float): Seconds from now to stop at
+    deadline (float): time.perf_counter() value to stop at
+    cancel (threading.Event): Stop when set, from any thread
+    seed (int): Seed of the sample
+
+    Return
+    ------
+    {"distance": float, "pair": Point, "optimal": bool} where optimal is
+    True when the pair is proven closest
+    """
+    if not isinstance(points, (list, tuple)):
+        points = list(points)
+
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+
+    if budget is not None:
+        end = time.perf_counter() + budget
+        deadline = end if deadline is None else min(deadline, end)
+
+    # closest pair of a sample is an upper bound
+    size = min(n, max(SAMPLE_MIN, math.isqrt(n)))
+    sample = random.Random(seed).sample(points, size) if size < n \
+        else points
+    result = closest_pair_kd(sample)
+    min_dist, (point_a, point_b) = result["distance"], result["pair"]
+
+    if size == n or min_dist == 0:
+        return PairResult(min_dist, (point_a, point_b), optimal=True)
+
+    if _stopped(deadline, cancel):
+        return PairResult(min_dist, (point_a, point_b), optimal=False)
+
+    dim = len(points[0])
+    delta = min_dist
+    neighbors = 3**dim
+    grid = {}
+    work, next_check = 0, CHECK_EVERY
+
+    for point in points:
+        if work >= next_check:
+            if _stopped(deadline, cancel):
+                return PairResult(min_dist, (point_a, point_b),
+                                  optimal=False)
+            next_check = work + CHECK_EVERY
+
+        cell = tuple(int(point[d] // delta) for d in range(dim))
+
+        # any pair closer than delta is in neighboring cells
+        if neighbors <= len(grid):
+            near = (grid.get(tuple(c + o for c, o in zip(cell, offset)), ())
+                    for offset in itertools.product((-1, 0, 1), repeat=dim))
+        else:
+            # fewer occupied cells than neighbors in high dimensions
+            near = (others for key, others in grid.items()
+                    if all(-1 <= c - o <= 1 for c, o in zip(cell, key)))
+
+        for others in near:
+            for other in others:
+                work += 1
+                if work >= next_check:
+                    if _stopped(deadline, cancel):
+                        return PairResult(min_dist, (point_a, point_b),
+                                          optimal=False)
+                    next_check = work + CHECK_EVERY
+
+                dist = distance(other, point)
+                if dist < min_dist:
+                    min_dist, point_a, point_b = dist, other, point
+
+        work += min(neighbors, len(grid)) + 1
+        grid.setdefault(cell, []).append(point)
+
+    return PairResult(min_dist, (point_a, point_b), optimal=True)
+
+
+def _stopped(deadline, cancel):
+    """Return True if the deadline passed or cancel is set"""
+    return (deadline is not None and time.perf_counter() >= deadline) or \
+        (cancel is not None and cancel.is_set())
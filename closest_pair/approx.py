@@ -0,0 +1,78 @@
+"""
+Approximate Closest Pair of Points in kth dimensions
+    - approx_closest_pair_kd: Random projection search for high dimensions
+"""
+import random
+
+from .closest_pair_kd import bf_closest_pair_kd
+from .utils import PairResult, distance
+
+
+def approx_closest_pair_kd(points, projections=8, window=4, seed=None,
+                           check=False):
+    """
+    Approximate closest pair of points at kth dimensions using random
+    projections, a locality-sensitive hash for euclidean distance.
+
+    Each projection maps every point onto a random gaussian direction and
+    sorts the points by that scalar. Points close in space are likely close
+    in projected order, so each point is only compared to the next `window`
+    points of every projection. The result is always a real pair, so its
+    distance is an upper bound of the true closest distance.
+
+    More projections or a wider window raise recall at a linear cost.
+
+    Time Complexity: O(p * n * (k + logn + w * k))
+
+    Parameters
+    ----------
+    points (list): List of tuple of kth dimensions.
+    projections (int): Number of random projections (p) to search
+    window (int): Number of following points (w) compared per projection
+    seed (int): Seed of the random directions for repeatable results
+    check (bool): Also run the exact brute force and report the error
+
+    Return
+    ------
+    {"distance": float, "pair": Point}
+
+    When check is True, the result also has "exact_distance" (float) and
+    "ratio" (float), the approximate over the exact distance (>= 1).
+    """
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+    if projections < 1 or window < 1:
+        raise ValueError("Projections and window must be positive.")
+
+    dim = len(points[0])
+    rand = random.Random(seed)
+
+    min_dist = distance(points[0], points[1])
+    min_points = (points[0], points[1])
+
+    for _ in range(projections):
+        # project points onto a random gaussian direction
+        direction = [rand.gauss(0, 1) for d in range(dim)]
+        order = sorted(range(n), key=lambda i: sum(
+            a * b for a, b in zip(points[i], direction)))
+
+        # compare each point to its next window neighbors by projection
+        for i in range(n - 1):
+            point = points[order[i]]
+            for j in range(i + 1, min(i + 1 + window, n)):
+                dist = distance(point, points[order[j]])
+
+                if dist < min_dist:
+                    min_dist = dist
+                    min_points = (point, points[order[j]])
+
+    if not check:
+        return PairResult(min_dist, min_points)
+
+    exact = bf_closest_pair_kd(points)["distance"]
+    ratio = min_dist / exact if exact else\
+        (1.0 if min_dist == 0 else float("inf"))
+
+    return PairResult(min_dist, min_points, exact_distance=exact, ratio=ratio)
@@ -0,0 +1,159 @@
+"""
+Blocked Brute Force Closest Pair of Points in kth dimensions
+    - bf_closest_pair_blocked: Tiled matrix brute force, optionally threaded
+
+Requires numpy.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import PairResult, distance
+
+try:
+    import numpy as np
+except ImportError:  # blocked brute force needs numpy
+    np = None
+
+# rows per tile, a tile of squared distances takes TILE * TILE * 8 bytes
+TILE = 1024
+
+# most candidate pairs kept for re-measuring, bounds memory on many ties
+CANDIDATES = 1024
+
+
+def bf_closest_pair_blocked(points, tile=TILE, workers=1, hook=None):
+    """
+    Bruteforce approach to get minimal distance of two points at kth
+    dimensions, computing squared distances a tile at a time with the matrix
+    identity ||a - b||^2 = ||a||^2 + ||b||^2 - 2a.b, so each tile is a single
+    matrix product instead of n^2 calls to distance().
+
+    The identity loses precision to cancellation when points are far from
+    the origin compared to their distance, so points are centered first and
+    every pair within the rounding error bound of the best tile value is kept
+    as a candidate. Candidates are re-measured with distance(), so the answer
+    is the exact one of bf_closest_pair_kd(). Past CANDIDATES pairs within
+    the bound, such as many duplicates, only the CANDIDATES closest are
+    kept, and the answer is within the bound of the closest distance.
+
+    With workers > 1, the tiles of the i < j triangle are handed to a thread
+    pool. The numpy kernels of a tile release the GIL, so tiles run in
+    parallel and only the per-tile minima are reduced at the end. Limit the
+    BLAS library to one thread (eg. OPENBLAS_NUM_THREADS=1) to avoid
+    oversubscribing the cores.
+
+    Memory: O(workers * tile^2 + n*k + CANDIDATES)
+    Time Complexity: O(n^2 * k / workers)
+
+    Parameters
+    ----------
+    points (list): List of Point or tuple of kth dimensions.
+    tile (int): Number of rows and columns per tile
+    workers (int): Number of threads, None for one per cpu
+    hook (ProgressHook): Progress by tiles done, and cancellation. Tiles
+        already running finish before Cancelled is raised.
+
+    Return
+    ------
+    {"distance": float, "pair": Point}
+    """
+    if np is None:
+        raise ImportError("bf_closest_pair_blocked requires numpy")
+
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+
+    coords = np.array(points, dtype=float).reshape(n, -1)
+    coords -= coords.mean(axis=0)
+    norms = np.einsum("ij,ij->i", coords, coords)
+
+    # rounding error bound of one entry of the identity
+    dim = coords.shape[1]
+    tol = 2 * (dim + 4) * np.finfo(float).eps * norms.max()
+
+    # upper triangle of tiles, full tiles first to balance the pool
+    tiles = [(low_i, low_j) for low_i in range(0, n, tile)
+             for low_j in range(low_i, n, tile)]
+    tiles.sort(key=lambda t: t[0] == t[1])
+
+    def kernel(low):
+        return _tile_min(coords, norms, low[0], low[1], tile, tol)
+
+    if hook is not None:
+        hook.start(len(tiles))
+
+    # ThreadPoolExecutor(None) would start min(32, cpu + 4) threads
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or len(tiles) == 1:
+        candidates = _collect(map(kernel, tiles), tol, hook)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            candidates = _collect(executor.map(kernel, tiles), tol, hook)
+        finally:
+            # drop queued tiles when cancelled
+            executor.shutdown(cancel_futures=True)
+
+    # re-measure candidates within error bound of the best exactly
+    min_dist, min_i, min_j = None, None, None
+    for i, j, _ in sorted(candidates):
+        dist = distance(points[i], points[j])
+        if min_dist is None or dist < min_dist:
+            min_dist, min_i, min_j = dist, i, j
+            if dist == 0:
+                break
+
+    if hook is not None:
+        hook.finish()
+    return PairResult(min_dist, (points[min_i], points[min_j]))
+
+
+def _collect(results, tol, hook):
+    """
+    Return the candidate pairs (i, j, d2) of all tiles within tol of the
+    best, at most CANDIDATES of the closest, advancing hook once per tile.
+    """
+    best, candidates = np.inf, []
+    for tile_best, tile_candidates in results:
+        best = min(best, tile_best)
+        candidates = [c for c in candidates + tile_candidates
+                      if c[2] <= best + tol]
+        if len(candidates) > CANDIDATES:
+            candidates.sort(key=lambda c: (c[2], c[0], c[1]))
+            del candidates[CANDIDATES:]
+
+        if hook is not None:
+            hook.advance()
+    return candidates
+
+
+def _tile_min(coords, norms, low_i, low_j, tile, tol):
+    """
+    Return the smallest squared distance of a tile and the candidate pairs
+    (i, j, d2) within tol of it, with i < j.
+    """
+    block_i = coords[low_i:low_i + tile]
+    block_j = coords[low_j:low_j + tile]
+
+    d2 = block_i @ block_j.T
+    d2 *= -2
+    d2 += norms[low_i:low_i + tile, None]
+    d2 += norms[None, low_j:low_j + tile]
+    if low_i == low_j:
+        d2[np.tril_indices(len(block_i))] = np.inf
+
+    best = d2.min()
+    if best == np.inf:
+        return best, []
+
+    rows, cols = np.nonzero(d2 <= best + tol)
+    if len(rows) > CANDIDATES:
+        # many near ties, eg. duplicates, keep the closest
+        keep = np.argpartition(d2[rows, cols], CANDIDATES)[:CANDIDATES]
+        rows, cols = rows[keep], cols[keep]
+    return best, list(zip((rows + low_i).tolist(), (cols + low_j).tolist(),
+                          d2[rows, cols].tolist()))
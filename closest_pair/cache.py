@@ -0,0 +1,193 @@
+"""
+Result cache for repeated closest pair queries
+    - ResultCache: LRU cache bounded by entry count and bytes
+    - cached: Memoize a closest pair entry point on the points' content
+    - content_hash: Fast hash of the coordinate buffer of points
+"""
+import functools
+import hashlib
+import itertools
+import sys
+from array import array
+from collections import OrderedDict
+
+from .utils import PairResult
+
+
+class ResultCache(object):
+    """
+    Least recently used cache of closest pair results bounded by both the
+    number of entries and their approximate size in bytes.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return cached entry and mark it recently used, else None"""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        """Add entry, evicting least recently used entries to fit bounds"""
+        size = _sizeof(key) + _sizeof(value)
+
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+
+        self._entries[key] = (value, size)
+        self.nbytes += size
+
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self.nbytes > self.max_bytes):
+            self.nbytes -= self._entries.popitem(last=False)[1][1]
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset stats"""
+        self.__init__(self.max_entries, self.max_bytes)
+
+    def stats(self):
+        """Return hit, miss and eviction counts with current usage"""
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "entries": len(self._entries),
+                "bytes": self.nbytes}
+
+
+def cached(func, cache=None):
+    """
+    Memoize a closest pair entry point, func(points, *args, **kwargs), on a
+    content hash of points. Opt-in: wrap the entry points that see repeated
+    point sets.
+
+    The pair is cached as indices into points whenever the engine returns
+    the caller's own objects, so a hit returns objects from the points of
+    the current call rather than those of the first call. Results are
+    returned as immutable PairResult, so a cached value cannot be corrupted.
+
+    Parameters
+    ----------
+    func (function): Entry point returning {"distance": float, "pair": Point}
+    cache (ResultCache): Cache to use. Default is a new ResultCache().
+
+    Return
+    ------
+    function with attribute cache
+    """
+    if cache is None:
+        cache = ResultCache()
+
+    @functools.wraps(func)
+    def wrapper(points, *args, **kwargs):
+        key = (func.__module__, func.__qualname__, content_hash(points),
+               args, tuple(sorted(kwargs.items())))
+
+        entry = cache.get(key)
+        if entry is None:
+            result = func(points, *args, **kwargs)
+            entry = _entry(points, result)
+            cache.put(key, entry)
+
+        distance, indices, pair, extra = entry
+        if indices is not None:
+            pair = (points[indices[0]], points[indices[1]])
+
+        return PairResult(distance, pair, **extra)
+
+    wrapper.cache = cache
+    return wrapper
+
+
+def content_hash(points):
+    """
+    Return a 128-bit digest of the coordinates of points. Buffer-protocol
+    objects (array, NumPy) are hashed in place, else the coordinates of Point
+    or tuple are packed into a double array first.
+
+    Parameters
+    ----------
+    points (list): List of Point or tuple of kth dimensions, or a buffer.
+
+    Return
+    ------
+    bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    try:
+        view = memoryview(points)
+    except TypeError:
+        view = None
+
+    if view is not None:
+        digest.update(f"{view.format}{view.shape}".encode())
+        digest.update(view.cast("B") if view.c_contiguous else view.tobytes())
+    else:
+        dim = len(points[0]) if len(points) else 0
+        coords = list(itertools.chain.from_iterable(
+            [point[d] for d in range(dim)] for point in points))
+        code, data = _pack(coords)
+        digest.update(f"{type(points[0]).__name__ if dim else ''}"
+                      f"{len(points)},{dim},{code}".encode())
+        digest.update(data)
+
+    return digest.digest()
+
+
+def _pack(coords):
+    """
+    Return (type code, bytes) holding coords exactly: int64 when all are int,
+    float64 when all are float, else the repr of each. Large int are never
+    rounded to float64, so nanosecond timestamps one apart hash apart.
+    """
+    if all(type(c) is int for c in coords):
+        try:
+            return "q", array("q", coords)
+        except OverflowError:
+            pass
+    elif all(type(c) is float for c in coords):
+        return "d", array("d", coords)
+
+    return "r", "\0".join(map(repr, coords)).encode()
+
+
+def _entry(points, result):
+    """Return cache entry (distance, indices, pair, extra) of a result"""
+    pair = tuple(result["pair"])
+    extra = {k: v for k, v in result.items() if k not in ("distance", "pair")}
+
+    # store indices if the pair is made of the caller's own objects
+    indices = [None, None]
+    if not isinstance(pair[0], int):
+        for i, point in enumerate(points):
+            if point is pair[0] and indices[0] is None:
+                indices[0] = i
+            elif point is pair[1] and indices[1] is None:
+                indices[1] = i
+
+    if None in indices:
+        return (result["distance"], None, pair, extra)
+    return (result["distance"], tuple(indices), None, extra)
+
+
+def _sizeof(obj):
+    """Return approximate size of nested tuples in bytes"""
+    if isinstance(obj, tuple):
+        return sys.getsizeof(obj) + sum(_sizeof(o) for o in obj)
+    return sys.getsizeof(obj)
@@ -0,0 +1,63 @@
+"""
+Closest Pair of Points on a line
+    - closest_pair_1d: Sort and scan adjacent gaps
+"""
+from numbers import Real
+
+from .utils import PairResult, distance
+
+try:
+    import numpy as np
+except ImportError:  # the gap scan falls back to pure python
+    np = None
+
+# smallest n where the numpy gap scan beats the python one
+VECTOR_MIN = 64
+
+
+def closest_pair_1d(points):
+    """
+    Find closest pair of points on a line. After sorting, the closest pair
+    is always two neighbors, so one scan over the n - 1 adjacent gaps finds
+    it. With numpy installed, the sort and scan run vectorized.
+
+    Timsort: O(nlogn)
+    Scan: O(n)
+    Time Complexity: O(nlogn)
+
+    Parameters
+    ----------
+    points (list): List of 1-tuple, or numbers such as timestamps.
+
+    Return
+    ------
+    {"distance": float, "pair": Point}
+    """
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+
+    scalar = isinstance(points[0], Real)
+
+    if np is not None and n >= VECTOR_MIN:
+        # numpy infers the dtype, float64 would round ints above 2**53
+        values = np.array(points if scalar else [p[0] for p in points])
+        order = np.argsort(values, kind="stable")
+        gaps = np.diff(values[order])
+        if gaps.dtype.kind == "i":
+            # sorted gaps are positive, exact as uint64 even if they wrap
+            gaps = gaps.view(np.uint64)
+        i = int(np.argmin(gaps))
+    else:
+        values = points if scalar else [p[0] for p in points]
+        order = sorted(range(n), key=values.__getitem__)
+        i = min(range(n - 1),
+                key=lambda i: values[order[i + 1]] - values[order[i]])
+
+    point_a, point_b = points[order[i]], points[order[i + 1]]
+
+    # measure the pair the same way as the other engines
+    if scalar:
+        return PairResult(abs(point_b - point_a), (point_a, point_b))
+    return PairResult(distance(point_a, point_b), (point_a, point_b))
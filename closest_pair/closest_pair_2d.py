@@ -6,7 +6,16 @@ Closest Pair of Points XY Plane
 import math
 import random
 
-from .utils import min_of_pairs
+from .utils import PairResult
+
+try:
+    import numpy as np
+except ImportError:  # vectorized strip scan is optional
+    np = None
+
+# strips shorter than these are faster to scan with the python loop
+STRIP_VECTOR_MIN = 32
+STRIP_OPT_VECTOR_MIN = 96
 
 
 class Point(object):
@@ -61,7 +70,8 @@ def bf_closest_pair_2d(points):
     ------
     {"distance": float, "pair": Point}
     """
-    return bf_closest_2d(points, 0, len(points) - 1)
+    min_dist, point_a, point_b = bf_closest_2d(points, 0, len(points) - 1)
+    return PairResult(min_dist, (point_a, point_b))
 
 
 def bf_closest_2d(points, low, high):
@@ -79,7 +89,7 @@ def bf_closest_2d(points, low, high):
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): Minimal distance and its pair
     """
     # raise exception if points is less than 2 elements (high is inclusive)
     if high - low <= 0:
@@ -87,7 +97,7 @@ def bf_closest_2d(points, low, high):
 
     # set minimal pair as the first two elements
     min_dist = Point.distance(points[low], points[low + 1])
-    min_points = (points[low], points[low + 1])
+    min_a, min_b = points[low], points[low + 1]
 
     # iterate if points has more than 2 elements
     if high - low > 1:
@@ -97,9 +107,9 @@ def bf_closest_2d(points, low, high):
 
                 if dist < min_dist:
                     min_dist = dist
-                    min_points = (points[i], points[j])
+                    min_a, min_b = points[i], points[j]
 
-    return {"distance": min_dist, "pair": min_points}
+    return (min_dist, min_a, min_b)
 
 
 def closest_pair_2d(points):
@@ -118,7 +128,10 @@ def closest_pair_2d(points):
     points_xsorted = sorted(points, key=lambda point: point.x)
     points_ysorted = sorted(points, key=lambda point: point.y)
 
-    return closest_2d(points_xsorted, 0, len(points_xsorted) - 1, points_ysorted)
+    min_dist, point_a, point_b = closest_2d(points_xsorted, 0,
+                                            len(points_xsorted) - 1,
+                                            points_ysorted)
+    return PairResult(min_dist, (point_a, point_b))
 
 
 def closest_2d(points_xsorted, low, high, points_ysorted):
@@ -138,7 +151,7 @@ def closest_2d(points_xsorted, low, high, points_ysorted):
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): Minimal distance and its pair
     """
     # base case: use brute force on size 3 or less
     if high - low + 1 <= 3:
@@ -157,14 +170,14 @@ def closest_2d(points_xsorted, low, high, points_ysorted):
             points_yright.append(point)
 
     # recurse to find local minimal pairs on left and right
-    min_pair_left = closest_2d(points_xsorted, low, mid, points_yleft)
-    min_pair_right = closest_2d(points_xsorted, mid + 1, high, points_yright)
+    min_left = closest_2d(points_xsorted, low, mid, points_yleft)
+    min_right = closest_2d(points_xsorted, mid + 1, high, points_yright)
 
     # get the smaller of the two local minimal pairs
-    min_pair = min_of_pairs(min_pair_left, min_pair_right)
+    min_pair = min_left if min_left[0] <= min_right[0] else min_right
 
     # build strip array to find points smaller than delta from x-coord to mid
-    delta = min_pair["distance"]
+    delta = min_pair[0]
     strip = [p for p in points_ysorted if abs(p.x - mid_point.x) < delta]
 
     # return min_pair or smaller if found in strip
@@ -181,7 +194,7 @@ def strip_closest_2d(strip, min_pair):
     Parameters
     ----------
     strip (list): A strip of list of Points around median within delta
-    min_pair (dict): Minimal distance of two Points
+    min_pair (tuple): Minimal distance of two Points and the Points
 
     Correctness Proof
     -----------------
@@ -220,10 +233,12 @@ def strip_closest_2d(strip, min_pair):
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): min_pair or a closer pair in strip
     """
-    strip_min_dist = min_pair["distance"]
-    strip_min_points = min_pair["pair"]
+    if np is not None and len(strip) >= STRIP_VECTOR_MIN:
+        return _strip_closest_2d_vec(strip, min_pair)
+
+    strip_min_dist, strip_min_a, strip_min_b = min_pair
 
     for i in range(len(strip) - 1):  # skip last element compare
         for j in range(i + 1, min(i + 7, len(strip))):
@@ -231,9 +246,11 @@ def strip_closest_2d(strip, min_pair):
 
             if dist < strip_min_dist:
                 strip_min_dist = dist
-                strip_min_points = (strip[i], strip[j])
+                strip_min_a, strip_min_b = strip[i], strip[j]
 
-    return {"distance": strip_min_dist, "pair": strip_min_points}
+    if strip_min_dist < min_pair[0]:
+        return (strip_min_dist, strip_min_a, strip_min_b)
+    return min_pair
 
 
 def closest_pair_2d_opt(points):
@@ -254,7 +271,10 @@ def closest_pair_2d_opt(points):
     points_xsorted = sorted(points, key=lambda point: point.x)
     points_ysorted = sorted(points, key=lambda point: point.y)
 
-    return closest_opt(points_xsorted, 0, len(points_xsorted) - 1, points_ysorted)
+    min_dist, point_a, point_b = closest_opt(points_xsorted, 0,
+                                             len(points_xsorted) - 1,
+                                             points_ysorted)
+    return PairResult(min_dist, (point_a, point_b))
 
 
 def closest_opt(points_xsorted, low, high, points_ysorted):
@@ -275,7 +295,7 @@ def closest_opt(points_xsorted, low, high, points_ysorted):
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): Minimal distance and its pair
     """
     # base case: use brute force on size 3 or less
     if high - low + 1 <= 3:
@@ -294,14 +314,14 @@ def closest_opt(points_xsorted, low, high, points_ysorted):
             points_yright.append(point)
 
     # recurse to find local minimal pairs on left and right
-    min_pair_left = closest_opt(points_xsorted, low, mid, points_yleft)
-    min_pair_right = closest_opt(points_xsorted, mid + 1, high, points_yright)
+    min_left = closest_opt(points_xsorted, low, mid, points_yleft)
+    min_right = closest_opt(points_xsorted, mid + 1, high, points_yright)
 
     # get the smaller of the two local minimal pairs
-    min_pair = min_of_pairs(min_pair_left, min_pair_right)
+    min_pair = min_left if min_left[0] <= min_right[0] else min_right
 
     # build strip array to find points smaller than delta from x-coord to mid
-    delta = min_pair["distance"]
+    delta = min_pair[0]
     strip_left = [p for p in points_yleft if abs(p.x - mid_point.x) < delta]
     strip_right = [p for p in points_yright if abs(p.x - mid_point.x) < delta]
 
@@ -320,7 +340,7 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
     ----------
     strip_left (list): A strip of Points left side of median within delta.
     strip_right (list): A strip of Points right side of median within delta.
-    min_pair (dict): Minimal distance of two Points
+    min_pair (tuple): Minimal distance of two Points and the Points
 
     Correctness Proof
     -----------------
@@ -363,10 +383,13 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): min_pair or a closer pair in strip
     """
-    strip_min_dist = min_pair["distance"]
-    strip_min_points = min_pair["pair"]
+    if np is not None and \
+            len(strip_left) + len(strip_right) >= STRIP_OPT_VECTOR_MIN:
+        return _strip_closest_opt_vec(strip_left, strip_right, min_pair)
+
+    strip_min_dist, strip_min_a, strip_min_b = min_pair
 
     # if strip_left and strip_right is not empty
     if strip_left and strip_right:
@@ -380,7 +403,7 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
             dist = Point.distance(left, right)
             if dist < strip_min_dist:
                 strip_min_dist = dist
-                strip_min_points = (left, right)
+                strip_min_a, strip_min_b = left, right
 
             # if left is lower than or same level as right
             if left.y <= right.y:
@@ -391,7 +414,7 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
                     dist = Point.distance(left, right)
                     if dist < strip_min_dist:
                         strip_min_dist = dist
-                        strip_min_points = (left, right)
+                        strip_min_a, strip_min_b = left, right
                 l += 1
             # else right is lower than left
             else:
@@ -402,7 +425,7 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
                     dist = Point.distance(left, right)
                     if dist < strip_min_dist:
                         strip_min_dist = dist
-                        strip_min_points = (left, right)
+                        strip_min_a, strip_min_b = left, right
                 r += 1
     # else there is only strip_left
     elif strip_left and not strip_right:
@@ -410,9 +433,112 @@ def strip_closest_opt(strip_left, strip_right, min_pair):
             dist = Point.distance(strip_left[i], strip_left[i+1])
             if dist < strip_min_dist:
                 strip_min_dist = dist
-                strip_min_points = (strip_left[i], strip_left[i+1])
+                strip_min_a, strip_min_b = strip_left[i], strip_left[i+1]
+
+    if strip_min_dist < min_pair[0]:
+        return (strip_min_dist, strip_min_a, strip_min_b)
+    return min_pair
+
+
+def _strip_closest_2d_vec(strip, min_pair):
+    """
+    Vectorized strip_closest_2d(). Each point is compared to its next 6
+    y-ordered neighbors by shifting coordinate arrays, one shift at a time,
+    using squared distances. Only the winning pair is measured with
+    Point.distance, so the result is the same as the loop.
+
+    Return
+    ------
+    (float, Point, Point): min_pair or a closer pair in strip
+    """
+    xs, ys = _coords(strip)
+    shifts = [(0, k, xs[k:] - xs[:-k], ys[k:] - ys[:-k])
+              for k in range(1, min(7, len(strip)))]
 
-    return {"distance": strip_min_dist, "pair": strip_min_points}
+    return _strip_min(strip, strip, shifts, min_pair)
+
+
+def _strip_closest_opt_vec(strip_left, strip_right, min_pair):
+    """
+    Vectorized strip_closest_opt(). Each point is compared to the 4 points
+    of the other side at or above its y-coordinate, found with a binary
+    search of their y-coordinates. Points of one side are at least delta
+    apart, so at most 4 of them fit in the d x d square above a point,
+    which covers every pair the hopscotch walk can find.
+
+    Return
+    ------
+    (float, Point, Point): min_pair or a closer pair in strip
+    """
+    # only strip_left is vertical points, compare y-ordered neighbors
+    if not strip_right:
+        if len(strip_left) < 2:
+            return min_pair
+        xs, ys = _coords(strip_left)
+        return _strip_min(strip_left, strip_left,
+                          [(0, 1, xs[1:] - xs[:-1], ys[1:] - ys[:-1])],
+                          min_pair)
+    if not strip_left:
+        return min_pair
+
+    left_x, left_y = _coords(strip_left)
+    right_x, right_y = _coords(strip_right)
+
+    # index of each point paired with the 4 points above it on the other side
+    left_j = np.searchsorted(right_y, left_y)[:, None] + np.arange(4)
+    right_i = np.searchsorted(left_y, right_y)[:, None] + np.arange(4)
+    left_i = np.broadcast_to(np.arange(len(left_y))[:, None], left_j.shape)
+    right_j = np.broadcast_to(np.arange(len(right_y))[:, None], right_i.shape)
+
+    valid = left_j < len(right_y)
+    i, j = left_i[valid], left_j[valid]
+    valid = right_i < len(left_y)
+    i = np.concatenate((i, right_i[valid]))
+    j = np.concatenate((j, right_j[valid]))
+
+    shifts = [(i, j, left_x[i] - right_x[j], left_y[i] - right_y[j])]
+
+    return _strip_min(strip_left, strip_right, shifts, min_pair)
+
+
+def _strip_min(strip_a, strip_b, shifts, min_pair):
+    """
+    Return min_pair or the closest of the shifted comparisons.
+    Each shift is (index_a, index_b, dx, dy), where an int index is the
+    start offset of an aligned slice and an array index lists positions.
+    """
+    best_d2, best = None, None
+
+    for index_a, index_b, dx, dy in shifts:
+        if len(dx) == 0:
+            continue
+        d2 = dx * dx + dy * dy
+        m = int(d2.argmin())
+        if best_d2 is None or d2[m] < best_d2:
+            best_d2 = d2[m]
+            best = (_at(index_a, m), _at(index_b, m))
+
+    if best is None:
+        return min_pair
+
+    point_a, point_b = strip_a[best[0]], strip_b[best[1]]
+    dist = Point.distance(point_a, point_b)
+
+    if dist < min_pair[0]:
+        return (dist, point_a, point_b)
+    return min_pair
+
+
+def _at(index, m):
+    """Return position m of a shift index"""
+    return index + m if isinstance(index, int) else int(index[m])
+
+
+def _coords(points):
+    """Return x and y coordinate arrays of a list of Point"""
+    xs = np.fromiter((p.x for p in points), dtype=float, count=len(points))
+    ys = np.fromiter((p.y for p in points), dtype=float, count=len(points))
+    return xs, ys
 
 
 # -------------------------------------------
@@ -501,13 +627,14 @@ def closest_pair_2d_opt_plt(points, pause_t):
     ax.add_patch(rect)
 
     # do closest_2d pair of points with matplotlib
-    min_pair = closest_2d_opt_plt(points_xsorted, 0, len(points_xsorted) - 1,
-                                  points_ysorted, ax, pause_t)
+    min_dist, point_a, point_b = closest_2d_opt_plt(
+        points_xsorted, 0, len(points_xsorted) - 1, points_ysorted, ax,
+        pause_t)
 
     # show plot after recursion
     plt.show(block=True)
 
-    return min_pair
+    return PairResult(min_dist, (point_a, point_b))
 
 
 def closest_2d_opt_plt(points_xsorted, low, high, points_ysorted, ax, pause_t):
@@ -551,12 +678,12 @@ def closest_2d_opt_plt(points_xsorted, low, high, points_ysorted, ax, pause_t):
     rect = ax.patches[-1]
 
     # plot minimal pair on the left
-    min_points = min_pair_left['pair']
-    x = [min_points[0].x, min_points[1].x]
-    y = [min_points[0].y, min_points[1].y]
+    _, point_a, point_b = min_pair_left
+    x = [point_a.x, point_b.x]
+    y = [point_a.y, point_b.y]
     plt.pause(pause_t)
     ax.set_title(f"Midpoint: ({mid_point.x}, {mid_point.y})\n"
-                 f"Min left: {min_pair_left['distance']:.2f}\n")
+                 f"Min left: {min_pair_left[0]:.2f}\n")
     line.set_data(x, y)
     line.set_color("aqua")
 
@@ -575,12 +702,12 @@ def closest_2d_opt_plt(points_xsorted, low, high, points_ysorted, ax, pause_t):
                                         points_yright, ax, pause_t)
 
     # plot minimal pair on the right
-    min_points = min_pair_right['pair']
-    x = [min_points[0].x, min_points[1].x]
-    y = [min_points[0].y, min_points[1].y]
+    _, point_a, point_b = min_pair_right
+    x = [point_a.x, point_b.x]
+    y = [point_a.y, point_b.y]
     plt.pause(pause_t)
     ax.set_title(f"Midpoint: ({mid_point.x}, {mid_point.y})\n"
-                 f"Min right: {min_pair_right['distance']:.2f}\n")
+                 f"Min right: {min_pair_right[0]:.2f}\n")
     line.set_data(x, y)
     line.set_color("lime")
 
@@ -593,10 +720,11 @@ def closest_2d_opt_plt(points_xsorted, low, high, points_ysorted, ax, pause_t):
     vline.set_xdata([mid_point.x])
 
     # get the smaller of the two local minimal pairs
-    min_pair = min_of_pairs(min_pair_left, min_pair_right)
+    min_pair = min_pair_left if min_pair_left[0] <= min_pair_right[0] \
+        else min_pair_right
 
     # build strip array to find points smaller than delta from x-coord to mid
-    delta = min_pair["distance"]
+    delta = min_pair[0]
     strip_left = [p for p in points_yleft if abs(p.x - mid_point.x) < delta]
     strip_right = [p for p in points_yright if abs(p.x - mid_point.x) < delta]
 
@@ -604,12 +732,12 @@ def closest_2d_opt_plt(points_xsorted, low, high, points_ysorted, ax, pause_t):
     min_pair = strip_closest_opt(strip_left, strip_right, min_pair)
 
     # plot minimal pair
-    min_points = min_pair['pair']
-    x = [min_points[0].x, min_points[1].x]
-    y = [min_points[0].y, min_points[1].y]
+    _, point_a, point_b = min_pair
+    x = [point_a.x, point_b.x]
+    y = [point_a.y, point_b.y]
     plt.pause(pause_t)
     ax.set_title(f"Midpoint: ({mid_point.x}, {mid_point.y})\n"
-                 f"Combined min: {min_pair['distance']:.2f}\n"
+                 f"Combined min: {min_pair[0]:.2f}\n"
                  f"Delta: {delta:.2f}")
     line.set_data(x, y)
     line.set_color("tomato")
@@ -0,0 +1,379 @@
+"""
+Closest Pair of Points over buffers
+    - closest_pair_array: Closest pair of rows of an (n, dim) buffer
+
+Points are read from any buffer-protocol object, such as a numpy array or an
+array.array, through memoryview. No Point or tuple is built per row and the
+pair is returned as row indices, so results can be joined back to the
+caller's own records.
+"""
+import itertools
+import math
+
+from .morton import curve_seed, morton_order
+from .utils import PairResult, distance
+
+try:
+    import numpy as np
+except ImportError:  # the sweep falls back to pure python over memoryview
+    np = None
+
+# dimensions where rows are bucketed into cell columns, below the sweep on
+# the sort axis alone is as fast and above the 3^(k-1) neighbor columns
+# outnumber the savings
+GRID_MIN_DIM = 3
+GRID_MAX_DIM = 8
+
+# rows converted to float32 or gathered at a time, bounding the temporaries
+CHUNK_ROWS = 1 << 16
+
+PRECISIONS = ("float64", "float32")
+
+
+def closest_pair_array(buffer, dim=None, precision="float64", curve=False):
+    """
+    Find closest pair of rows of an (n, dim) buffer.
+
+    Rows are sorted on the axis of largest spread and each row is compared
+    to the rows after it in that order, stopping once the gap on the sort
+    axis alone reaches the best distance. With numpy, the comparison runs a
+    shift at a time for all rows still in range, and from GRID_MIN_DIM to
+    GRID_MAX_DIM dimensions only rows of neighboring cells on the other axes
+    are compared.
+
+    A float64 buffer is read in place, without a float64 copy. Buffers of
+    other item types are converted to float64 first. The numpy sweep keeps
+    one copy of the rows in sweep order, so rows compared together sit
+    together in memory, and gathers other rows CHUNK_ROWS at a time.
+
+    With precision "float32", rows are centered and stored as float32, so
+    the sweep moves half the bytes, and a float32 buffer is read in place.
+    The float32 winner is re-measured in float64 as delta. Every pair closer
+    than delta is within the float32 rounding error bound of it, so a second
+    float32 pass collects the pairs up to delta plus the bound, and the
+    closest of them in float64 is the exact answer. Near-ties only add a few
+    candidates. Without numpy, rows are always compared as Python floats.
+
+    With curve, rows are copied once in Morton order, so rows close in space
+    sit close in memory, and the closest pair of rows next to each other on
+    the curve seeds delta. The seed is usually the answer already, which
+    shrinks the cells of the grid. Without numpy, curve is ignored.
+
+    Time Complexity: O(nlogn) for points of bounded density up to
+    GRID_MAX_DIM dimensions, O(n^2) worst case
+
+    Parameters
+    ----------
+    buffer (buffer): Buffer of shape (n, dim), or a flat buffer of n * dim
+        numbers in row order when dim is given.
+    dim (int): Dimension of a flat buffer
+    precision (str): "float64", or "float32" with exact float64 checking
+    curve (bool): Reorder rows along the Z-order curve and seed from it
+
+    Return
+    ------
+    {"distance": float, "pair": (int, int)} where i < j are row indices
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, not "
+                         f"{precision!r}.")
+
+    rows = _as_rows(buffer, dim)
+    n, dim = rows.shape
+
+    if n < 2:
+        raise IndexError()
+
+    if np is None:
+        i, j = _sweep(rows, n, dim)
+    else:
+        i, j = _closest_vec(rows, precision, curve)
+
+    return PairResult(distance(_row(rows, i), _row(rows, j)), (i, j))
+
+
+def _closest_vec(rows, precision, curve):
+    """Return row indices (i, j), i < j, of the closest pair with numpy"""
+    coords = np.asarray(rows)
+    if precision == "float64" or coords.dtype != np.float32:
+        coords = np.asarray(coords, dtype=float)
+
+    order = None
+    if curve:
+        order = morton_order(coords)
+        coords = coords[order]
+
+    if precision == "float32":
+        i, j = _sweep_float32(coords, curve)
+    else:
+        i, j = _sweep_vec(coords, seed=curve_seed(coords) if curve else None)
+
+    if order is None:
+        return i, j
+    return tuple(sorted((int(order[i]), int(order[j]))))
+
+
+def _as_rows(buffer, dim):
+    """Return a 2D memoryview of buffer with rows of dim numbers"""
+    rows = memoryview(buffer)
+
+    if rows.ndim == 1:
+        if dim is None:
+            raise ValueError("dim is required for a flat buffer.")
+        if dim < 1 or len(rows) % dim:
+            raise ValueError(f"Buffer of {len(rows)} can't hold rows of "
+                             f"{dim}.")
+        if not len(rows):
+            raise IndexError()
+        rows = rows.cast("B").cast(rows.format, (len(rows) // dim, dim))
+    elif rows.ndim != 2:
+        raise ValueError(f"Buffer must be 2D, not {rows.ndim}D.")
+    elif dim is not None and rows.shape[1] != dim:
+        raise ValueError(f"Buffer rows have {rows.shape[1]} numbers, not "
+                         f"{dim}.")
+
+    return rows
+
+
+def _row(rows, i):
+    """Return row i of a 2D memoryview as a tuple"""
+    return tuple(rows[i, d] for d in range(rows.shape[1]))
+
+
+def _to_float32(coords):
+    """
+    Return (float32 array, bound) of coords centered on their bounding box
+    and the largest absolute coordinate after centering. A float32 array is
+    returned as is.
+    """
+    if coords.dtype == np.float32:
+        return coords, float(np.abs(coords).max())
+
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    center = (low + high) / 2
+
+    single = np.empty(coords.shape, dtype=np.float32)
+    for start in range(0, len(coords), CHUNK_ROWS):
+        single[start:start + CHUNK_ROWS] = \
+            coords[start:start + CHUNK_ROWS] - center
+
+    return single, float((high - low).max() / 2)
+
+
+def _float32_error(dim, bound, dist):
+    """
+    Return a bound of the error of a distance dist measured in float32 on
+    rows with coordinates up to bound, rounded to float32 once.
+    """
+    eps = float(np.finfo(np.float32).eps)
+    return eps * (2 * math.sqrt(dim) * bound + (dim + 4) * dist)
+
+
+def _verify(coords, first, second):
+    """
+    Return row indices (i, j), i < j, of the closest of candidate pairs
+    first[k], second[k], measured in float64.
+    """
+    d2 = _d2(coords[first].astype(float), coords[second].astype(float))
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    k = np.lexsort((high, low, d2))[0]
+    return int(low[k]), int(high[k])
+
+
+def _sweep_float32(coords, curve=False):
+    """
+    Return row indices (i, j), i < j, of the exact closest pair of an
+    (n, dim) float32 or float64 array, sweeping a float32 copy. With curve,
+    rows are in Morton order and seeded by curve_seed().
+    """
+    single, bound = _to_float32(coords)
+    dim = coords.shape[1]
+
+    first, second = _sweep_vec(
+        single, lambda dist: _float32_error(dim, bound, dist),
+        curve_seed(single) if curve else None)
+    return _verify(coords, first, second)
+
+
+def _sweep_vec(coords, error=None, seed=None):
+    """
+    Return row indices (i, j), i < j, of the closest pair of an (n, dim)
+    array.
+
+    Rows sorted on the axis of largest spread are compared to the next row
+    to seed the best distance delta. From GRID_MIN_DIM to GRID_MAX_DIM
+    dimensions, the rows are then bucketed into columns of cells of side
+    delta on the other axes and sorted by column, then by the sort axis. Any
+    closer pair lies in the same or an adjacent column, and within delta on
+    the sort axis, so each row is only compared to the rows of that window.
+    The windows are walked one shift at a time for all rows at once.
+
+    With error, a function bounding the error of a distance measured on
+    the rows, the search reaches delta plus twice the error of the seed
+    delta and returns arrays (first, second) of the row indices of every
+    pair found within it. The exact closest pair is one of them.
+
+    A seed (squared distance, i, j) of a known pair replaces the seed of the
+    sort axis when closer.
+    """
+    n, dim = coords.shape
+
+    # a column at a time, reductions over rows of k numbers are slow
+    axis = int(np.argmax([np.ptp(coords[:, d]) for d in range(dim)]))
+    order = np.argsort(coords[:, axis], kind="stable")
+
+    # every row against the next on the sort axis seeds the best distance
+    d2 = _gather_d2(coords, order[:-1], order[1:])
+    k = int(np.argmin(d2))
+    best, best_i, best_j = d2[k], int(order[k]), int(order[k + 1])
+    if seed is not None and seed[0] < best:
+        best, best_i, best_j = seed
+
+    if error is None:
+        if best == 0 or dim == 1:
+            return (best_i, best_j) if best_i < best_j else (best_j, best_i)
+        slack, limit = 0.0, best
+    else:
+        # a closer pair measures at most twice the error above delta
+        slack = 2 * error(math.sqrt(best))
+        limit = (math.sqrt(best) + slack)**2
+        if limit == 0:
+            # no error and delta 0, every row is the same
+            return np.array([best_i]), np.array([best_j])
+        near = d2 <= limit
+        found = [(order[:-1][near], order[1:][near])]
+
+    keys, offsets = np.zeros(n, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    if GRID_MIN_DIM <= dim <= GRID_MAX_DIM:
+        others = [d for d in range(dim) if d != axis]
+        side = math.sqrt(limit)
+        lows = [float(coords[:, d].min()) for d in others]
+        radix = np.array([math.floor((float(coords[:, d].max()) - low) /
+                                     side) + 3
+                          for d, low in zip(others, lows)], dtype=float)
+
+        if np.prod(radix) < 2.0**62:
+            strides = np.cumprod([1] + radix[:-1].tolist()).astype(np.int64)
+
+            # a column at a time, cells start at 1 so a neighbor key never
+            # wraps into another row
+            for d, low, stride in zip(others, lows, strides.tolist()):
+                cells = np.floor((coords[:, d] - low) / side)
+                keys += (cells.astype(np.int64) + 1) * stride
+
+            offsets = np.array(list(itertools.product(
+                (-1, 0, 1), repeat=dim - 1)), dtype=np.int64) @ strides
+            offsets = np.sort(offsets[offsets >= 0])
+            order = np.lexsort((coords[:, axis], keys))
+
+    keys, values, rows = keys[order], coords[order, axis], coords[order]
+    indices = np.arange(n)
+
+    for offset in offsets:
+        if offset == 0:
+            start = indices + 1
+            end = np.searchsorted(keys, keys, "right")
+        else:
+            # first row of the neighbor column within delta on the sort axis
+            target = keys + offset
+            start = np.searchsorted(keys, target, "left")
+            end = np.searchsorted(keys, target, "right")
+            low = values - math.sqrt(limit) * (1 + 1e-9)
+            start = _lower_bound(values, start, end, low)
+
+        mask = start < end
+        i, start, end = indices[mask], start[mask], end[mask]
+
+        # walk every window one shift at a time while it is within delta
+        while len(i):
+            j = start
+            gap = values[j] - values[i]
+            mask = (gap <= 0) | (gap * gap < limit)
+            i, j, end = i[mask], j[mask], end[mask]
+            if not len(i):
+                break
+
+            d2 = _gather_d2(rows, i, j)
+            k = int(np.argmin(d2))
+            if d2[k] < best:
+                best, best_i, best_j = d2[k], int(order[i[k]]), \
+                    int(order[j[k]])
+                limit = (math.sqrt(best) + slack)**2 if slack else best
+
+            if error is not None:
+                near = d2 <= limit
+                found.append((order[i[near]], order[j[near]]))
+
+            start = j + 1
+            mask = start < end
+            i, start, end = i[mask], start[mask], end[mask]
+
+    if error is not None:
+        first = np.concatenate([f for f, _ in found])
+        second = np.concatenate([s for _, s in found])
+        near = _gather_d2(coords, first, second) <= limit
+        return first[near], second[near]
+    return (best_i, best_j) if best_i < best_j else (best_j, best_i)
+
+
+def _gather_d2(rows, first, second):
+    """
+    Return squared distances of rows[first] to rows[second], gathering
+    CHUNK_ROWS pairs at a time so no copy of all rows is made.
+    """
+    if len(first) <= CHUNK_ROWS:
+        return _d2(rows[first], rows[second])
+
+    d2 = np.empty(len(first))
+    for start in range(0, len(first), CHUNK_ROWS):
+        end = start + CHUNK_ROWS
+        d2[start:end] = _d2(rows[first[start:end]], rows[second[start:end]])
+    return d2
+
+
+def _d2(rows_a, rows_b):
+    """Return squared distances of matching rows of two arrays"""
+    diff = rows_a - rows_b
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def _lower_bound(values, low, high, bound):
+    """
+    Return for each row the first index in [low, high) of sorted values
+    above bound, by a binary search on all rows at once.
+    """
+    low, high = low.copy(), high.copy()
+    mask = low < high
+    while mask.any():
+        mid = (low + high) // 2
+        above = values[np.minimum(mid, len(values) - 1)] > bound
+        high = np.where(mask & above, mid, high)
+        low = np.where(mask & ~above, mid + 1, low)
+        mask = low < high
+    return low
+
+
+def _sweep(rows, n, dim):
+    """
+    Return row indices (i, j), i < j, of the closest pair of a 2D memoryview
+    without numpy.
+    """
+    axis = max(range(dim), key=lambda d: max(rows[i, d] for i in range(n)) -
+               min(rows[i, d] for i in range(n)))
+    keys = [rows[i, axis] for i in range(n)]
+    order = sorted(range(n), key=keys.__getitem__)
+
+    best, best_i, best_j = math.inf, order[0], order[1]
+    for a in range(n - 1):
+        i = order[a]
+        for b in range(a + 1, n):
+            j = order[b]
+
+            if (keys[j] - keys[i])**2 >= best:
+                break
+
+            d2 = sum((rows[i, d] - rows[j, d])**2 for d in range(dim))
+            if d2 < best:
+                best, best_i, best_j = d2, i, j
+
+    return (best_i, best_j) if best_i < best_j else (best_j, best_i)
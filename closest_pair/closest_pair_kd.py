@@ -2,29 +2,72 @@
 Closest Pair of Points in kth dimension
     - closest_pair_kd: Divide and Conquer in kth dimensions
     - bf_closest_pair_kd: Brute force in kth dimensions
+    - nearest_neighbor_kd: Nearest point to a query point
 """
-from .utils import distance, min_of_pairs
+import functools
+import itertools
 
+from . import blocked
+from .closest_pair_1d import closest_pair_1d
+from .utils import PairResult, distance
 
-def bf_closest_pair_kd(points):
+# from this dimension up the strip holds nearly every point, so the tiled
+# brute force takes over the small inputs, leaves and wide strips of the
+# recursion when numpy is installed
+BLOCKED_MIN_DIM = 4
+
+# slices of the recursion of at most this many points go to the tiled
+# brute force, about where its n^2 catches up with the recursion in 4D
+BLOCKED_LEAF = 4096
+
+# strips with more pairs to scan go to the tiled brute force
+BLOCKED_STRIP_PAIRS = 4096
+
+
+def bf_closest_pair_kd(points, hook=None):
     """
     Bruteforce approach to get minimal distance of two points at kth dimensions.
 
     Parameters
     ----------
     points (list): List of tuple of kth dimensions.
+    hook (ProgressHook): Progress by pairs of rows done, and cancellation
 
     Return
     ------
     {"distance": float, "pair": Point}
     """
+    if hook is not None:
+        hook.start(len(points) * (len(points) - 1) // 2)
+
+    min_dist, point_a, point_b = bf_closest_kd(points, hook)
+
+    if hook is not None:
+        hook.finish()
+    return PairResult(min_dist, (point_a, point_b))
+
+
+def bf_closest_kd(points, hook=None):
+    """
+    Bruteforce minimal pair of points at kth dimensions without building a
+    result, used by the recursion base case.
+
+    Parameters
+    ----------
+    points (list): List of tuple of kth dimensions.
+    hook (ProgressHook): Advanced by the pairs of each row
+
+    Return
+    ------
+    (float, Point, Point): Minimal distance and its pair
+    """
     n = len(points)
 
     if n < 2:
         raise IndexError()
 
     min_dist = distance(points[0], points[1])
-    min_points = (points[0], points[1])
+    min_a, min_b = points[0], points[1]
 
     for i in range(n - 1):
         for j in range(i + 1, n):
@@ -32,9 +75,12 @@ def bf_closest_pair_kd(points):
 
             if dist < min_dist:
                 min_dist = dist
-                min_points = (points[i], points[j])
+                min_a, min_b = points[i], points[j]
+
+        if hook is not None:
+            hook.advance(n - 1 - i)
 
-    return {"distance": min_dist, "pair": min_points}
+    return (min_dist, min_a, min_b)
 
 
 def bf_pairlist_kd(points):
@@ -67,9 +113,36 @@ def bf_pairlist_kd(points):
     return pairs
 
 
-def closest_pair_kd(points):
+def nearest_neighbor_kd(points, query):
+    """
+    Find the nearest point to a query point at kth dimensions.
+
+    Time Complexity: O(n)
+
+    Parameters
+    ----------
+    points (list): List of tuple of kth dimensions.
+    query (tuple): Point of kth dimensions
+
+    Return
+    ------
+    {"distance": float, "pair": (Point, query)}
+    """
+    if not points:
+        raise IndexError()
+
+    nearest = min(points, key=lambda point: distance(point, query))
+    return PairResult(distance(nearest, query), (nearest, query))
+
+
+def closest_pair_kd(points, hook=None):
     """
     Find closest pair in points using divide and conquer at kth dimensions.
+    Points of 1 dimension go to closest_pair_1d(). At BLOCKED_MIN_DIM
+    dimensions and above with numpy installed, bf_closest_pair_blocked()
+    takes inputs of up to BLOCKED_LEAF points, and inputs too small for the
+    3^(k-1) strip cells to pay off. Larger inputs keep the recursion, with
+    bf_closest_pair_blocked() at its leaves and wide strips.
 
     Timsort: O(nlogn)
     Closest: O(nlogn)
@@ -78,111 +151,189 @@ def closest_pair_kd(points):
     Parameters
     ----------
     points (list): List of tuple of kth dimensions.
+    hook (ProgressHook): Progress by points reaching a base case of the
+        recursion, and cancellation
 
     Return
     ------
     {"distance": float, "pair": Point}
     """
     dim = len(points[0])
+    leaf = None
 
-    # presort points by each coordinates up to k dimensions
-    points_kd = [sorted(points, key=lambda p: p[d]) for d in range(dim)]
+    if dim >= BLOCKED_MIN_DIM and blocked.np is not None:
+        if len(points) <= max(BLOCKED_LEAF, 3**(dim - 1)):
+            return blocked.bf_closest_pair_blocked(points, hook=hook)
+        leaf = BLOCKED_LEAF
 
-    return closest_kd(points_kd, dim, 0)
+    if hook is not None:
+        hook.start(len(points))
 
+    if dim == 1:
+        result = closest_pair_1d(points)
+    else:
+        # presort points by the first coordinate, the only axis split on
+        points_xsorted = sorted(points, key=lambda p: p[0])
+
+        min_dist, point_a, point_b = closest_kd(
+            points_xsorted, 0, len(points_xsorted) - 1, dim, hook, leaf)
+        result = PairResult(min_dist, (point_a, point_b))
+
+    if hook is not None:
+        hook.finish()
+    return result
 
-def closest_kd(points_kd, dim, level):
+
+def closest_kd(points_xsorted, low, high, dim, hook=None, leaf=None):
     """
-    Recursively find the closest pair of points at the kth dimensions.
-    Uses both direct recursion and indirect recursion from strip_closest_kd().
+    Recursively find the closest pair of points at the kth dimensions,
+    splitting on the first coordinate only.
 
     Recurrence relation
     -------------------
-    T(n, k) = 2T(n/2, k) + T(m, k-1) + O(n)
-    m <= n/(logn)^(k-2) where m is the number of points by sparsity
-    T(m, k-1) = O(m (logm)^(k-2) ) = O(n)
-    T(n, k) = 2T(n/2, k) + O(n) + O(n) = O(nlogn)
+    T(n, k) = 2T(n/2, k) + O(3^(k-1) n)
 
-    Time Complexity: O(nlogn)
+    Time Complexity: O(3^(k-1) nlogn)
 
     Parameters
     ----------
-    points_kd (list): d x n array of tuple in max d dimensions.
+    points_xsorted (list): List of tuple sorted by the first coordinate
+    low (int): Start index (inclusive)
+    high (int): End index (inclusive)
     dim (int): Max dimension of points
-    level: Kth dimension level with base of 0
+    hook (ProgressHook): Advanced by the points of each base case
+    leaf (int): Slices of at most leaf points and wide strips go to
+        bf_closest_pair_blocked(), None for python only
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): Minimal distance and its pair
     """
-    n = len(points_kd[level])
+    n = high - low + 1
 
     # base case: use brute force on size 3 or less
     if n <= 3:
-        return bf_closest_pair_kd(points_kd[level])
+        if hook is not None:
+            hook.advance(n)
+        return bf_closest_kd(points_xsorted[low:high + 1])
+
+    # leaf: one tiled brute force beats recursing further
+    if leaf is not None and n <= leaf:
+        if hook is not None:
+            hook.advance(n)
+        return _blocked_kd(points_xsorted[low:high + 1])
 
     # get median point
-    mid = n // 2
-    med = points_kd[level][mid-1]
-    points_left = [[] for d in range(dim)]
-    points_right = [[] for d in range(dim)]
-
-    # divide points
-    for d in range(dim):
-        if d == level:
-            points_left[d] = points_kd[level][:mid]
-            points_right[d] = points_kd[level][mid:]
-        else:
-            for point in points_kd[d]:
-                if point[level] <= med[level]:
-                    points_left[d].append(point)
-                else:
-                    points_right[d].append(point)
+    mid = low + n // 2
+    med = points_xsorted[mid - 1][0]
 
     # recursion
-    min_left = closest_kd(points_left, dim, level)
-    min_right = closest_kd(points_right, dim, level)
-    min_pair = min_of_pairs(min_left, min_right)
+    min_left = closest_kd(points_xsorted, low, mid - 1, dim, hook, leaf)
+    min_right = closest_kd(points_xsorted, mid, high, dim, hook, leaf)
+    min_pair = min_left if min_left[0] <= min_right[0] else min_right
+
+    # create strip of both sides
+    delta = min_pair[0]
+    strip_left = []
+    for i in range(mid - 1, low - 1, -1):
+        if med - points_xsorted[i][0] >= delta:
+            break
+        strip_left.append(points_xsorted[i])
+    strip_right = []
+    for i in range(mid, high + 1):
+        if points_xsorted[i][0] - med >= delta:
+            break
+        strip_right.append(points_xsorted[i])
+
+    return strip_closest_kd(strip_left, strip_right, min_pair, dim,
+                            vector=leaf is not None)
+
+
+def strip_closest_kd(strip_left, strip_right, min_pair, dim, axis=0,
+                     vector=False):
+    """
+    Find any pair across the median of axis closer than min_pair.
 
-    # create strip
-    delta = min_pair['distance']
-    strip = [[p for p in points_kd[d] if abs(med[level] - p[level]) < delta]
-             for d in range(dim)]
+    Points of one side are at least delta apart, so only pairs with one
+    point on each side can be closer. The left strip is hashed into cells of
+    side delta on the k-1 axes other than the split axis. A pair closer than
+    delta differs by less than delta on every axis, so a right point only
+    needs the left points of its own and adjacent cells (3^(k-1) cells).
+    Left points in those cells are delta apart within a 3delta box, so the
+    packing bound keeps the work per point constant for a fixed dimension.
 
-    if level + 1 < dim:
-        return strip_closest_kd(strip, min_pair, dim, level + 1)
-    else:
-        return strip_closest_kd(strip, min_pair, dim, level)
+    With vector, strips of more than BLOCKED_STRIP_PAIRS pairs go to
+    bf_closest_pair_blocked() whole instead. Pairs on one side are delta
+    apart, so the closest pair of the strip is the closest one across.
 
-
-def strip_closest_kd(strip, min_pair, dim, level):
-    """
-    Find any points smaller than min_pair with given stirp array.
-    Indirect recursion to closest_kd().
+    Time Complexity: O(3^(k-1) n)
 
     Parameters
     ----------
-    strip (list): d x n array of tuple in max d dimensions.
-    min_pair (dict): Minimal pair of points with key 'distance' and 'pair'.
+    strip_left (list): Left points within delta of the median
+    strip_right (list): Right points within delta of the median
+    min_pair (tuple): Minimal distance of two points and the points
     dim (int): Max dimension of points
-    level: Kth dimension level
+    axis (int): Axis of the split the strips are within delta of
+    vector (bool): Scan wide strips with bf_closest_pair_blocked()
 
     Return
     ------
-    {"distance": float, "pair": Point}
+    (float, Point, Point): min_pair or a closer pair in strip
     """
-    # recursion into strip if next level is less then dimension
-    if level + 1 < dim and len(strip[level]) > 1:
-        level_min = closest_kd(strip, dim, level)
-        min_pair = min_of_pairs(min_pair, level_min)
+    delta = min_pair[0]
+
+    # nothing beats a duplicate
+    if delta == 0 or not strip_left or not strip_right:
+        return min_pair
 
-    # try to find a smaller min_pair in strip
-    for i in range(len(strip[level]) - 1):
-        for j in range(i + 1, min(i + 7, len(strip[level]))):
-            dist = distance(strip[level][i], strip[level][j])
+    # one tiled pass beats python cells when the strip is wide
+    if vector and len(strip_left) * len(strip_right) > BLOCKED_STRIP_PAIRS:
+        strip_min = _blocked_kd(strip_left + strip_right)
+        return strip_min if strip_min[0] < min_pair[0] else min_pair
 
-            if dist < min_pair['distance']:
-                min_pair['distance'] = dist
-                min_pair['pair'] = (strip[level][i], strip[level][j])
+    strip_min_dist, strip_min_a, strip_min_b = min_pair
 
+    # a few left points are cheaper to scan than the cells around them
+    if len(strip_left) <= 3**(dim - 1):
+        for right in strip_right:
+            for left in strip_left:
+                dist = distance(left, right)
+
+                if dist < strip_min_dist:
+                    strip_min_dist = dist
+                    strip_min_a, strip_min_b = left, right
+    else:
+        offsets = _neighbor_offsets(dim - 1)
+        axes = [d for d in range(dim) if d != axis]
+        grid = {}
+        for left in strip_left:
+            cell = tuple(int(left[d] // delta) for d in axes)
+            grid.setdefault(cell, []).append(left)
+
+        for right in strip_right:
+            cell = tuple(int(right[d] // delta) for d in axes)
+            for offset in offsets:
+                key = tuple(c + o for c, o in zip(cell, offset))
+                for left in grid.get(key, ()):
+                    dist = distance(left, right)
+
+                    if dist < strip_min_dist:
+                        strip_min_dist = dist
+                        strip_min_a, strip_min_b = left, right
+
+    if strip_min_dist < min_pair[0]:
+        return (strip_min_dist, strip_min_a, strip_min_b)
     return min_pair
+
+
+def _blocked_kd(points):
+    """Return bf_closest_pair_blocked() of points as a recursion tuple"""
+    result = blocked.bf_closest_pair_blocked(points)
+    return (result["distance"], *result["pair"])
+
+
+@functools.lru_cache(maxsize=None)
+def _neighbor_offsets(dim):
+    """Return cell offsets of a cell and its neighbors in dim dimensions"""
+    return list(itertools.product((-1, 0, 1), repeat=dim))
@@ -0,0 +1,233 @@
+"""
+Automatic algorithm selection
+    - closest_pair: Pick the fastest engine by n, dimension and data shape
+    - tune: Calibrate brute force crossovers and save them to a profile file
+    - load_profile: Read crossover thresholds from the profile file
+
+Tune from the command line with
+    python3 -m closest_pair.dispatch
+"""
+import json
+import os
+import random
+import time
+
+from . import blocked
+from .anytime import closest_pair_anytime
+from .closest_pair_2d import Point, bf_closest_pair_2d, closest_pair_2d,\
+    closest_pair_2d_opt
+from .closest_pair_kd import BLOCKED_MIN_DIM, bf_closest_pair_kd,\
+    closest_pair_kd
+from .utils import PairResult, distance, gen_unique_kd_points
+
+PROFILE_ENV = "CLOSEST_PAIR_PROFILE"
+PROFILE_FILE = "closest_pair_profile.json"
+
+# largest n where brute force beats recursion, keyed by dimension for k-D
+DEFAULT_PROFILE = {
+    "bf_max_n_2d": 16,
+    "bf_max_n_kd": {"1": 8, "2": 16, "3": 64, "4": 256},
+    "sample_size": 64
+}
+
+_profile_cache = {}
+
+# duplicate sampling leaves the caller's random state alone
+_random = random.Random()
+
+
+def closest_pair(points, profile=None, budget=None, deadline=None,
+                 cancel=None):
+    """
+    Find closest pair of points with the fastest available engine.
+
+    Engine selection
+    ----------------
+    - Any iterable other than list or tuple is first collected into a list.
+    - A random sample of points is checked for duplicates. A duplicate means
+      the answer is 0, so a linear hash scan returns it directly.
+    - List of Point uses bf_closest_pair_2d up to the profiled crossover.
+      Above it, closest_pair_2d_opt is used when every x-coordinate is
+      distinct, which it requires for a correct answer, else closest_pair_2d.
+    - List of tuple uses bf_closest_pair_kd up to the profiled crossover of
+      its dimension, else closest_pair_kd. From BLOCKED_MIN_DIM dimensions
+      with numpy installed, closest_pair_kd is always used, as it runs the
+      numpy blocked brute force on small inputs.
+    - With a budget, deadline or cancel event, closest_pair_anytime is used
+      instead, and the result has "optimal" telling if it is exact.
+
+    Parameters
+    ----------
+    points (iterable): Point or tuple of kth dimensions.
+    profile (dict): Crossover thresholds. Default is load_profile().
+    budget (float): Seconds from now to return the best pair found by
+    deadline (float): time.perf_counter() value to return the best pair by
+    cancel (threading.Event): Return the best pair found when set
+
+    Return
+    ------
+    {"distance": float, "pair": Point}
+    """
+    if not isinstance(points, (list, tuple)):
+        points = list(points)
+
+    if budget is not None or deadline is not None or cancel is not None:
+        return closest_pair_anytime(points, budget, deadline, cancel)
+
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+
+    if profile is None:
+        profile = _read_profile()
+
+    # a duplicate in the sample means distance 0 is the answer
+    sample = _random.sample(range(n), min(n, profile["sample_size"]))
+    if len({_key(points[i]) for i in sample}) < len(sample):
+        return _duplicate_pair(points)
+
+    if isinstance(points[0], Point):
+        if n <= profile["bf_max_n_2d"]:
+            return bf_closest_pair_2d(points)
+        if len({point.x for point in points}) == n:
+            return closest_pair_2d_opt(points)
+        return closest_pair_2d(points)
+
+    dim = len(points[0])
+    if n <= _bf_max_n_kd(profile, dim) and \
+            (dim < BLOCKED_MIN_DIM or blocked.np is None):
+        return bf_closest_pair_kd(points)
+    return closest_pair_kd(points)
+
+
+def load_profile(path=None):
+    """
+    Read crossover thresholds from the profile file, merged over
+    DEFAULT_PROFILE. The file is re-read only when it changes.
+
+    Parameters
+    ----------
+    path (str): Profile file. Default is $CLOSEST_PAIR_PROFILE or
+        closest_pair_profile.json in the working directory.
+
+    Return
+    ------
+    dict: A copy, changing it leaves the defaults and cache alone
+    """
+    profile = _read_profile(path)
+    return dict(profile, bf_max_n_kd=dict(profile["bf_max_n_kd"]))
+
+
+def _read_profile(path=None):
+    """Return the shared profile of load_profile(), not to be changed"""
+    path = path or os.environ.get(PROFILE_ENV, PROFILE_FILE)
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return DEFAULT_PROFILE
+
+    cached = _profile_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as file:
+        saved = json.load(file)
+
+    profile = dict(DEFAULT_PROFILE, **saved)
+    profile["bf_max_n_kd"] = dict(DEFAULT_PROFILE["bf_max_n_kd"],
+                                  **saved.get("bf_max_n_kd", {}))
+    _profile_cache[path] = (mtime, profile)
+
+    return profile
+
+
+def tune(path=None, dims=(1, 2, 3, 4), max_n=1024, repeat=5):
+    """
+    Benchmark brute force against recursion on growing inputs to find the
+    crossover of each engine family, then save them to the profile file.
+
+    Parameters
+    ----------
+    path (str): Profile file. Default is the same as load_profile().
+    dims (tuple): K-D dimensions to calibrate
+    max_n (int): Largest input size to try
+    repeat (int): Runs per timing, the fastest run is kept
+
+    Return
+    ------
+    dict
+    """
+    path = path or os.environ.get(PROFILE_ENV, PROFILE_FILE)
+    profile = dict(DEFAULT_PROFILE, bf_max_n_kd={})
+
+    profile["bf_max_n_2d"] = _crossover(
+        Point.get_unique_points, bf_closest_pair_2d, closest_pair_2d_opt,
+        max_n, repeat)
+
+    for dim in dims:
+        profile["bf_max_n_kd"][str(dim)] = _crossover(
+            lambda n: gen_unique_kd_points(n, dim), bf_closest_pair_kd,
+            closest_pair_kd, max_n, repeat)
+
+    with open(path, "w") as file:
+        json.dump(profile, file, indent=4)
+
+    return profile
+
+
+def _crossover(gen_points, bruteforce, recursion, max_n, repeat):
+    """Return the largest n before recursion first beats brute force"""
+    bf_max_n = 3
+    n = 4
+
+    while n <= max_n:
+        points = gen_points(n)
+        if _timing(recursion, points, repeat) < \
+                _timing(bruteforce, points, repeat):
+            break
+        bf_max_n = n
+        n = n * 3 // 2
+
+    return bf_max_n
+
+
+def _timing(func, points, repeat):
+    """Return the fastest run time of func(points) in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func(points)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def _bf_max_n_kd(profile, dim):
+    """Return crossover of dim, or of the closest calibrated dimension"""
+    thresholds = profile["bf_max_n_kd"]
+    if str(dim) in thresholds:
+        return thresholds[str(dim)]
+    closest = min(thresholds, key=lambda d: abs(int(d) - dim))
+    return thresholds[closest]
+
+
+def _key(point):
+    """Return hashable coordinates of Point or tuple"""
+    return tuple(point[d] for d in range(len(point)))
+
+
+def _duplicate_pair(points):
+    """Return the first duplicate pair found by a linear hash scan"""
+    seen = {}
+    for point in points:
+        key = _key(point)
+        if key in seen:
+            return PairResult(distance(seen[key], point), (seen[key], point))
+        seen[key] = point
+
+
+if __name__ == "__main__":
+    path = os.environ.get(PROFILE_ENV, PROFILE_FILE)
+    print(f"Tuning crossovers, saving to {path}...")
+    print(json.dumps(tune(path), indent=4))
@@ -0,0 +1,107 @@
+"""
+Closest Pair of Points on the globe
+    - closest_pair_geo: Closest pair of (lat, lon) points by great-circle
+    - bf_closest_pair_geo: Brute force with the haversine formula
+    - haversine: Great-circle distance between two (lat, lon) points
+"""
+import math
+
+from .closest_pair_kd import closest_pair_kd
+from .utils import PairResult
+
+# mean earth radius in meters
+EARTH_RADIUS = 6371008.8
+
+
+def closest_pair_geo(points, radius=EARTH_RADIUS):
+    """
+    Find closest pair of (lat, lon) points in degrees by great-circle
+    distance. Each point is converted once to a 3D unit vector, so the
+    search runs on straight chord distance with closest_pair_kd() and no trig
+    per pair. Chord length c and great-circle distance 2R * asin(c / 2) grow
+    together, so the closest chord is the closest great-circle pair.
+
+    Unit vectors have no seam, so pairs across the antimeridian and around
+    the poles (where every longitude meets) are found like any other pair.
+
+    Time Complexity: O(nlogn)
+
+    Parameters
+    ----------
+    points (list): List of (lat, lon) in degrees.
+    radius (float): Sphere radius, default is the earth in meters.
+
+    Return
+    ------
+    {"distance": float, "pair": (lat, lon)}
+    """
+    if len(points) < 2:
+        raise IndexError()
+
+    vectors = [to_unit_vector(point) for point in points]
+    index = {id(vector): i for i, vector in enumerate(vectors)}
+
+    result = closest_pair_kd(vectors)
+    vector_a, vector_b = result["pair"]
+    chord = result["distance"]
+
+    return PairResult(2 * radius * math.asin(min(chord / 2, 1.0)),
+                      (points[index[id(vector_a)]],
+                       points[index[id(vector_b)]]))
+
+
+def bf_closest_pair_geo(points, radius=EARTH_RADIUS):
+    """
+    Bruteforce approach to get the closest pair of (lat, lon) points with
+    the haversine formula.
+
+    Time Complexity: O(n^2)
+
+    Parameters
+    ----------
+    points (list): List of (lat, lon) in degrees.
+    radius (float): Sphere radius, default is the earth in meters.
+
+    Return
+    ------
+    {"distance": float, "pair": (lat, lon)}
+    """
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+
+    min_dist = haversine(points[0], points[1], radius)
+    min_a, min_b = points[0], points[1]
+
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            dist = haversine(points[i], points[j], radius)
+
+            if dist < min_dist:
+                min_dist = dist
+                min_a, min_b = points[i], points[j]
+
+    return PairResult(min_dist, (min_a, min_b))
+
+
+def haversine(point_a, point_b, radius=EARTH_RADIUS):
+    """Find great-circle distance between two (lat, lon) points in degrees"""
+    lat_a, lon_a = math.radians(point_a[0]), math.radians(point_a[1])
+    lat_b, lon_b = math.radians(point_b[0]), math.radians(point_b[1])
+
+    h = math.sin((lat_b - lat_a) / 2)**2 + \
+        math.cos(lat_a) * math.cos(lat_b) * math.sin((lon_b - lon_a) / 2)**2
+    return 2 * radius * math.asin(min(math.sqrt(h), 1.0))
+
+
+def to_unit_vector(point):
+    """Convert a (lat, lon) point in degrees to a 3D unit vector"""
+    lat, lon = point[0], point[1]
+
+    if not -90 <= lat <= 90:
+        raise ValueError(f"Latitude {lat} is out of range [-90, 90].")
+
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon),
+            math.sin(lat))
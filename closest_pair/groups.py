@@ -0,0 +1,244 @@
+"""
+Closest Pair of Points per group
+    - closest_pair_groups: Closest pair of every group of rows in one call
+"""
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .closest_pair_array import PRECISIONS, _as_rows, _d2,\
+    _float32_error, _to_float32
+
+try:
+    import numpy as np
+except ImportError:  # groups are swept one at a time in pure python
+    np = None
+
+# rows per chunk handed to a worker thread
+CHUNK_ROWS = 1 << 16
+
+
+def closest_pair_groups(buffer, groups, dim=None, workers=1,
+                        precision="float64"):
+    """
+    Find the closest pair of rows of every group of an (n, dim) buffer.
+
+    Rows are sorted once by (group, x). Every row is then compared to the
+    row s places after it in the same group for s = 1, 2, ... for all groups
+    at once, dropping rows whose gap on x reaches the best distance of their
+    group. Groups of tens to thousands of points finish in a few shifts with
+    no per-group Python call.
+
+    With workers > 1, the sorted rows are cut at group boundaries into
+    chunks of about CHUNK_ROWS rows, which are swept on a thread pool. The
+    numpy kernels release the GIL, so chunks run in parallel.
+
+    With precision "float32", the sweep runs on a centered float32 copy and
+    keeps every pair of a group within its best distance plus the float32
+    rounding error bound. The closest of those in float64 is the exact
+    closest pair of the group, as in closest_pair_array().
+
+    Time Complexity: O(nlogn + m) where m is the number of same group pairs
+    closer on x than the best distance of their group
+
+    Parameters
+    ----------
+    buffer (buffer): Buffer of shape (n, dim), or a flat buffer of n * dim
+        numbers in row order when dim is given.
+    groups (buffer): Buffer or list of n integer group ids
+    dim (int): Dimension of a flat buffer
+    workers (int): Number of threads, None for one per cpu
+    precision (str): "float64", or "float32" with exact float64 checking
+
+    Return
+    ------
+    [(group, float, int, int)] of group id, distance and row indices i < j
+    sorted by group id. Groups of a single row are left out.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, not "
+                         f"{precision!r}.")
+
+    rows = _as_rows(buffer, dim)
+    n, dim = rows.shape
+
+    if len(groups) != n:
+        raise ValueError(f"{len(groups)} group ids for {n} rows.")
+    if n == 0:
+        return []
+
+    if np is None:
+        return _sweep_groups_py(rows, list(groups))
+
+    error = None
+    if precision == "float32":
+        coords = np.asarray(rows)
+        if coords.dtype != np.float32:
+            coords = np.asarray(coords, dtype=float)
+        single, bound = _to_float32(coords)
+
+        def error(dist):
+            return _float32_error(dim, bound, dist)
+    else:
+        coords = single = np.asarray(rows, dtype=float)
+
+    keys = np.asarray(groups)
+    order = np.lexsort((single[:, 0], keys))
+    rows_sorted, keys = single[order], keys[order]
+
+    # cut sorted rows at the first group boundary after every CHUNK_ROWS
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    cuts = np.unique(starts[np.minimum(np.searchsorted(
+        starts, np.arange(0, n, CHUNK_ROWS)), len(starts) - 1)])
+    chunks = list(zip(cuts.tolist(), cuts[1:].tolist() + [n]))
+
+    def kernel(chunk):
+        low, high = chunk
+        return _sweep_groups(rows_sorted[low:high], keys[low:high], low,
+                             error)
+
+    # ThreadPoolExecutor(None) would start min(32, cpu + 4) threads
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) == 1:
+        results = list(map(kernel, chunks))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(kernel, chunks))
+
+    group_ids = np.concatenate([r[0] for r in results])
+    first = order[np.concatenate([r[2] for r in results])]
+    second = order[np.concatenate([r[3] for r in results])]
+
+    if error is None:
+        d2 = np.concatenate([r[1] for r in results])
+    elif not len(group_ids):
+        # no group of 2 rows or more
+        return []
+    else:
+        # closest candidate of each group measured in float64
+        d2 = _d2(coords[first].astype(float), coords[second].astype(float))
+        low, high = np.minimum(first, second), np.maximum(first, second)
+        best = np.lexsort((high, low, d2, group_ids))
+        best = best[np.r_[True, group_ids[best][1:] !=
+                          group_ids[best][:-1]]]
+        group_ids, d2, first, second = group_ids[best], d2[best], \
+            first[best], second[best]
+
+    dists = np.sqrt(d2)
+
+    return list(zip(group_ids.tolist(), dists.tolist(),
+                    np.minimum(first, second).tolist(),
+                    np.maximum(first, second).tolist()))
+
+
+def _sweep_groups(rows, keys, offset, error=None):
+    """
+    Return (group ids, squared distances, i, j) of the closest pair of each
+    group with 2 rows or more, rows sorted by (group, x). Indices are into
+    the sorted rows plus offset.
+
+    With error, a function bounding the error of distances measured on the
+    rows, return every pair of a group within its best distance plus twice
+    the error of it instead, one entry per pair.
+    """
+    n = len(rows)
+    values = rows[:, 0]
+
+    new_group = np.r_[True, keys[1:] != keys[:-1]]
+    group_of = np.cumsum(new_group) - 1
+    best = np.full(int(group_of[-1]) + 1, np.inf)
+    best_i = np.zeros(len(best), dtype=np.int64)
+    best_j = np.zeros(len(best), dtype=np.int64)
+    limit = best.copy()
+    found = []
+
+    active = np.arange(n)
+    shift = 1
+    while len(active):
+        # keep rows with a same group row shift places on, close enough on x
+        active = active[active < n - shift]
+        active = active[group_of[active + shift] == group_of[active]]
+        gap = values[active + shift] - values[active]
+        active = active[gap * gap < limit[group_of[active]]]
+        if not len(active):
+            break
+
+        group = group_of[active]
+        diff = rows[active + shift] - rows[active]
+        d2 = np.einsum("ij,ij->i", diff, diff)
+
+        better = d2 < best[group]
+        if better.any():
+            # smallest improvement of each group
+            a, g, d = active[better], group[better], d2[better]
+            order = np.lexsort((d, g))
+            a, g, d = a[order], g[order], d[order]
+            first = np.r_[True, g[1:] != g[:-1]]
+            a, g, d = a[first], g[first], d[first]
+
+            best[g] = d
+            best_i[g] = a
+            best_j[g] = a + shift
+
+            if error is None:
+                limit[g] = d
+            else:
+                # a closer pair measures at most twice the error above best
+                dist = np.sqrt(d)
+                limit[g] = (dist + 2 * error(dist))**2
+
+        if error is not None:
+            near = d2 <= limit[group]
+            found.append(active[near])
+            found.append(active[near] + shift)
+
+        shift += 1
+
+    if error is not None:
+        first = np.concatenate(found[0::2] + [[]]).astype(np.int64)
+        second = np.concatenate(found[1::2] + [[]]).astype(np.int64)
+        group = group_of[first]
+        near = _d2(rows[first], rows[second]) <= limit[group]
+        first, second, group = first[near], second[near], group[near]
+        return (keys[new_group][group], None, first + offset,
+                second + offset)
+
+    found = np.isfinite(best)
+    return (keys[new_group][found], best[found], best_i[found] + offset,
+            best_j[found] + offset)
+
+
+def _sweep_groups_py(rows, groups):
+    """Return closest_pair_groups() of a 2D memoryview without numpy"""
+    n, dim = rows.shape
+    order = sorted(range(n), key=lambda i: (groups[i], rows[i, 0]))
+
+    results = []
+    low = 0
+    while low < n:
+        group = groups[order[low]]
+        high = low + 1
+        while high < n and groups[order[high]] == group:
+            high += 1
+
+        best, best_i, best_j = math.inf, None, None
+        for a in range(low, high - 1):
+            i = order[a]
+            for b in range(a + 1, high):
+                j = order[b]
+
+                if (rows[j, 0] - rows[i, 0])**2 >= best:
+                    break
+
+                d2 = sum((rows[i, d] - rows[j, d])**2 for d in range(dim))
+                if d2 < best:
+                    best, best_i, best_j = d2, i, j
+
+        if best_i is not None:
+            results.append((group, math.sqrt(best), min(best_i, best_j),
+                            max(best_i, best_j)))
+        low = high
+
+    return results
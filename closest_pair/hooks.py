@@ -0,0 +1,77 @@
+"""
+Progress and cancellation hooks for long running engines
+    - ProgressHook: Report the fraction of work done and stop on request
+    - Cancelled: Raised by an engine stopped by its hook
+"""
+import time
+
+# most times the clock and cancel event are checked per run
+CHECKS = 1024
+
+
+class Cancelled(Exception):
+    """Raised by an engine when its hook is cancelled"""
+
+
+class ProgressHook(object):
+    """
+    Progress callback and cancellation for closest_pair_kd(),
+    bf_closest_pair_kd() and bf_closest_pair_blocked().
+
+    An engine calls start() with its total units of work, then advance()
+    as it goes: points reaching a base case of the recursion, pairs of
+    brute force rows or tiles of the blocked brute force. The clock and
+    cancel event are only checked every 1/CHECKS of the total, so advance()
+    is an addition and a comparison most of the time. callback(fraction) is
+    called at most once per interval seconds, and always with 1.0 at the
+    end of a run that was not cancelled.
+
+    Parameters
+    ----------
+    callback (callable): Called with the fraction done from 0.0 to 1.0
+    cancel (threading.Event): Raise Cancelled in the engine when set
+    interval (float): Least seconds between two callbacks
+    """
+
+    def __init__(self, callback=None, cancel=None, interval=0.1):
+        self.callback = callback
+        self.cancel = cancel
+        self.interval = interval
+        self.total = 0
+        self.done = 0
+        self._step = 1
+        self._next = 1
+        self._last = None
+
+    def start(self, total):
+        """Start a run of total units of work"""
+        self.total = max(total, 1)
+        self.done = 0
+        self._step = max(self.total // CHECKS, 1)
+        self._next = self._step
+        self._last = None
+        self.check()
+
+    def advance(self, units=1):
+        """Add units of work done, checking the hook once per step"""
+        self.done += units
+        if self.done >= self._next:
+            self._next = self.done + self._step
+            self.check()
+
+    def check(self):
+        """Raise Cancelled if cancel is set, else report progress if due"""
+        if self.cancel is not None and self.cancel.is_set():
+            raise Cancelled()
+
+        if self.callback is not None:
+            now = time.perf_counter()
+            if self._last is None or now - self._last >= self.interval:
+                self._last = now
+                self.callback(min(self.done / self.total, 1.0))
+
+    def finish(self):
+        """End the run, reporting it fully done"""
+        self.done = self.total
+        if self.callback is not None:
+            self.callback(1.0)
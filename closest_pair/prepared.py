@@ -0,0 +1,165 @@
+"""
+Prepared points for repeated closest pair queries
+    - PreparedPoints: Points with per-axis orderings kept between queries
+"""
+import heapq
+from array import array
+
+from .closest_pair_2d import Point, closest_2d
+from .closest_pair_kd import closest_kd
+from .utils import PairResult, distance
+
+
+class PreparedPoints(object):
+    """
+    Points sorted once on every axis, kept as arrays of indices. Closest pair
+    queries on all points or on a subset reuse the orderings instead of
+    sorting again, and the closest pair of all points is cached until more
+    points are added.
+
+    Appending a small batch sorts only the batch and merges it into each
+    ordering. The cached closest pair is then updated by comparing each new
+    point with the points within the best distance of it on the first axis.
+
+    Parameters
+    ----------
+    points (iterable): Point or tuple of kth dimensions.
+    """
+
+    def __init__(self, points):
+        self._points = []
+        self._orders = None
+        self._best = None
+        self.dim = None
+        self.extend(points)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __getitem__(self, index):
+        return self._points[index]
+
+    def order(self, axis):
+        """Return indices of the points sorted on an axis"""
+        return self._orders[axis]
+
+    def extend(self, points):
+        """
+        Append points, merging them into the orderings.
+
+        Time Complexity: O(kn + b logb) for b new points, plus the points
+        within the closest distance of each new point when cached
+        """
+        points = list(points)
+        if not points:
+            return
+
+        low = len(self._points)
+        self._points.extend(points)
+        all_points = self._points
+
+        if self.dim is None:
+            self.dim = len(points[0])
+            self._orders = [array("q") for d in range(self.dim)]
+
+        batch = range(low, len(all_points))
+        for d in range(self.dim):
+            def key(i, d=d):
+                return all_points[i][d]
+
+            # old indices come first on ties, so the merge is stable
+            self._orders[d] = array("q", heapq.merge(
+                self._orders[d], sorted(batch, key=key), key=key))
+
+        if self._best is not None:
+            self._best = self._update_best(low)
+
+    def closest_pair(self):
+        """
+        Find closest pair of all points, cached between calls.
+
+        Time Complexity: O(nlogn) without sorting, O(1) when cached
+
+        Return
+        ------
+        {"distance": float, "pair": Point}
+        """
+        if self._best is None:
+            self._best = self._closest(None)
+
+        min_dist, point_a, point_b = self._best
+        return PairResult(min_dist, (point_a, point_b))
+
+    def closest_pair_subset(self, indices):
+        """
+        Find closest pair of the points at the given indices. The orderings
+        are filtered, not sorted again.
+
+        Time Complexity: O(kn + mlogm) for m points in the subset
+
+        Parameters
+        ----------
+        indices (iterable): Indices of points
+
+        Return
+        ------
+        {"distance": float, "pair": Point}
+        """
+        keep = bytearray(len(self._points))
+        for i in indices:
+            keep[i] = 1
+
+        min_dist, point_a, point_b = self._closest(keep)
+        return PairResult(min_dist, (point_a, point_b))
+
+    def _closest(self, keep):
+        """Return (distance, Point, Point) of the points kept, all if None"""
+        points = self._points
+        if keep is None:
+            points_xsorted = [points[i] for i in self._orders[0]]
+        else:
+            points_xsorted = [points[i] for i in self._orders[0] if keep[i]]
+
+        n = len(points_xsorted)
+        if n < 2:
+            raise IndexError()
+
+        # on a line the closest pair is two neighbors
+        if self.dim == 1:
+            return min(((distance(a, b), a, b) for a, b in
+                        zip(points_xsorted, points_xsorted[1:])),
+                       key=lambda pair: pair[0])
+
+        if isinstance(points_xsorted[0], Point):
+            if keep is None:
+                points_ysorted = [points[i] for i in self._orders[1]]
+            else:
+                points_ysorted = [points[i] for i in self._orders[1]
+                                  if keep[i]]
+            return closest_2d(points_xsorted, 0, n - 1, points_ysorted)
+
+        return closest_kd(points_xsorted, 0, n - 1, self.dim)
+
+    def _update_best(self, low):
+        """
+        Return the cached closest pair updated with points from index low on,
+        comparing them to points within the best distance on the first axis.
+        """
+        points, order = self._points, self._orders[0]
+        best = self._best
+
+        for pos, i in enumerate(order):
+            if i < low:
+                continue
+
+            point = points[i]
+            for step in (-1, 1):
+                other = pos + step
+                while 0 <= other < len(order) and \
+                        abs(points[order[other]][0] - point[0]) < best[0]:
+                    dist = distance(points[order[other]], point)
+                    if dist < best[0]:
+                        best = (dist, points[order[other]], point)
+                    other += step
+
+        return best
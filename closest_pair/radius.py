@@ -0,0 +1,125 @@
+"""
+Fixed-radius near neighbors in kth dimensions
+    - fixed_radius_pairs: Generate every pair of points within distance r
+    - k_closest_pairs: The k closest pairs of points
+"""
+import heapq
+import itertools
+
+from .closest_pair_kd import closest_pair_kd
+from .utils import distance
+
+
+def fixed_radius_pairs(points, r):
+    """
+    Generate every pair of points within distance r (inclusive) using a cell
+    hash grid of side r. Pairs are streamed one at a time, so the output is
+    never held in memory at once.
+
+    Each point is hashed to the cell floor(coord / r) on every axis. A pair
+    within distance r differs by less than one cell on every axis, so a point
+    only needs to be compared to points in its own and adjacent cells (3^k
+    cells). When fewer cells than that are occupied, as in high dimensions,
+    the occupied cells are probed instead. Points are inserted as they are
+    visited, which reports each pair exactly once in the same (earlier,
+    later) order as bf_pairlist_kd().
+
+    Time Complexity: O(min(3^k, n) n + m) for m reported pairs at bounded
+    density
+
+    Parameters
+    ----------
+    points (iterable): Point or tuple of kth dimensions.
+    r (float): Maximum distance of a pair (inclusive), must be non-negative.
+
+    Yield
+    -----
+    (Point, Point, float)
+    """
+    if r < 0:
+        raise ValueError("Radius must be non-negative.")
+
+    points = iter(points)
+    first = next(points, None)
+    if first is None:
+        return
+
+    dim = len(first)
+    neighbors = 3**dim
+    offsets = None
+
+    grid = {}
+    for point in itertools.chain((first,), points):
+        cell = _cell(point, r, dim)
+
+        # radius 0 only matches duplicates, so hash exact coordinates instead
+        if r == 0:
+            near = (grid.get(cell, ()),)
+        elif neighbors <= len(grid):
+            if offsets is None:
+                offsets = list(itertools.product((-1, 0, 1), repeat=dim))
+            near = (grid.get(tuple(c + o for c, o in zip(cell, offset)), ())
+                    for offset in offsets)
+        else:
+            # fewer occupied cells than neighbors in high dimensions
+            near = (others for key, others in grid.items()
+                    if all(-1 <= c - o <= 1 for c, o in zip(cell, key)))
+
+        # compare point against earlier points in surrounding cells
+        for others in near:
+            for other in others:
+                dist = distance(other, point)
+                if dist <= r:
+                    yield (other, point, dist)
+
+        grid.setdefault(cell, []).append(point)
+
+
+def k_closest_pairs(points, k):
+    """
+    Find the k closest pairs of points. Starting from the closest pair
+    distance, the search radius doubles until fixed_radius_pairs() finds at
+    least k pairs, which then hold the k closest.
+
+    Time Complexity: O(nlogn + m log(D/delta)) for m pairs within the final
+    radius and D the spread of the points
+
+    Parameters
+    ----------
+    points (list): List of Point or tuple of kth dimensions.
+    k (int): Number of pairs
+
+    Return
+    ------
+    [(Point, Point, float)] sorted by distance
+    """
+    n = len(points)
+
+    if n < 2:
+        raise IndexError()
+    if k < 1:
+        raise ValueError("k must be positive.")
+
+    k = min(k, n * (n - 1) // 2)
+    dim = len(points[0])
+
+    # every pair is within the diagonal of the bounding box, with a margin
+    # for rounding
+    spread = distance([min(p[d] for p in points) for d in range(dim)],
+                      [max(p[d] for p in points) for d in range(dim)])
+    spread *= 1 + 1e-9
+    r = closest_pair_kd(points)["distance"] or spread / n
+
+    while True:
+        pairs = heapq.nsmallest(k, fixed_radius_pairs(points, r),
+                                key=lambda pair: pair[2])
+        if len(pairs) == k or r >= spread:
+            return pairs
+        r = min(2 * r, spread)
+
+
+def _cell(point, r, dim):
+    """Return grid cell key of a point for cell side r"""
+    if r == 0:
+        return tuple(point[d] for d in range(dim))
+    return tuple(int(point[d] // r) for d in range(dim))
@@ -0,0 +1,206 @@
+"""
+Range closest pair queries
+    - RangeIndex: k-d tree answering closest pair queries inside a box
+"""
+import itertools
+
+from .closest_pair_kd import bf_closest_kd, closest_kd, strip_closest_kd
+from .utils import PairResult, distance
+
+# points per leaf of the tree
+LEAF_SIZE = 16
+
+
+class _Node(object):
+    """Node of the tree over points[low:high]"""
+    __slots__ = ("low", "high", "bbox_min", "bbox_max", "best", "left",
+                 "right")
+
+    def __init__(self, low, high, bbox_min, bbox_max, best):
+        self.low = low
+        self.high = high
+        self.bbox_min = bbox_min
+        self.bbox_max = bbox_max
+        self.best = best
+        self.left = None
+        self.right = None
+
+
+class RangeIndex(object):
+    """
+    k-d tree over points where every node keeps the bounding box and the
+    closest pair of its points. Built once, it answers closest pair queries
+    inside axis-aligned boxes without running a full closest pair on the
+    points in the box.
+
+    A query collects the nodes inside the box and the points of leaves
+    crossing it. The smallest closest pair of the collected nodes bounds the
+    answer by delta. A closer pair across nodes can only use points within
+    delta of the bounding box of their node, so only those points and the
+    leaf points go into a hash grid of side delta, comparing points of
+    neighboring cells.
+
+    Build Time Complexity: O(n(logn)^2)
+
+    Parameters
+    ----------
+    points (list): List of Point or tuple of kth dimensions.
+    leaf_size (int): Most points of a leaf
+    """
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        if len(points) < 2:
+            raise IndexError()
+
+        self.dim = len(points[0])
+        self.leaf_size = max(leaf_size, 3)
+        self._points = list(points)
+        self._root = self._build(0, len(self._points))
+
+    def __len__(self):
+        return len(self._points)
+
+    def closest_pair(self):
+        """Return the closest pair of all points"""
+        min_dist, point_a, point_b = self._root.best
+        return PairResult(min_dist, (point_a, point_b))
+
+    def closest_pair_in_range(self, low, high):
+        """
+        Find closest pair of points inside the box low <= point <= high.
+
+        Time Complexity: O(n^(1-1/k)) to visit the nodes crossing the box,
+        plus O(3^k m) for the grid over the m points near node boundaries
+
+        Parameters
+        ----------
+        low (tuple): Lower corner of the box (inclusive)
+        high (tuple): Upper corner of the box (inclusive)
+
+        Return
+        ------
+        {"distance": float, "pair": Point}, None if the box holds less than
+        2 points
+        """
+        nodes, points, best = [], [], None
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+
+            if not _overlaps(node, low, high):
+                continue
+
+            if _contains(low, high, node) and node.best is not None:
+                nodes.append(node)
+                if best is None or node.best[0] < best[0]:
+                    best = node.best
+            elif node.left is None:
+                points.extend(p for p in self._points[node.low:node.high]
+                              if _inside(p, low, high))
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+        if best is None:
+            if len(points) < 2:
+                return None
+            points.sort(key=lambda p: p[0])
+            best = closest_kd(points, 0, len(points) - 1, self.dim)
+        elif best[0] > 0:
+            # a point at least delta inside its node only pairs within it
+            delta = best[0]
+            for node in nodes:
+                inner_low = tuple(c + delta for c in node.bbox_min)
+                inner_high = tuple(c - delta for c in node.bbox_max)
+                self._boundary(node, inner_low, inner_high, points)
+            best = self._grid_closest(points, best)
+
+        min_dist, point_a, point_b = best
+        return PairResult(min_dist, (point_a, point_b))
+
+    def _build(self, low, high):
+        """Build the node of points[low:high], splitting on the widest axis"""
+        points = self._points
+        node_points = points[low:high]
+        bbox_min = tuple(min(p[d] for p in node_points)
+                         for d in range(self.dim))
+        bbox_max = tuple(max(p[d] for p in node_points)
+                         for d in range(self.dim))
+
+        if high - low <= self.leaf_size:
+            best = bf_closest_kd(node_points) if high - low > 1 else None
+            return _Node(low, high, bbox_min, bbox_max, best)
+
+        axis = max(range(self.dim), key=lambda d: bbox_max[d] - bbox_min[d])
+        points[low:high] = sorted(node_points, key=lambda p: p[axis])
+        mid = (low + high) // 2
+        split = points[mid - 1][axis]
+
+        # children sort their own halves again
+        left = self._build(low, mid)
+        right = self._build(mid, high)
+
+        # node closest pair from the children and the pairs across the split
+        best = left.best if left.best[0] <= right.best[0] else right.best
+        delta = best[0]
+        strip_left = [p for p in points[low:mid] if split - p[axis] < delta]
+        strip_right = [p for p in points[mid:high] if p[axis] - split < delta]
+        best = strip_closest_kd(strip_left, strip_right, best, self.dim,
+                                axis)
+
+        node = _Node(low, high, bbox_min, bbox_max, best)
+        node.left, node.right = left, right
+        return node
+
+    def _boundary(self, node, inner_low, inner_high, out):
+        """Add points of node outside the inner box to out"""
+        if _contains(inner_low, inner_high, node):
+            return
+
+        if node.left is None:
+            out.extend(p for p in self._points[node.low:node.high]
+                       if not _inside(p, inner_low, inner_high))
+        else:
+            self._boundary(node.left, inner_low, inner_high, out)
+            self._boundary(node.right, inner_low, inner_high, out)
+
+    def _grid_closest(self, points, best):
+        """
+        Return best or a closer pair of points, comparing points of
+        neighboring cells of a grid of side best distance.
+        """
+        delta = best[0]
+        offsets = list(itertools.product((-1, 0, 1), repeat=self.dim))
+        grid = {}
+
+        for point in points:
+            cell = tuple(int(point[d] // delta) for d in range(self.dim))
+
+            for offset in offsets:
+                key = tuple(c + o for c, o in zip(cell, offset))
+                for other in grid.get(key, ()):
+                    dist = distance(other, point)
+                    if dist < best[0]:
+                        best = (dist, other, point)
+
+            grid.setdefault(cell, []).append(point)
+
+        return best
+
+
+def _overlaps(node, low, high):
+    """Return True if the bounding box of node meets the box"""
+    return all(node.bbox_min[d] <= high[d] and low[d] <= node.bbox_max[d]
+               for d in range(len(low)))
+
+
+def _contains(low, high, node):
+    """Return True if the bounding box of node is inside the box"""
+    return all(low[d] <= node.bbox_min[d] and node.bbox_max[d] <= high[d]
+               for d in range(len(low)))
+
+
+def _inside(point, low, high):
+    """Return True if point is inside the box"""
+    return all(low[d] <= point[d] <= high[d] for d in range(len(low)))
@@ -0,0 +1,157 @@
+"""
+Benchmark results store
+    - save_run: Save the plotted series of a benchmark run as JSON
+    - load_runs: Load stored runs, oldest first
+    - group_axes: Group the plots of stored runs to overlay them
+    - environment: CPU, Python and commit of this run
+
+Every run is one JSON file in RESULTS_DIR:
+    {"id": str, "task": str, "environment": {...},
+     "axes": [{"title": str, "xlabel": str, "ylabel": str,
+               "series": [{"label": str, "x": [n], "y": [seconds]}]}]}
+"""
+import datetime
+import glob
+import json
+import os
+import platform
+import subprocess
+
+RESULTS_DIR = os.path.join("benchmark_data", "runs")
+
+
+def environment():
+    """Return CPU, Python version and git commit of this process"""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:  # numpy engines fall back to pure python
+        numpy_version = None
+
+    return {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "cpu": _cpu(),
+        "cpus": os.cpu_count(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": numpy_version,
+        "commit": _commit()
+    }
+
+
+def figure_axes(figure):
+    """
+    Return the axes of a matplotlib figure as dicts of title, labels and
+    the x and y data of every line.
+    """
+    return [{
+        "title": axes.get_title(),
+        "xlabel": axes.get_xlabel(),
+        "ylabel": axes.get_ylabel(),
+        "series": [{"label": line.get_label(),
+                    "x": [float(x) for x in line.get_xdata()],
+                    "y": [float(y) for y in line.get_ydata()]}
+                   for line in axes.get_lines()]
+    } for axes in figure.axes]
+
+
+def save_run(task, figures, directory=RESULTS_DIR, env=None):
+    """
+    Save the plots of a benchmark run.
+
+    Parameters
+    ----------
+    task (str): Name of the benchmark
+    figures (list): matplotlib figures drawn by the benchmark
+    directory (str): Directory of the runs
+    env (dict): Environment of the run. Default is environment().
+
+    Return
+    ------
+    str: Path of the JSON file
+    """
+    env = environment() if env is None else env
+    stamp = env["time"].replace("-", "").replace(":", "").replace("T", "-")
+    commit = env["commit"][:7] if env["commit"] else "nocommit"
+    run_id = f"{stamp}-{commit}"
+
+    run = {
+        "id": run_id,
+        "task": task,
+        "environment": env,
+        "axes": [axes for figure in figures for axes in figure_axes(figure)]
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{run_id}-{task}.json")
+    with open(path, "w") as file:
+        json.dump(run, file, indent=1)
+
+    return path
+
+
+def load_runs(directory=RESULTS_DIR, task=None):
+    """
+    Load stored runs, oldest first.
+
+    Parameters
+    ----------
+    directory (str): Directory of the runs
+    task (str): Only runs of this benchmark, all if None
+
+    Return
+    ------
+    [dict]: Runs as saved by save_run()
+    """
+    runs = []
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        with open(path) as file:
+            run = json.load(file)
+        if task is None or run["task"] == task:
+            runs.append(run)
+
+    return sorted(runs, key=lambda run: (run["environment"]["time"],
+                                         run["id"]))
+
+
+def group_axes(runs):
+    """
+    Group the axes of runs by task and position, keeping run order.
+
+    Return
+    ------
+    {(str, int): [(run, axes)]} of (task, axes index) to the runs that
+    drew it
+    """
+    groups = {}
+    for run in runs:
+        for index, axes in enumerate(run["axes"]):
+            groups.setdefault((run["task"], index), []).append((run, axes))
+
+    return groups
+
+
+def _cpu():
+    """Return the CPU model name"""
+    try:
+        with open("/proc/cpuinfo") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:  # not linux
+        pass
+
+    return platform.processor() or platform.machine()
+
+
+def _commit():
+    """Return the git commit of this checkout, None outside git"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):  # no git
+        return None
+
+    return result.stdout.strip() or None
@@ -0,0 +1,478 @@
+"""
+Local closest pair query service
+    - ClosestPairServer: Asyncio server over a unix socket or localhost TCP
+    - ClosestPairClient: Blocking client of ClosestPairServer
+
+Start a server from the command line with
+    python3 -m closest_pair.service --unix /tmp/closest_pair.sock
+    python3 -m closest_pair.service --port 8765
+
+Protocol
+--------
+Every message is little-endian binary. A request is a REQUEST header
+(op, n, dim, k) followed by n * dim float64 coordinates in row order, then
+dim more for the query point of OP_NEAREST.
+
+Requests of more than the server max_size coordinates or points, or of
+points with no coordinates, get an error response, and the connection is
+closed without reading their payload.
+
+A response is a RESPONSE header (status, count). On STATUS_OK, count
+RECORD (i, j, distance) follow, where i and j are row indices. On
+STATUS_ERROR, count bytes of utf-8 error message follow.
+    - OP_CLOSEST: 1 record, the closest pair
+    - OP_K_CLOSEST: k records sorted by distance
+    - OP_NEAREST: 1 record (i, n), the nearest row i to the query row n
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import socket
+import struct
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from . import groups
+from .closest_pair_kd import nearest_neighbor_kd
+from .dispatch import closest_pair
+from .radius import k_closest_pairs
+from .utils import PairResult, distance
+
+OP_CLOSEST, OP_K_CLOSEST, OP_NEAREST = 1, 2, 3
+STATUS_OK, STATUS_ERROR = 0, 1
+
+REQUEST = struct.Struct("<BIII")
+RESPONSE = struct.Struct("<BI")
+RECORD = struct.Struct("<IId")
+
+# most coordinates (n * dim) of a request, 128 MB of float64
+MAX_SIZE = 1 << 24
+
+
+class ServiceError(Exception):
+    """Error returned by the server for a request"""
+
+
+class ClosestPairServer(object):
+    """
+    Asyncio closest pair query server listening on a unix domain socket, or
+    on localhost TCP when no path is given.
+
+    Small requests arriving within batch_delay of each other are coalesced
+    and run as one batch on a worker thread, which saves a thread handoff
+    per request. Closest pair requests of the same dimension in a batch are
+    solved by a single closest_pair_groups() call. Requests of heavy_size
+    coordinates or more run on a process pool so they neither hold the GIL
+    nor delay the small ones.
+
+    Parameters
+    ----------
+    path (str): Unix domain socket path
+    host (str): TCP host when path is None
+    port (int): TCP port when path is None, 0 picks a free port
+    batch_delay (float): Seconds to wait for more small requests
+    max_batch (int): Maximum number of requests per batch
+    heavy_size (int): Coordinates (n * dim) of a heavy request
+    processes (int): Size of the process pool, None for one per cpu
+    max_size (int): Most coordinates (n * dim) and points (n) of a request
+    """
+
+    def __init__(self, path=None, host="127.0.0.1", port=0, batch_delay=0.002,
+                 max_batch=64, heavy_size=200000, processes=None,
+                 max_size=MAX_SIZE):
+        self.path = path
+        self.host = host
+        self.port = port
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self.heavy_size = heavy_size
+        self.processes = processes
+        self.max_size = max_size
+        self.address = None
+        self._server = None
+        self._pool = None
+        self._batch = []
+        self._flush_handle = None
+        self._loop = None
+        self._thread = None
+
+    async def start(self):
+        """Start listening, sets self.address"""
+        self._loop = asyncio.get_running_loop()
+
+        if self.path:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = await asyncio.start_unix_server(self._handle,
+                                                           self.path)
+            self.address = self.path
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host,
+                                                      self.port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """Start and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and shut down the process pool"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def start_in_thread(self):
+        """Serve on a background thread, return once listening"""
+        ready = threading.Event()
+
+        async def main():
+            await self.start()
+            ready.set()
+            await self.serve_forever()
+
+        def run():
+            try:
+                asyncio.run(main())
+            except asyncio.CancelledError:
+                pass
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self):
+        """Stop a server started with start_in_thread()"""
+        if self._thread is None:
+            return
+
+        def cancel():
+            for task in asyncio.all_tasks(self._loop):
+                task.cancel()
+
+        self._loop.call_soon_threadsafe(cancel)
+        self._thread.join()
+        self._thread = None
+
+    async def _handle(self, reader, writer):
+        """Answer requests of one connection in order"""
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+
+                op, n, dim, k = REQUEST.unpack(header)
+                size = n * dim + (dim if op == OP_NEAREST else 0)
+
+                error = None
+                if n and not dim:
+                    error = "Points of 0 dimensions."
+                elif n > self.max_size:
+                    error = f"{n} points, more than the maximum of " \
+                        f"{self.max_size}."
+                elif size > self.max_size:
+                    error = f"{size} coordinates, more than the maximum " \
+                        f"of {self.max_size}."
+
+                # the payload is not read, so the stream can't go on
+                if error:
+                    writer.write(encode_error(ValueError(error)))
+                    await writer.drain()
+                    break
+
+                payload = await reader.readexactly(8 * size)
+
+                try:
+                    records = await self._submit((op, n, dim, k, payload))
+                    writer.write(encode_response(records))
+                except Exception as err:
+                    writer.write(encode_error(err))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError,
+                asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _submit(self, request):
+        """Run a request on the process pool or in the next batch"""
+        _, n, dim, _, _ = request
+
+        if n * dim >= self.heavy_size:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.processes)
+            return await self._loop.run_in_executor(self._pool, execute,
+                                                    *request)
+
+        future = self._loop.create_future()
+        self._batch.append((request, future))
+
+        if len(self._batch) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_delay,
+                                                       self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send the pending batch to a worker thread"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+
+        requests = [request for request, _ in batch]
+        futures = [future for _, future in batch]
+        task = self._loop.run_in_executor(None, execute_batch, requests)
+
+        def done(task):
+            if task.cancelled():
+                for future in futures:
+                    future.cancel()
+                return
+
+            try:
+                results = task.result()
+            except Exception as err:  # eg. the executor is shut down
+                results = [(False, err)] * len(futures)
+
+            for future, (ok, value) in zip(futures, results):
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+        task.add_done_callback(done)
+
+
+class ClosestPairClient(object):
+    """
+    Blocking client of ClosestPairServer. Pairs are returned as row indices
+    into the points sent.
+
+    Parameters
+    ----------
+    path (str): Unix domain socket path
+    host (str): TCP host when path is None
+    port (int): TCP port when path is None
+    timeout (float): Socket timeout in seconds
+    """
+
+    def __init__(self, path=None, host="127.0.0.1", port=None, timeout=None):
+        if path:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            self._sock.connect(path)
+        else:
+            self._sock = socket.create_connection((host, port), timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._sock.close()
+
+    def closest_pair(self, points):
+        """
+        Return {"distance": float, "pair": (int, int)} of points.
+        """
+        i, j, dist = self._request(OP_CLOSEST, points)[0]
+        return PairResult(dist, (i, j))
+
+    def k_closest_pairs(self, points, k):
+        """
+        Return [(int, int, float)] of the k closest pairs by distance.
+        """
+        return self._request(OP_K_CLOSEST, points, k)
+
+    def nearest_neighbor(self, points, query):
+        """
+        Return {"distance": float, "pair": (int, n)} where n stands for the
+        query point.
+        """
+        i, j, dist = self._request(OP_NEAREST, points, query=query)[0]
+        return PairResult(dist, (i, j))
+
+    def _request(self, op, points, k=0, query=None):
+        """Send a request and return its records"""
+        n = len(points)
+        dim = len(points[0]) if n else len(query or ())
+
+        self._sock.sendall(encode_request(op, points, dim, k, query))
+
+        status, count = RESPONSE.unpack(self._recv(RESPONSE.size))
+        if status != STATUS_OK:
+            raise ServiceError(self._recv(count).decode())
+
+        data = self._recv(count * RECORD.size)
+        return [record for record in RECORD.iter_unpack(data)]
+
+    def _recv(self, size):
+        """Read exactly size bytes"""
+        data = bytearray()
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Server closed the connection.")
+            data += chunk
+        return bytes(data)
+
+
+def encode_request(op, points, dim, k=0, query=None):
+    """Return request bytes of points, a list of Point or tuple"""
+    coords = array("d", itertools.chain.from_iterable(
+        [point[d] for d in range(dim)] for point in points))
+    if query is not None:
+        coords.extend(query[d] for d in range(dim))
+    if sys.byteorder == "big":
+        coords.byteswap()
+
+    return REQUEST.pack(op, len(points), dim, k) + coords.tobytes()
+
+
+def encode_response(records):
+    """Return response bytes of records (i, j, distance)"""
+    return RESPONSE.pack(STATUS_OK, len(records)) + \
+        b"".join(RECORD.pack(*record) for record in records)
+
+
+def encode_error(err):
+    """Return response bytes of an exception"""
+    message = f"{type(err).__name__}: {err}".encode()
+    return RESPONSE.pack(STATUS_ERROR, len(message)) + message
+
+
+def execute(op, n, dim, k, payload):
+    """
+    Run one request on its coordinate payload.
+
+    Return
+    ------
+    [(int, int, float)]
+    """
+    coords = array("d")
+    coords.frombytes(payload)
+    if sys.byteorder == "big":
+        coords.byteswap()
+
+    points = [tuple(coords[i * dim:(i + 1) * dim]) for i in range(n)]
+    index = {id(point): i for i, point in enumerate(points)}
+
+    if op == OP_CLOSEST:
+        result = closest_pair(points)
+        pairs = [(*result["pair"], result["distance"])]
+    elif op == OP_K_CLOSEST:
+        pairs = k_closest_pairs(points, k)
+    elif op == OP_NEAREST:
+        query = tuple(coords[n * dim:])
+        result = nearest_neighbor_kd(points, query)
+        return [(index[id(result["pair"][0])], n, result["distance"])]
+    else:
+        raise ValueError(f"Unknown op {op}.")
+
+    return [(index[id(a)], index[id(b)], dist) for a, b, dist in pairs]
+
+
+def execute_batch(requests):
+    """
+    Run a batch of requests in one call. With numpy installed, closest pair
+    requests of the same dimension are solved together by one
+    closest_pair_groups() call, a group per request. Other requests run one
+    at a time.
+
+    Return
+    ------
+    [(True, records) or (False, exception)]
+    """
+    results = [None] * len(requests)
+    closest = {}
+    for r, (op, n, dim, _, _) in enumerate(requests):
+        if op == OP_CLOSEST and n >= 2 and groups.np is not None:
+            closest.setdefault(dim, []).append(r)
+
+    for dim, members in closest.items():
+        if len(members) < 2:
+            continue
+        try:
+            records = execute_closest([requests[r] for r in members], dim)
+            for r, record in zip(members, records):
+                results[r] = (True, record)
+        except Exception as err:
+            for r in members:
+                results[r] = (False, err)
+
+    for r, request in enumerate(requests):
+        if results[r] is not None:
+            continue
+        try:
+            results[r] = (True, execute(*request))
+        except Exception as err:
+            results[r] = (False, err)
+    return results
+
+
+def execute_closest(requests, dim):
+    """
+    Run closest pair requests of dim dimensions and 2 rows or more in one
+    closest_pair_groups() call. Pairs are measured again with distance(),
+    as execute() does.
+
+    Return
+    ------
+    [[(int, int, float)]] of each request
+    """
+    coords = array("d")
+    ids, offsets = [], []
+    for g, (_, n, _, _, payload) in enumerate(requests):
+        offsets.append(len(ids))
+        coords.frombytes(payload)
+        ids.extend(itertools.repeat(g, n))
+    if sys.byteorder == "big":
+        coords.byteswap()
+
+    records = [None] * len(requests)
+    for g, _, i, j in groups.closest_pair_groups(coords, ids, dim):
+        dist = distance(coords[i * dim:(i + 1) * dim],
+                        coords[j * dim:(j + 1) * dim])
+        records[g] = [(i - offsets[g], j - offsets[g], dist)]
+    return records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Closest pair query server")
+    parser.add_argument("--unix", help="unix domain socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ClosestPairServer(args.unix, args.host, args.port)
+    print(f"Serving on {args.unix or (args.host, args.port)}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("Interrupted")
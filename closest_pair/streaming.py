@@ -0,0 +1,192 @@
+"""
+Streaming Closest Pair of Points
+    - SlidingWindowClosestPair: Closest pair of the last W points or T seconds
+"""
+import itertools
+import time
+from collections import deque
+
+from .dispatch import closest_pair
+from .utils import PairResult, distance
+
+
+class SlidingWindowClosestPair(object):
+    """
+    Closest pair of points over a sliding window of a time-ordered stream of
+    Point or tuple of kth dimensions. The window keeps the last `size`
+    points, the points of the last `duration` seconds, or both.
+
+    The window is kept in a hash grid with cells of side about delta, the
+    current closest distance, so a pushed point only needs to be compared to
+    the points in its 3^k surrounding cells. The grid is rebuilt when delta
+    drops below half a cell, which keeps a bounded number of points per cell.
+
+    Expiring a point is O(1) unless it belongs to the closest pair. Then the
+    closest pair of the window is recomputed with closest_pair() before the
+    next result. For points in random order that happens with probability
+    2/W, so both operations are amortized O(logW) expected. A stream where
+    the expiring point is always part of the closest pair degrades to
+    O(WlogW) per event.
+
+    Parameters
+    ----------
+    size (int): Maximum number of points in the window (W)
+    duration (float): Maximum age of points in the window in seconds (T)
+    """
+
+    def __init__(self, size=None, duration=None):
+        if size is None and duration is None:
+            raise ValueError("Window needs a size or a duration.")
+        if size is not None and size < 2:
+            raise ValueError("Window size must be at least 2.")
+
+        self.size = size
+        self.duration = duration
+        self._window = deque()  # (timestamp, point) in arrival order
+        self._grid = {}
+        self._cell = None
+        self._offsets = None
+        self._min = None  # (distance, point_a, point_b)
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._window)
+
+    def push(self, point, timestamp=None):
+        """
+        Add a point to the window, expiring points that fall out of it.
+
+        Parameters
+        ----------
+        point (Point or tuple): New point of the stream
+        timestamp (float): Arrival time in seconds. Default is now.
+
+        Return
+        ------
+        {"distance": float, "pair": Point} or None if less than 2 points
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._window and timestamp < self._window[-1][0]:
+            raise ValueError("Timestamps must be non-decreasing.")
+
+        if self._offsets is None:
+            self._offsets = list(itertools.product((-1, 0, 1),
+                                                   repeat=len(point)))
+
+        if self.size is not None:
+            while len(self._window) >= self.size:
+                self._popleft()
+        self.expire(timestamp)
+
+        if self._dirty:
+            self._rebuild()
+
+        self._window.append((timestamp, point))
+
+        if self._min is None:
+            # second point sets the first delta and grid
+            if len(self._window) == 2:
+                first = self._window[0][1]
+                self._min = (distance(first, point), first, point)
+                self._regrid()
+            else:
+                self._insert(point)
+            return self.result()
+
+        # compare to points in surrounding cells closer than delta
+        min_dist, min_a, min_b = self._min
+        if min_dist > 0:
+            cell = self._cell_of(point)
+            for offset in self._offsets:
+                key = tuple(c + o for c, o in zip(cell, offset))
+                for other in self._grid.get(key, ()):
+                    dist = distance(other, point)
+                    if dist < min_dist:
+                        min_dist, min_a, min_b = dist, other, point
+            self._min = (min_dist, min_a, min_b)
+
+        # keep delta within half a cell, else rebuild grid
+        if 0 < min_dist < self._cell / 2:
+            self._regrid()
+        else:
+            self._insert(point)
+
+        return self.result()
+
+    def expire(self, now=None):
+        """
+        Remove points older than the window duration.
+
+        Parameters
+        ----------
+        now (float): Current time in seconds. Default is now.
+        """
+        if self.duration is None:
+            return
+        if now is None:
+            now = time.monotonic()
+
+        while self._window and self._window[0][0] <= now - self.duration:
+            self._popleft()
+
+    def result(self):
+        """
+        Return the closest pair of the window.
+
+        Return
+        ------
+        {"distance": float, "pair": Point} or None if less than 2 points
+        """
+        if self._dirty:
+            self._rebuild()
+        if self._min is None:
+            return None
+        return PairResult(self._min[0], self._min[1:])
+
+    def _popleft(self):
+        """Remove oldest point, marking the closest pair stale if needed"""
+        point = self._window.popleft()[1]
+
+        if self._cell is not None:
+            bucket = self._grid[self._cell_of(point)]
+            for i, other in enumerate(bucket):
+                if other is point:
+                    del bucket[i]
+                    break
+
+        if self._min is not None and \
+                (point is self._min[1] or point is self._min[2]):
+            self._min = None
+            self._dirty = len(self._window) > 1
+
+    def _rebuild(self):
+        """Recompute the closest pair of the window and its grid"""
+        self._dirty = False
+        if len(self._window) < 2:
+            return
+
+        points = [point for _, point in self._window]
+        result = closest_pair(points)
+        self._min = (result["distance"], *result["pair"])
+        self._regrid()
+
+    def _regrid(self):
+        """Rebuild grid of window points with cell side of delta"""
+        if self._min[0] > 0:
+            self._cell = self._min[0]
+        elif self._cell is None:
+            self._cell = 1.0
+
+        self._grid = {}
+        for _, point in self._window:
+            self._insert(point)
+
+    def _insert(self, point):
+        """Add point to grid"""
+        if self._cell is not None:
+            self._grid.setdefault(self._cell_of(point), []).append(point)
+
+    def _cell_of(self, point):
+        """Return grid cell key of a point"""
+        return tuple(int(point[d] // self._cell) for d in range(len(point)))
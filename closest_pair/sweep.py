@@ -0,0 +1,92 @@
+"""
+Sweep line Closest Pair of Points in xy plane
+    - closest_pair_sweep: Closest pair of an x-sorted iterable in one pass
+    - sweep_closest_pairs: Generate the running closest pair of x-sorted points
+"""
+import bisect
+import collections
+import math
+
+from .utils import PairResult, distance
+
+
+def closest_pair_sweep(points):
+    """
+    Find closest pair of points already sorted by x in one pass over the
+    iterable, see sweep_closest_pairs().
+
+    Time Complexity: O(n logb + nb) for a band of b points, O(nlogn) for
+    points of bounded density
+    Memory: O(b)
+
+    Parameters
+    ----------
+    points (iterable): Point or tuple (x, y) sorted by x.
+
+    Return
+    ------
+    {"distance": float, "pair": Point}
+    """
+    result = None
+    for result in sweep_closest_pairs(points):
+        pass
+
+    if result is None:
+        raise IndexError()
+    return result
+
+
+def sweep_closest_pairs(points):
+    """
+    Generate the closest pair so far of points sorted by x, each time it
+    gets closer. The last pair generated is the closest pair of all points.
+
+    A vertical sweep line moves over the points by x, keeping only the band
+    of points within delta of it, the closest distance so far. The band is
+    ordered by y, so a new point is only compared to the band points within
+    delta of it on y. Points leaving the band are dropped, so the whole input
+    is never held in memory and the generator can sit in a pipeline.
+
+    Parameters
+    ----------
+    points (iterable): Point or tuple (x, y) sorted by x.
+
+    Yield
+    -----
+    {"distance": float, "pair": Point}
+    """
+    band = collections.deque()  # (x, key) in x order, for eviction
+    band_y = []  # key (y, seq, point) in y order, for the search
+    delta, last_x = math.inf, -math.inf
+
+    for seq, point in enumerate(points):
+        x, y = point[0], point[1]
+
+        if x < last_x:
+            raise ValueError(f"Points must be sorted by x, {x} came after "
+                             f"{last_x}.")
+        last_x = x
+
+        # drop points that can no longer be within delta
+        while band and x - band[0][0] >= delta:
+            _, key = band.popleft()
+            del band_y[bisect.bisect_left(band_y, key)]
+
+        # compare to band points within delta on y
+        best = None
+        for index in range(bisect.bisect_left(band_y, (y - delta,)),
+                           len(band_y)):
+            other = band_y[index][2]
+            if other[1] - y >= delta:
+                break
+
+            dist = distance(other, point)
+            if dist < delta:
+                delta, best = dist, other
+
+        if best is not None:
+            yield PairResult(delta, (best, point))
+
+        key = (y, seq, point)
+        band.append((x, key))
+        bisect.insort(band_y, key)
@@ -1,5 +1,6 @@
 import math
 import random
+from collections.abc import Mapping
 
 
 def distance(point_a, point_b):
@@ -15,3 +16,50 @@ def gen_unique_kd_points(n, dim):
 def min_of_pairs(pair_a, pair_b):
     """Return closest pair of Points of two pair of Points"""
     return pair_a if pair_a["distance"] <= pair_b["distance"] else pair_b
+
+
+class PairResult(Mapping):
+    """
+    Immutable closest pair result. Reads like the dict
+    {"distance": float, "pair": Point} returned by the engines, so old callers
+    can keep using result["distance"] and compare it to a dict.
+    Extra keyword arguments become extra read-only keys.
+    """
+    __slots__ = ("_distance", "_pair", "_extra")
+
+    def __init__(self, distance, pair, **extra):
+        object.__setattr__(self, "_distance", distance)
+        object.__setattr__(self, "_pair", tuple(pair))
+        object.__setattr__(self, "_extra", extra)
+
+    @property
+    def distance(self):
+        return self._distance
+
+    @property
+    def pair(self):
+        return self._pair
+
+    def __getitem__(self, key):
+        if key == "distance":
+            return self._distance
+        elif key == "pair":
+            return self._pair
+        return self._extra[key]
+
+    def __iter__(self):
+        yield "distance"
+        yield "pair"
+        yield from self._extra
+
+    def __len__(self):
+        return 2 + len(self._extra)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PairResult is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("PairResult is immutable")
+
+    def __repr__(self):
+        return f"PairResult({dict(self)})"
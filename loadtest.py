@@ -0,0 +1,92 @@
+"""
+Load test for the closest pair query service
+
+Runs against a server started with
+    python3 -m closest_pair.service --unix /tmp/closest_pair.sock
+or against a local instance started in-process when no address is given.
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from closest_pair.service import ClosestPairClient, ClosestPairServer
+
+
+def worker(address, requests, n, dim, latencies, errors):
+    """Send requests from one client connection, recording latencies"""
+    path, port = address
+    with ClosestPairClient(path=path, port=port) as client:
+        for i in range(requests):
+            points = [tuple(random.uniform(-1000, 1000) for d in range(dim))
+                      for _ in range(n)]
+
+            start_time = time.perf_counter()
+            try:
+                if i % 3 == 0:
+                    client.closest_pair(points)
+                elif i % 3 == 1:
+                    client.k_closest_pairs(points, 5)
+                else:
+                    client.nearest_neighbor(points, points[0])
+            except Exception:
+                errors.append(i)
+            latencies.append(time.perf_counter() - start_time)
+
+
+def percentile(values, q):
+    """Return the q-th percentile of sorted values"""
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--unix", help="unix domain socket path of server")
+    parser.add_argument("--port", type=int, help="localhost TCP port of server")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests per client")
+    parser.add_argument("--n", type=int, default=100, help="points per request")
+    parser.add_argument("--dim", type=int, default=2)
+    args = parser.parse_args()
+
+    server = None
+    if not args.unix and not args.port:
+        path = os.path.join(tempfile.mkdtemp(), "closest_pair.sock")
+        server = ClosestPairServer(path).start_in_thread()
+        print(f"Started local server on {path}")
+        address = (path, None)
+    else:
+        address = (args.unix, args.port)
+
+    latencies, errors = [], []
+    threads = [threading.Thread(target=worker,
+                                args=(address, args.requests, args.n,
+                                      args.dim, latencies, errors))
+               for _ in range(args.clients)]
+
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start_time
+
+    if server:
+        server.stop()
+
+    latencies.sort()
+    print(f"\nLOAD TEST\n\n"
+          f"clients       {args.clients}\n"
+          f"requests      {len(latencies)} ({len(errors)} errors)\n"
+          f"points        {args.n} x {args.dim}D\n"
+          f"throughput    {len(latencies) / duration:.1f} requests/sec\n"
+          f"latency p50   {percentile(latencies, 50) * 1000:.2f} ms\n"
+          f"latency p95   {percentile(latencies, 95) * 1000:.2f} ms\n"
+          f"latency p99   {percentile(latencies, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
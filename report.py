@@ -0,0 +1,68 @@
+"""
+Regenerate benchmark plots from stored runs
+
+Draws every plot of the runs saved by benchmark.py in benchmark_data/runs
+again without timing anything, overlaying the runs of the same benchmark:
+    python3 -m report
+    python3 -m report --task recursion_2d --last 3 --show
+"""
+import argparse
+import os
+
+import matplotlib.pyplot as plt
+
+from closest_pair.results import RESULTS_DIR, group_axes, load_runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dir", default=RESULTS_DIR,
+                        help="directory of stored runs")
+    parser.add_argument("--out", default="benchmark_data",
+                        help="directory of the png files")
+    parser.add_argument("--task", help="only this benchmark, eg. "
+                        "recursion_2d")
+    parser.add_argument("--last", type=int,
+                        help="overlay only the last runs of each benchmark")
+    parser.add_argument("--show", action="store_true",
+                        help="show the plots instead of saving them")
+    args = parser.parse_args()
+
+    if not args.show:
+        plt.switch_backend("Agg")
+
+    runs = load_runs(args.dir, args.task)
+    if not runs:
+        print(f"No runs in {args.dir}, run benchmark.py first.")
+        return
+
+    for (task, index), drawn in group_axes(runs).items():
+        if args.last:
+            drawn = drawn[-args.last:]
+        axes = drawn[-1][1]
+
+        plt.figure()
+        for run, run_axes in drawn:
+            for series in run_axes["series"]:
+                # name runs apart when overlaid
+                label = series["label"] if len(drawn) == 1 else \
+                    f"{series['label']} ({run['id']})"
+                plt.plot(series["x"], series["y"], label=label)
+        plt.xlabel(axes["xlabel"])
+        plt.ylabel(axes["ylabel"])
+        plt.title(axes["title"])
+        plt.legend()  # show legend
+
+        if not args.show:
+            name = task if index == 0 else f"{task}_{index}"
+            path = os.path.join(args.out, f"{name}.png")
+            plt.savefig(path)
+            plt.close()
+            print(f"{path}: {len(drawn)} run(s)")
+
+    if args.show:
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -208,6 +208,37 @@ class Run(object):
         else:
             self.points.append(point)
 
+    def add_points(self, points):
+        """
+        Add many points to self.points, padded to the greatest dimension.
+        Duplicates are found with a set rather than scanning self.points for
+        each point, so loading n points takes O(n) instead of O(n^2).
+
+        Parameters
+        ----------
+        points (list): Point tuples to add
+
+        Return
+        ------
+        list: Indices into points of the duplicates, which are not added
+        """
+        dim = max([self.dim] + [len(point) for point in points])
+        if dim > self.dim:
+            self.pad_points(self.points, dim)
+            self.dim = dim
+
+        seen = set(self.points)
+        duplicates = []
+        for i, point in enumerate(points):
+            point = self.pad_point(point, dim)
+            if point in seen:
+                duplicates.append(i)
+            else:
+                seen.add(point)
+                self.points.append(point)
+
+        return duplicates
+
     def remove_point(self, point):
         """Remove a point from self.points"""
         try:
@@ -288,16 +319,21 @@ class Run(object):
             print("Path does not exist.")
             filename = self.input()
 
+        lines, points = [], []
         with open(filename) as file:
             print()
             for i, line in enumerate(file):
                 try:
                     point = self.sanitize_input(line)
                     if point:
-                        self.add_point(point)
+                        lines.append(i)
+                        points.append(point)
                 except Exception as err:
                     err_msg += f"\nInvalid input at line {i}. " + str(err)
 
+        for i in self.add_points(points):
+            err_msg += f"\nInvalid input at line {lines[i]}. Duplicate point."
+
         self.clear_screen()
         self.print_points(self.points, "POINTS")
 
@@ -2,12 +2,35 @@
 All unit tests
 """
 import unittest
-from tests import closest_pair_2d, closest_pair_kd
+from tests import closest_pair_2d, closest_pair_kd, radius, approx,\
+    dispatch, cache, streaming, blocked, service, closest_pair_1d, geo,\
+    closest_pair_array, prepared, range_index, groups, sweep, anytime,\
+    hooks, analysis, results, morton, run
 
 
 MODULES = [
     closest_pair_2d,
-    closest_pair_kd
+    closest_pair_kd,
+    radius,
+    approx,
+    dispatch,
+    cache,
+    streaming,
+    blocked,
+    service,
+    closest_pair_1d,
+    geo,
+    closest_pair_array,
+    prepared,
+    range_index,
+    groups,
+    sweep,
+    anytime,
+    hooks,
+    analysis,
+    results,
+    morton,
+    run
 ]
 
 
@@ -0,0 +1,81 @@
+"""
+Unit tests
+"""
+import math
+import unittest
+
+from closest_pair import gen_unique_kd_points
+from closest_pair.analysis import GrowthError, check_growth, fit_exponent,\
+    fit_models, measure
+
+
+class TestAnalysis(unittest.TestCase):
+    """
+    Tests for fitting growth rates of timings
+    """
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.n = [2**i for i in range(10, 17)]
+        self.timings = {
+            "n": [3e-7 * n for n in self.n],
+            "nlogn": [2e-7 * n * math.log2(n) for n in self.n],
+            "n^2": [1e-9 * n * n for n in self.n]
+        }
+
+    def test_invalid_raise_exception(self):
+        """Less than 2 sizes can't be fitted"""
+        with self.assertRaises(IndexError):
+            fit_exponent([100], [1.0])
+
+    def test_fit_exponent(self):
+        """Exponent of power laws, nlogn in between"""
+        self.assertAlmostEqual(fit_exponent(self.n, self.timings["n"]), 1)
+        self.assertAlmostEqual(fit_exponent(self.n, self.timings["n^2"]), 2)
+        self.assertTrue(1 < fit_exponent(self.n, self.timings["nlogn"])
+                        < 1.2)
+
+    def test_fit_models(self):
+        """Best fit is the model the timings came from"""
+        for model, timings in self.timings.items():
+            name, constant, error = fit_models(self.n, timings)[0]
+            self.assertEqual(name, model)
+            self.assertAlmostEqual(error, 0)
+
+        noisy = [t * (1.1 if i % 2 else 0.9)
+                 for i, t in enumerate(self.timings["nlogn"])]
+        self.assertEqual(fit_models(self.n, noisy)[0][0], "nlogn")
+
+    def test_check_growth(self):
+        """Quadratic timings fail nlogn, others pass"""
+        self.assertAlmostEqual(
+            check_growth("linear", self.n, self.timings["n"], "nlogn"),
+            -0.1, places=1)
+        check_growth("nlogn", self.n, self.timings["nlogn"], "nlogn")
+        check_growth("quadratic", self.n, self.timings["n^2"], "n^2")
+
+        with self.assertRaises(GrowthError):
+            check_growth("quadratic", self.n, self.timings["n^2"], "nlogn")
+
+    def test_measure(self):
+        """One fastest timing per size, func runs repeat times on each"""
+        sizes, calls = [], []
+
+        def gen_points(size):
+            sizes.append(size)
+            return gen_unique_kd_points(size, 2)
+
+        n = [8, 16, 32]
+        timings = measure(lambda points: calls.append(len(points)),
+                          gen_points, n, repeat=2)
+
+        self.assertEqual(len(timings), len(n))
+        self.assertTrue(all(timing >= 0 for timing in timings))
+        self.assertEqual(sizes, n)
+        self.assertEqual(calls, [8, 8, 16, 16, 32, 32])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests
+"""
+import random
+import threading
+import time
+import unittest
+
+from closest_pair import Point, bf_closest_pair_kd, closest_pair,\
+    closest_pair_anytime, closest_pair_kd, gen_unique_kd_points
+
+
+class TestAnytime(unittest.TestCase):
+    """
+    Tests for anytime closest pair of points
+    """
+    random.seed(0)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            closest_pair_anytime([])
+        with self.assertRaises(IndexError):
+            closest_pair_anytime([(1, 2)])
+
+    def test_bruteforce_matches_anytime(self):
+        """Dimension=1, 2, 3 with time to finish is optimal"""
+        for dim in range(1, 4):
+            for n in (2, 50, 100, 1000):
+                points = gen_unique_kd_points(n, dim)
+                result = closest_pair_anytime(points, budget=60)
+
+                self.assertTrue(result["optimal"])
+                self.assertEqual(result["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+
+    def test_bruteforce_matches_anytime_2d(self):
+        """Point objects and duplicates"""
+        points = Point.get_unique_points(3000)
+        self.assertEqual(closest_pair_anytime(points)["distance"],
+                         closest_pair_kd(points)["distance"])
+
+        points.append(Point(points[5].x, points[5].y))
+        result = closest_pair_anytime(points)
+        self.assertEqual(result["distance"], 0)
+        self.assertTrue(result["optimal"])
+
+    def test_deadline_gives_upper_bound(self):
+        """Expired budget returns a real pair that is not proven"""
+        points = gen_unique_kd_points(5000, 2)
+        exact = closest_pair_kd(points)["distance"]
+
+        for result in (closest_pair_anytime(points, budget=0),
+                       closest_pair_anytime(points,
+                                            deadline=time.perf_counter()),
+                       closest_pair(points, budget=0)):
+            self.assertFalse(result["optimal"])
+            self.assertGreaterEqual(result["distance"], exact)
+            self.assertIn(result["pair"][0], points)
+            self.assertIn(result["pair"][1], points)
+
+    def test_budget_high_dimension(self):
+        """Budget holds when 3^k neighbor cells outnumber the points"""
+        points = gen_unique_kd_points(5000, 13)
+        start_time = time.perf_counter()
+        result = closest_pair_anytime(points, budget=0.005)
+
+        self.assertLess(time.perf_counter() - start_time, 0.1)
+        self.assertFalse(result["optimal"])
+
+        points = gen_unique_kd_points(300, 13)
+        result = closest_pair_anytime(points, budget=60)
+        self.assertTrue(result["optimal"])
+        self.assertEqual(result["distance"],
+                         bf_closest_pair_kd(points)["distance"])
+
+    def test_budget_unit_cube(self):
+        """Budget holds when every point falls in one cell"""
+        rand = random.Random(0)
+        points = [tuple(rand.random() for _ in range(128))
+                  for _ in range(20000)]
+        start_time = time.perf_counter()
+        result = closest_pair_anytime(points, budget=0.005, seed=0)
+
+        self.assertLess(time.perf_counter() - start_time, 0.1)
+        self.assertFalse(result["optimal"])
+
+    def test_cancel(self):
+        """Cancel from another thread stops the refinement"""
+        points = gen_unique_kd_points(200000, 2)
+        cancel = threading.Event()
+        timer = threading.Timer(0.05, cancel.set)
+        timer.start()
+
+        result = closest_pair_anytime(points, cancel=cancel)
+        timer.join()
+
+        self.assertTrue(cancel.is_set())
+        self.assertFalse(result["optimal"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Unit tests
+"""
+import random
+import unittest
+
+from closest_pair import approx_closest_pair_kd, bf_closest_pair_kd,\
+    gen_unique_kd_points
+
+
+class TestApproxClosestPair(unittest.TestCase):
+    """
+    Tests for approximate closest pair of points in kth dimensions
+    """
+    random.seed(0)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            approx_closest_pair_kd([])
+        with self.assertRaises(IndexError):
+            approx_closest_pair_kd(gen_unique_kd_points(1, 3))
+
+    def test_upper_bound(self):
+        """Approximate distance is never below the exact distance"""
+        for dim in (2, 8, 32):
+            points = gen_unique_kd_points(200, dim)
+
+            approx = approx_closest_pair_kd(points, seed=1)
+            exact = bf_closest_pair_kd(points)
+
+            self.assertGreaterEqual(approx["distance"], exact["distance"])
+
+    def test_full_window_is_exact(self):
+        """Window covering all points is the brute force answer"""
+        points = gen_unique_kd_points(60, 16)
+
+        approx = approx_closest_pair_kd(points, projections=1, window=60)
+        exact = bf_closest_pair_kd(points)
+
+        self.assertEqual(approx["distance"], exact["distance"])
+
+    def test_check_reports_ratio(self):
+        """Checker reports the exact distance and the ratio"""
+        points = gen_unique_kd_points(100, 64)
+
+        result = approx_closest_pair_kd(points, seed=2, check=True)
+        exact = bf_closest_pair_kd(points)
+
+        self.assertEqual(result["exact_distance"], exact["distance"])
+        self.assertEqual(result["ratio"],
+                         result["distance"] / exact["distance"])
+        self.assertGreaterEqual(result["ratio"], 1)
+
+    def test_seed_is_repeatable(self):
+        """Same seed gives the same pair"""
+        points = gen_unique_kd_points(100, 8)
+
+        self.assertEqual(approx_closest_pair_kd(points, seed=3),
+                         approx_closest_pair_kd(points, seed=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
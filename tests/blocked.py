@@ -0,0 +1,143 @@
+"""
+Unit tests
+"""
+import os
+import random
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from closest_pair import Point, bf_closest_pair_2d, bf_closest_pair_blocked,\
+    bf_closest_pair_kd, closest_pair_kd, gen_unique_kd_points
+from closest_pair.blocked import np
+
+blocked = sys.modules["closest_pair.blocked"]
+closest_kd = sys.modules["closest_pair.closest_pair_kd"]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBlockedBruteForce(unittest.TestCase):
+    """
+    Tests for tiled matrix brute force
+    """
+    random.seed(0)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            bf_closest_pair_blocked([])
+        with self.assertRaises(IndexError):
+            bf_closest_pair_blocked(gen_unique_kd_points(1, 3))
+
+    def test_bruteforce_matches_blocked(self):
+        """Dimension=1, 2, 3, 8, 64 across several tiles"""
+        for dim in (1, 2, 3, 8, 64):
+            for n in (2, 3, 50, 300):
+                points = gen_unique_kd_points(n, dim)
+
+                self.assertEqual(
+                    bf_closest_pair_blocked(points, tile=32)["distance"],
+                    bf_closest_pair_kd(points)["distance"])
+
+    def test_bruteforce_matches_blocked_2d(self):
+        """Point objects"""
+        points = Point.get_unique_points(200)
+
+        self.assertEqual(bf_closest_pair_blocked(points)["distance"],
+                         bf_closest_pair_2d(points)["distance"])
+
+    def test_cancellation_far_from_origin(self):
+        """Close points far from the origin still give the exact answer"""
+        points = [tuple(1e8 + random.random() * 1e-3 for d in range(16))
+                  for _ in range(200)]
+
+        self.assertEqual(bf_closest_pair_blocked(points, tile=64),
+                         bf_closest_pair_kd(points))
+
+    def test_duplicates(self):
+        """Duplicate points give distance 0"""
+        points = gen_unique_kd_points(100, 8)
+        points.append(points[10])
+
+        self.assertEqual(bf_closest_pair_blocked(points)["distance"], 0)
+
+    def test_equal_rows(self):
+        """All equal rows keep a bounded set of candidates"""
+        points = [(1.5, -2.0, 3.25, 0.5)] * 3000
+        collect = blocked._collect
+        sizes = []
+
+        def spy(results, tol, hook):
+            candidates = collect(results, tol, hook)
+            sizes.append(len(candidates))
+            return candidates
+
+        blocked._collect = spy
+        try:
+            result = bf_closest_pair_blocked(points, tile=256)
+        finally:
+            blocked._collect = collect
+
+        self.assertEqual(result["distance"], 0)
+        self.assertLessEqual(sizes[0], blocked.CANDIDATES)
+
+    def test_threaded_matches_bruteforce(self):
+        """Thread pool over many tiles gives the same answer"""
+        for dim in (2, 16):
+            points = gen_unique_kd_points(500, dim)
+
+            self.assertEqual(
+                bf_closest_pair_blocked(points, tile=64, workers=4),
+                bf_closest_pair_kd(points))
+            self.assertEqual(
+                bf_closest_pair_blocked(points, tile=64, workers=None),
+                bf_closest_pair_kd(points))
+
+    def test_workers_none_is_cpu_count(self):
+        """workers=None starts one thread per cpu"""
+        sizes = []
+
+        class Pool(ThreadPoolExecutor):
+            def __init__(self, max_workers=None):
+                sizes.append(max_workers)
+                super().__init__(max_workers)
+
+        cpu_count = os.cpu_count
+        blocked.ThreadPoolExecutor, os.cpu_count = Pool, lambda: 3
+        try:
+            points = gen_unique_kd_points(300, 4)
+            self.assertEqual(
+                bf_closest_pair_blocked(points, tile=64, workers=None),
+                bf_closest_pair_kd(points))
+        finally:
+            blocked.ThreadPoolExecutor, os.cpu_count = \
+                ThreadPoolExecutor, cpu_count
+
+        self.assertEqual(sizes, [3])
+
+    def test_high_dimension_fallback(self):
+        """closest_pair_kd uses the blocked engine in high dimensions"""
+        points = gen_unique_kd_points(300, 6)
+
+        self.assertEqual(closest_pair_kd(points)["distance"],
+                         bf_closest_pair_kd(points)["distance"])
+
+    def test_recursion_blocked_leaves(self):
+        """Large inputs recurse down to blocked leaves and wide strips"""
+        leaf, pairs = closest_kd.BLOCKED_LEAF, closest_kd.BLOCKED_STRIP_PAIRS
+        closest_kd.BLOCKED_LEAF, closest_kd.BLOCKED_STRIP_PAIRS = 64, 16
+        try:
+            for dim in (4, 5):
+                points = gen_unique_kd_points(400, dim)
+                points.append(points[7])
+
+                for points in (points[:-1], points):
+                    self.assertEqual(closest_pair_kd(points)["distance"],
+                                     bf_closest_pair_kd(points)["distance"])
+        finally:
+            closest_kd.BLOCKED_LEAF, closest_kd.BLOCKED_STRIP_PAIRS = \
+                leaf, pairs
+
+
+if __name__ == "__main__":
+    unittest.main()
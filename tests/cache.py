@@ -0,0 +1,110 @@
+"""
+Unit tests
+"""
+import copy
+import random
+import unittest
+from array import array
+
+from closest_pair import Point, PairResult, cached, closest_pair_2d,\
+    closest_pair_kd, gen_unique_kd_points
+from closest_pair.cache import ResultCache, content_hash
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Tests for content-hash result cache
+    """
+    random.seed(0)
+
+    def test_hit_returns_same_answer(self):
+        """Second call on equal content is a hit with the same answer"""
+        func = cached(closest_pair_kd)
+        points = gen_unique_kd_points(100, 3)
+
+        first = func(points)
+        second = func(copy.deepcopy(points))
+
+        self.assertEqual(first, closest_pair_kd(points))
+        self.assertEqual(first, second)
+        self.assertEqual(func.cache.stats()["hits"], 1)
+        self.assertEqual(func.cache.stats()["misses"], 1)
+
+    def test_hit_returns_callers_points(self):
+        """Cached pair is rebuilt from the points of the current call"""
+        func = cached(closest_pair_2d)
+        points = Point.get_unique_points(50)
+        points_copy = copy.deepcopy(points)
+
+        func(points)
+        result = func(points_copy)
+
+        self.assertTrue(any(result["pair"][0] is p for p in points_copy))
+        self.assertTrue(any(result["pair"][1] is p for p in points_copy))
+
+    def test_result_is_immutable(self):
+        """Cached result cannot be changed"""
+        func = cached(closest_pair_kd)
+        result = func(gen_unique_kd_points(20, 2))
+
+        self.assertIsInstance(result, PairResult)
+        with self.assertRaises(TypeError):
+            result["distance"] = 0
+        with self.assertRaises(AttributeError):
+            result.distance = 0
+
+    def test_lru_eviction_by_entries(self):
+        """Least recently used entry is evicted past max_entries"""
+        func = cached(closest_pair_kd, ResultCache(max_entries=2))
+        lists = [gen_unique_kd_points(10, 2) for _ in range(3)]
+
+        func(lists[0])
+        func(lists[1])
+        func(lists[0])  # hit, lists[1] is now least recently used
+        func(lists[2])  # evicts lists[1]
+        func(lists[0])  # hit
+
+        stats = func.cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["entries"], 2)
+
+    def test_lru_eviction_by_bytes(self):
+        """Entries are evicted to stay under max_bytes"""
+        cache = ResultCache(max_bytes=1000)
+        func = cached(closest_pair_kd, cache)
+
+        for _ in range(20):
+            func(gen_unique_kd_points(10, 2))
+
+        self.assertLessEqual(cache.nbytes, 1000)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_content_hash(self):
+        """Hash depends on content only"""
+        points = gen_unique_kd_points(30, 3)
+
+        self.assertEqual(content_hash(points),
+                         content_hash(copy.deepcopy(points)))
+        self.assertNotEqual(content_hash(points), content_hash(points[1:]))
+        self.assertEqual(content_hash(array("d", [1, 2, 3])),
+                         content_hash(array("d", [1, 2, 3])))
+
+    def test_large_integers(self):
+        """Int above 2**53 must not collide on their float64 rounding"""
+        t = 1_700_000_000_000_000_000
+        a = [(t,), (t + 1,), (t + 5000,)]
+        b = [(t,), (t + 3,), (t + 5000,)]
+
+        self.assertNotEqual(content_hash(a), content_hash(b))
+        self.assertNotEqual(content_hash([(2**70,)]),
+                            content_hash([(2**70 + 1,)]))
+        self.assertNotEqual(content_hash([(1,)]), content_hash([(1.0,)]))
+
+        closest = cached(closest_pair_kd)
+        self.assertEqual(closest(a)["distance"], 1)
+        self.assertEqual(closest(b)["distance"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
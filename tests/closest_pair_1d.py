@@ -0,0 +1,99 @@
+"""
+Unit tests
+"""
+import random
+import sys
+import unittest
+
+from closest_pair import bf_closest_pair_kd, closest_pair_1d,\
+    closest_pair_kd, gen_unique_kd_points
+
+closest_1d = sys.modules["closest_pair.closest_pair_1d"]
+
+
+class TestClosestPairLine(unittest.TestCase):
+    """
+    Tests for closest pair of points on a line
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.np = closest_1d.np
+
+    def tearDown(self):
+        closest_1d.np = self.np
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            closest_pair_1d([])
+        with self.assertRaises(IndexError):
+            closest_pair_1d([(1,)])
+
+    def test_bruteforce_matches_line(self):
+        """Points size n from 2 to 200, with and without numpy"""
+        for np in (self.np, None):
+            closest_1d.np = np
+            for n in range(2, 201):
+                points = gen_unique_kd_points(n, 1)
+                result = closest_pair_1d(points)
+
+                self.assertEqual(result["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+                self.assertIn(result["pair"][0], points)
+                self.assertIn(result["pair"][1], points)
+
+    def test_duplicates(self):
+        """Duplicate points give distance 0"""
+        for np in (self.np, None):
+            closest_1d.np = np
+            for n in (10, 100):
+                points = gen_unique_kd_points(n, 1)
+                points.append(points[n // 2])
+
+                self.assertEqual(closest_pair_1d(points)["distance"], 0)
+
+    def test_timestamps(self):
+        """Plain numbers are accepted"""
+        for np in (self.np, None):
+            closest_1d.np = np
+            timestamps = [random.uniform(0, 1000) for i in range(500)]
+            result = closest_pair_1d(timestamps)
+            expected = min(abs(a - b) for i, a in enumerate(timestamps)
+                           for b in timestamps[i + 1:])
+
+            self.assertEqual(result["distance"], expected)
+            self.assertEqual(abs(result["pair"][0] - result["pair"][1]),
+                             expected)
+
+    def test_large_integers(self):
+        """Integers above 2**53 keep their low digits"""
+        for np in (self.np, None):
+            closest_1d.np = np
+            base = 2**62
+            timestamps = [base + 1000 * i for i in range(100)]
+            timestamps.append(base + 50001)
+            random.shuffle(timestamps)
+            result = closest_pair_1d(timestamps)
+
+            self.assertEqual(result["distance"], 1)
+            self.assertEqual(sorted(result["pair"]), [base + 50000,
+                                                      base + 50001])
+
+            # gaps wider than int64 still compare exactly
+            points = [(-base * 2 + i * 3,) for i in range(70)]
+            points += [(base * 2 - 1,), (base * 2 - 3,)]
+            self.assertEqual(closest_pair_1d(points)["distance"], 2)
+
+    def test_dispatch_from_kd(self):
+        """closest_pair_kd uses the line engine for 1 dimension"""
+        points = gen_unique_kd_points(300, 1)
+
+        self.assertEqual(closest_pair_kd(points), closest_pair_1d(points))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -159,6 +159,23 @@ class TestClosestPairPlanar(unittest.TestCase):
             self.assertEqual(bf_min["distance"], re_min["distance"])
             self.assertEqual(bf_min["distance"], re_opt_min["distance"])
 
+    def test_bruteforce_matches_recursion_large_strips(self):
+        """Points of size n=1000 with wide strips, random and vertical"""
+        n = 1000
+
+        for vertical in (False, True):
+            bf_list = Point.get_unique_points(n)
+            if vertical:
+                for point in bf_list:
+                    point.x = 0
+
+            bf_min = bf_closest_pair_2d(bf_list)
+            re_min = closest_pair_2d(bf_list)
+            re_opt_min = closest_pair_2d_opt(bf_list)
+
+            self.assertEqual(bf_min["distance"], re_min["distance"])
+            self.assertEqual(bf_min["distance"], re_opt_min["distance"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests
+"""
+import random
+import sys
+import tracemalloc
+import unittest
+from array import array
+
+from closest_pair import bf_closest_pair_kd, closest_pair_array,\
+    gen_unique_kd_points
+
+closest_array = sys.modules["closest_pair.closest_pair_array"]
+
+try:
+    import numpy as np
+except ImportError:  # numpy buffers are skipped
+    np = None
+
+
+class TestClosestPairArray(unittest.TestCase):
+    """
+    Tests for closest pair of rows of a buffer
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.dimensions = 5
+        self.np = closest_array.np
+
+    def tearDown(self):
+        closest_array.np = self.np
+
+    def check(self, buffer, points):
+        """Result indexes a pair of points at the brute force distance"""
+        result = closest_pair_array(buffer, len(points[0]))
+        i, j = result["pair"]
+
+        self.assertLess(i, j)
+        self.assertAlmostEqual(result["distance"],
+                               bf_closest_pair_kd(points)["distance"])
+        self.assertAlmostEqual(result["distance"],
+                               bf_closest_pair_kd([points[i], points[j]])
+                               ["distance"])
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 row or a bad shape should raise exception"""
+        with self.assertRaises(IndexError):
+            closest_pair_array(array("d"), 2)
+        with self.assertRaises(IndexError):
+            closest_pair_array(array("d", [1, 2]), 2)
+        with self.assertRaises(ValueError):
+            closest_pair_array(array("d", [1, 2, 3]))
+        with self.assertRaises(ValueError):
+            closest_pair_array(array("d", [1, 2, 3]), 2)
+
+    def test_bruteforce_matches_flat_array(self):
+        """Dimension=1 to 5 array.array, with and without numpy"""
+        for numpy in (self.np, None):
+            closest_array.np = numpy
+            for dim in range(1, self.dimensions + 1):
+                for n in (2, 3, 10, 100, 300):
+                    points = gen_unique_kd_points(n, dim)
+                    buffer = array("d", [c for p in points for c in p])
+                    self.check(buffer, points)
+
+    def test_duplicates_and_lattice(self):
+        """Duplicate rows give distance 0, lattice rows share coordinates"""
+        for numpy in (self.np, None):
+            closest_array.np = numpy
+            for dim in range(1, self.dimensions + 1):
+                points = [tuple(float(random.randint(0, 3))
+                                for d in range(dim)) for i in range(50)]
+                buffer = array("d", [c for p in points for c in p])
+                self.check(buffer, points)
+
+                points = gen_unique_kd_points(200, dim)
+                points.append(points[77])
+                buffer = array("d", [c for p in points for c in p])
+                self.assertEqual(closest_pair_array(buffer, dim)["distance"],
+                                 0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_buffers(self):
+        """2D, integer and strided numpy arrays"""
+        rng = np.random.default_rng(0)
+        for dim in range(1, self.dimensions + 1):
+            coords = rng.random((500, dim))
+            self.check(coords, [tuple(row) for row in coords.tolist()])
+
+            coords = rng.integers(-1000, 1000, (500, dim))
+            self.check(coords, [tuple(row) for row in coords.tolist()])
+
+            coords = rng.random((500, dim + 2))[::2, 1:dim + 1]
+            self.check(coords, [tuple(row) for row in coords.tolist()])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_clustered(self):
+        """Clusters of close points far apart in 3 and 4 dimensions"""
+        rng = np.random.default_rng(1)
+        for dim in (3, 4):
+            centers = rng.random((20, dim)) * 1e6
+            coords = (centers[:, None, :] +
+                      rng.random((20, 50, dim))).reshape(-1, dim)
+            self.check(coords, [tuple(row) for row in coords.tolist()])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_copies(self):
+        """One copy of the rows in sweep order, gathers by chunks"""
+        chunk_rows = closest_array.CHUNK_ROWS
+        closest_array.CHUNK_ROWS = 512
+        coords = np.random.default_rng(3).random((4000, 16))
+
+        tracemalloc.start()
+        try:
+            result = closest_pair_array(coords)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            closest_array.CHUNK_ROWS = chunk_rows
+
+        # the sorted copy, index arrays and chunks, not a copy per gather
+        self.assertLess(peak, 2.5 * coords.nbytes)
+        self.assertEqual(result, closest_pair_array(coords))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_float32(self):
+        """Float32 finds the float64 answer where float32 can't tell"""
+        rng = np.random.default_rng(2)
+        with self.assertRaises(ValueError):
+            closest_pair_array(rng.random((10, 2)), precision="float16")
+
+        for dim in range(1, self.dimensions + 1):
+            # float32 spacing at 1e4 is about 1e-3
+            for coords in (rng.random((300, dim)),
+                           rng.random((300, dim)) * 1e-3 + 1e4,
+                           rng.random((300, dim)).astype(np.float32)):
+                self.assertEqual(
+                    closest_pair_array(coords, precision="float32"),
+                    closest_pair_array(coords))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_float32_identical_rows(self):
+        """Float32 on rows all the same is distance 0, with or without curve"""
+        for dim in range(1, 9):
+            for coords in (np.zeros((10, dim)), np.full((10, dim), 7.5)):
+                for curve in (False, True):
+                    result = closest_pair_array(coords, precision="float32",
+                                                curve=curve)
+                    self.assertEqual(result["distance"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
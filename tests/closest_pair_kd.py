@@ -7,6 +7,7 @@ import unittest
 
 from closest_pair import bf_closest_pair_kd, closest_pair_kd,\
     gen_unique_kd_points, distance
+from closest_pair.closest_pair_kd import closest_kd
 
 
 class TestClosestPairKD(unittest.TestCase):
@@ -80,6 +81,22 @@ class TestClosestPairKD(unittest.TestCase):
                 self.assertNotEqual(bf_min["distance"], 0)
                 self.assertEqual(bf_min["distance"], re_min["distance"])
 
+    def test_bruteforce_matches_recursion_high_dim(self):
+        """Dimension=4, 5, 6 recursion, random and on a lattice"""
+        for dim in range(4, 7):
+            for n in (50, 300):
+                random_list = gen_unique_kd_points(n, dim)
+                lattice_list = [tuple(random.randint(0, 3) * 0.5
+                                      for d in range(dim))
+                                for i in range(n)]
+
+                for points in (random_list, lattice_list):
+                    points_xsorted = sorted(points, key=lambda p: p[0])
+                    bf_min = bf_closest_pair_kd(points)
+                    re_min = closest_kd(points_xsorted, 0, n - 1, dim)
+
+                    self.assertEqual(bf_min["distance"], re_min[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+"""
+Unit tests
+"""
+import copy
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+from closest_pair import Point, bf_closest_pair_2d, bf_closest_pair_kd,\
+    closest_pair, gen_unique_kd_points
+from closest_pair.blocked import np
+from closest_pair.dispatch import DEFAULT_PROFILE, load_profile, tune
+
+dispatch = sys.modules["closest_pair.dispatch"]
+
+
+class TestDispatch(unittest.TestCase):
+    """
+    Tests for automatic algorithm selection
+    """
+    random.seed(0)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            closest_pair([])
+        with self.assertRaises(IndexError):
+            closest_pair([Point(1, 1)])
+
+    def test_bruteforce_matches_dispatch_2d(self):
+        """Points size n from 2 to 200"""
+        for n in range(2, 201, 7):
+            points = Point.get_unique_points(n)
+            self.assertEqual(closest_pair(points)["distance"],
+                             bf_closest_pair_2d(points)["distance"])
+
+    def test_bruteforce_matches_dispatch_shared_x(self):
+        """Points sharing x-coordinates use the safe recursion"""
+        for n in range(20, 201, 20):
+            points = Point.get_unique_points(n)
+            for point in points:
+                point.x = random.randint(0, 3)
+
+            self.assertEqual(closest_pair(points)["distance"],
+                             bf_closest_pair_2d(points)["distance"])
+
+    def test_bruteforce_matches_dispatch_kd(self):
+        """Dimension=1, 2, 3, 5 for points from a generator"""
+        for dim in (1, 2, 3, 5):
+            for n in (2, 10, 100, 300):
+                points = gen_unique_kd_points(n, dim)
+                result = closest_pair(p for p in points)
+
+                self.assertEqual(result["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_high_dimension_skips_bruteforce(self):
+        """Small inputs of uncalibrated high dimensions use closest_pair_kd"""
+        calls = []
+
+        def spy(points):
+            calls.append(len(points))
+            return bf_closest_pair_kd(points)
+
+        dispatch.bf_closest_pair_kd = spy
+        try:
+            for dim in (3, 128):
+                points = gen_unique_kd_points(60, dim)
+                self.assertEqual(closest_pair(points)["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+        finally:
+            dispatch.bf_closest_pair_kd = bf_closest_pair_kd
+
+        self.assertEqual(calls, [60])
+
+    def test_duplicates(self):
+        """Duplicate points give distance 0"""
+        points = gen_unique_kd_points(100, 3)
+        points.append(copy.deepcopy(points[0]))
+
+        result = closest_pair(points, dict(DEFAULT_PROFILE, sample_size=101))
+
+        self.assertEqual(result, {"distance": 0,
+                                  "pair": (points[0], points[-1])})
+
+    def test_random_state_unchanged(self):
+        """Sampling for duplicates leaves the global random state alone"""
+        points = gen_unique_kd_points(500, 2)
+        state = random.getstate()
+        closest_pair(points)
+
+        self.assertEqual(random.getstate(), state)
+
+    def test_tune_saves_profile(self):
+        """Tuned profile is saved and loaded back"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            profile = tune(path, dims=(2,), max_n=32, repeat=1)
+
+            self.assertEqual(load_profile(path)["bf_max_n_kd"]["2"],
+                             profile["bf_max_n_kd"]["2"])
+            self.assertIn("1", load_profile(path)["bf_max_n_kd"])
+
+    def test_missing_profile_is_default(self):
+        """Missing profile file falls back to defaults"""
+        self.assertEqual(load_profile("/nonexistent/profile.json"),
+                         DEFAULT_PROFILE)
+
+    def test_profile_is_copy(self):
+        """Changing a loaded profile leaves the defaults alone"""
+        default = copy.deepcopy(DEFAULT_PROFILE)
+        profile = load_profile("/nonexistent/profile.json")
+        profile["sample_size"] = 1
+        profile["bf_max_n_kd"]["2"] = 10**6
+
+        self.assertEqual(DEFAULT_PROFILE, default)
+        self.assertEqual(load_profile("/nonexistent/profile.json"), default)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            tune(path, dims=(2,), max_n=8, repeat=1)
+            load_profile(path)["bf_max_n_kd"]["2"] = -1
+
+            self.assertNotEqual(load_profile(path)["bf_max_n_kd"]["2"], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
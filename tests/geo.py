@@ -0,0 +1,83 @@
+"""
+Unit tests
+"""
+import random
+import unittest
+
+from closest_pair import bf_closest_pair_geo, closest_pair_geo, haversine
+
+
+class TestClosestPairGeo(unittest.TestCase):
+    """
+    Tests for closest pair of (lat, lon) points
+    """
+    random.seed(0)
+
+    def gen_points(self, n):
+        """Random (lat, lon) points in degrees"""
+        return [(random.uniform(-90, 90), random.uniform(-180, 180))
+                for i in range(n)]
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            closest_pair_geo([])
+        with self.assertRaises(IndexError):
+            closest_pair_geo([(0, 0)])
+        with self.assertRaises(ValueError):
+            closest_pair_geo([(0, 0), (91, 0)])
+
+    def test_haversine(self):
+        """Known great-circle distances"""
+        self.assertAlmostEqual(haversine((0, 0), (0, 180), 1), 3.141592653589)
+        self.assertAlmostEqual(haversine((90, 0), (-90, 0), 1), 3.141592653589)
+        self.assertAlmostEqual(haversine((0, 0), (0, 90), 1), 1.570796326794)
+
+    def test_bruteforce_matches_geo(self):
+        """Points size n from 2 to 150"""
+        for n in range(2, 151):
+            points = self.gen_points(n)
+            bf_min = bf_closest_pair_geo(points)
+            geo_min = closest_pair_geo(points)
+
+            self.assertAlmostEqual(geo_min["distance"], bf_min["distance"],
+                                   delta=1e-6)
+            self.assertAlmostEqual(haversine(*geo_min["pair"]),
+                                   geo_min["distance"], delta=1e-6)
+
+    def test_antimeridian(self):
+        """Pair across longitude 180 is the closest"""
+        points = self.gen_points(200)
+        points += [(10.0, 179.99999), (10.0, -179.99999)]
+        result = closest_pair_geo(points)
+
+        self.assertEqual(set(result["pair"]),
+                         {(10.0, 179.99999), (10.0, -179.99999)})
+        self.assertAlmostEqual(result["distance"],
+                               bf_closest_pair_geo(points)["distance"],
+                               delta=1e-6)
+
+    def test_poles(self):
+        """Points near a pole are close whatever their longitude"""
+        points = self.gen_points(200)
+        points += [(89.99999, 0.0), (89.99999, 180.0)]
+        result = closest_pair_geo(points)
+
+        self.assertEqual(set(result["pair"]),
+                         {(89.99999, 0.0), (89.99999, 180.0)})
+        self.assertAlmostEqual(result["distance"],
+                               bf_closest_pair_geo(points)["distance"],
+                               delta=1e-6)
+
+    def test_duplicates(self):
+        """Duplicate points give distance 0, same place by longitude too"""
+        points = self.gen_points(100)
+        points.append(points[50])
+        self.assertEqual(closest_pair_geo(points)["distance"], 0)
+
+        points = self.gen_points(100) + [(0.0, 180.0), (0.0, -180.0)]
+        self.assertAlmostEqual(closest_pair_geo(points)["distance"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
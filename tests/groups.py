@@ -0,0 +1,138 @@
+"""
+Unit tests
+"""
+import os
+import random
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+
+from closest_pair import bf_closest_pair_kd, closest_pair_groups,\
+    gen_unique_kd_points
+
+groups_module = sys.modules["closest_pair.groups"]
+
+
+class TestClosestPairGroups(unittest.TestCase):
+    """
+    Tests for closest pair per group
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.np = groups_module.np
+        self.chunk_rows = groups_module.CHUNK_ROWS
+
+    def tearDown(self):
+        groups_module.np = self.np
+        groups_module.CHUNK_ROWS = self.chunk_rows
+
+    def check(self, points, groups, **kwargs):
+        """Every group matches brute force on its own points"""
+        dim = len(points[0])
+        buffer = array("d", [c for p in points for c in p])
+        results = closest_pair_groups(buffer, groups, dim, **kwargs)
+
+        members = {}
+        for i, group in enumerate(groups):
+            members.setdefault(group, []).append(i)
+        expected = sorted(g for g, rows in members.items() if len(rows) > 1)
+
+        self.assertEqual([r[0] for r in results], expected)
+        for group, dist, i, j in results:
+            self.assertLess(i, j)
+            self.assertEqual(groups[i], group)
+            self.assertEqual(groups[j], group)
+            self.assertAlmostEqual(dist, bf_closest_pair_kd(
+                [points[k] for k in members[group]])["distance"])
+            self.assertAlmostEqual(dist, bf_closest_pair_kd(
+                [points[i], points[j]])["distance"])
+
+    def test_invalid_raise_exception(self):
+        """Group ids must match the rows"""
+        with self.assertRaises(ValueError):
+            closest_pair_groups(array("d", [1, 2, 3, 4]), [0], 2)
+
+    def test_bruteforce_matches_groups(self):
+        """Dimension=1, 2, 3 for groups of 1 to 60 points"""
+        for numpy in (self.np, None):
+            groups_module.np = numpy
+            for dim in range(1, 4):
+                points = gen_unique_kd_points(1000, dim)
+                groups = [random.randint(-5, 40) for i in range(1000)]
+                self.check(points, groups)
+
+    def test_duplicates(self):
+        """Duplicate points in a group give distance 0"""
+        for numpy in (self.np, None):
+            groups_module.np = numpy
+            points = gen_unique_kd_points(200, 2)
+            groups = [i % 7 for i in range(200)]
+            points[14] = points[0]
+            self.check(points, groups)
+
+    def test_single_rows(self):
+        """Groups of a single row only give no results"""
+        points = gen_unique_kd_points(50, 2)
+        buffer = array("d", [c for p in points for c in p])
+        for numpy in (self.np, None):
+            groups_module.np = numpy
+            for precision in ("float64", "float32"):
+                self.assertEqual(closest_pair_groups(
+                    buffer, list(range(50)), 2, precision=precision), [])
+
+    def test_threaded_chunks(self):
+        """Chunks cut at group boundaries on a thread pool"""
+        groups_module.CHUNK_ROWS = 64
+        points = gen_unique_kd_points(2000, 2)
+        groups = [random.randint(0, 99) for i in range(2000)]
+        self.check(points, groups, workers=4)
+
+    def test_workers_none_is_cpu_count(self):
+        """workers=None starts one thread per cpu"""
+        if self.np is None:
+            self.skipTest("numpy is not installed")
+
+        sizes = []
+
+        class Pool(ThreadPoolExecutor):
+            def __init__(self, max_workers=None):
+                sizes.append(max_workers)
+                super().__init__(max_workers)
+
+        groups_module.CHUNK_ROWS = 64
+        points = gen_unique_kd_points(2000, 2)
+        groups = [random.randint(0, 99) for i in range(2000)]
+
+        cpu_count = os.cpu_count
+        groups_module.ThreadPoolExecutor, os.cpu_count = Pool, lambda: 3
+        try:
+            self.check(points, groups, workers=None)
+        finally:
+            groups_module.ThreadPoolExecutor, os.cpu_count = \
+                ThreadPoolExecutor, cpu_count
+
+        self.assertEqual(sizes, [3])
+
+    def test_float32(self):
+        """Float32 groups far from the origin match float64"""
+        if self.np is None:
+            self.skipTest("numpy is not installed")
+
+        points = [tuple(1e4 + random.random() * 1e-3 for d in range(2))
+                  for i in range(1000)]
+        groups = [random.randint(0, 20) for i in range(1000)]
+        self.check(points, groups, precision="float32")
+
+        buffer = array("d", [c for p in points for c in p])
+        self.assertEqual(
+            closest_pair_groups(buffer, groups, 2, precision="float32"),
+            closest_pair_groups(buffer, groups, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
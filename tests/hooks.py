@@ -0,0 +1,112 @@
+"""
+Unit tests
+"""
+import random
+import threading
+import unittest
+
+from closest_pair import Cancelled, ProgressHook, bf_closest_pair_blocked,\
+    bf_closest_pair_kd, closest_pair_kd, gen_unique_kd_points
+from closest_pair.blocked import np
+
+
+class TestHooks(unittest.TestCase):
+    """
+    Tests for progress hooks and cancellation
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """Test setup"""
+        self.fractions = []
+        self.hook = ProgressHook(self.fractions.append, interval=0)
+
+    def assert_progress(self):
+        """Fractions go up from 0.0 to 1.0"""
+        self.assertEqual(self.fractions[0], 0.0)
+        self.assertEqual(self.fractions[-1], 1.0)
+        self.assertEqual(self.fractions, sorted(self.fractions))
+        self.assertGreater(len(self.fractions), 2)
+
+    def test_hook_matches_no_hook(self):
+        """Dimension=1, 2, 3 with a hook give the same answer"""
+        for dim in range(1, 4):
+            points = gen_unique_kd_points(2000, dim)
+            self.assertEqual(closest_pair_kd(points, hook=self.hook),
+                             closest_pair_kd(points))
+            self.assertEqual(self.fractions[-1], 1.0)
+
+            points = points[:200]
+            self.assertEqual(bf_closest_pair_kd(points, hook=self.hook),
+                             bf_closest_pair_kd(points))
+
+    def test_recursion_progress(self):
+        """Recursion reports every point reaching a base case"""
+        points = gen_unique_kd_points(5000, 2)
+        closest_pair_kd(points, hook=self.hook)
+
+        self.assert_progress()
+        self.assertEqual(self.hook.done, len(points))
+
+    def test_bruteforce_progress(self):
+        """Brute force reports pairs of the rows done"""
+        points = gen_unique_kd_points(300, 3)
+        bf_closest_pair_kd(points, hook=self.hook)
+
+        self.assert_progress()
+        self.assertEqual(self.hook.done, 300 * 299 // 2)
+
+    def test_throttled(self):
+        """A long interval reports only the start and the end"""
+        hook = ProgressHook(self.fractions.append, interval=3600)
+        closest_pair_kd(gen_unique_kd_points(5000, 2), hook=hook)
+
+        self.assertEqual(self.fractions, [0.0, 1.0])
+
+    def test_cancel(self):
+        """A set cancel event raises Cancelled"""
+        cancel = threading.Event()
+        cancel.set()
+        hook = ProgressHook(cancel=cancel)
+        points = gen_unique_kd_points(100, 3)
+
+        with self.assertRaises(Cancelled):
+            closest_pair_kd(points, hook=hook)
+        with self.assertRaises(Cancelled):
+            bf_closest_pair_kd(points, hook=hook)
+
+    def test_cancel_from_thread(self):
+        """Cancel from another thread stops the brute force"""
+        cancel = threading.Event()
+        hook = ProgressHook(self.fractions.append, cancel=cancel,
+                            interval=0)
+        timer = threading.Timer(0.05, cancel.set)
+        timer.start()
+
+        with self.assertRaises(Cancelled):
+            bf_closest_pair_kd(gen_unique_kd_points(3000, 2), hook=hook)
+        timer.join()
+
+        self.assertLess(self.fractions[-1], 1.0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_blocked(self):
+        """Blocked brute force reports tiles and stops between them"""
+        points = gen_unique_kd_points(500, 8)
+        for workers in (1, 4):
+            self.fractions.clear()
+            self.assertEqual(
+                bf_closest_pair_blocked(points, tile=64, workers=workers,
+                                        hook=self.hook),
+                bf_closest_pair_kd(points))
+            self.assert_progress()
+
+            cancel = threading.Event()
+            cancel.set()
+            with self.assertRaises(Cancelled):
+                bf_closest_pair_blocked(points, tile=64, workers=workers,
+                                        hook=ProgressHook(cancel=cancel))
+
+
+if __name__ == "__main__":
+    unittest.main()
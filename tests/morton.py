@@ -0,0 +1,87 @@
+"""
+Unit tests
+"""
+import unittest
+
+from closest_pair import bf_closest_pair_kd, closest_pair_array
+from closest_pair.morton import np, curve_seed, morton_codes, morton_order
+
+
+def interleave(cells, bits):
+    """Morton code of integer cells, one bit at a time"""
+    code = 0
+    for bit in range(bits):
+        for d, cell in enumerate(cells):
+            code |= ((cell >> bit) & 1) << (bit * len(cells) + d)
+    return code
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestMorton(unittest.TestCase):
+    """
+    Tests for Morton order and curve seeding
+    """
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.rng = np.random.default_rng(0)
+
+    def test_codes_interleave(self):
+        """Codes of cells 0 to 2^bits - 1 match bit by bit interleaving"""
+        for dim, bits in ((1, 32), (2, 16), (3, 10), (3, 21), (5, 6)):
+            high = (1 << bits) - 1
+            cells = self.rng.integers(0, high, (100, dim))
+            cells[0], cells[1] = 0, high
+
+            codes = morton_codes(cells.astype(float), bits)
+            for row, code in zip(cells.tolist(), codes.tolist()):
+                self.assertEqual(code, interleave(row, bits))
+
+    def test_order_flat_axis(self):
+        """Axis with one value and 1 row per cell of a grid"""
+        coords = np.array([(x, 5.0) for x in range(8)])
+        self.assertEqual(morton_order(coords).tolist(), list(range(8)))
+
+        grid = np.array([(x, y) for y in range(4) for x in range(4)], float)
+        codes = morton_codes(grid, 2)
+        self.assertEqual(sorted(codes.tolist()), list(range(16)))
+
+    def test_curve_seed(self):
+        """Seed is a real pair no closer than the closest pair"""
+        with self.assertRaises(IndexError):
+            curve_seed(np.zeros((1, 2)))
+
+        for dim in range(1, 5):
+            coords = self.rng.random((300, dim))
+            rows = coords[morton_order(coords)]
+            d2, i, j = curve_seed(rows)
+
+            self.assertLess(i, j)
+            self.assertAlmostEqual(d2, float(np.sum((rows[i] - rows[j])**2)))
+            points = [tuple(row) for row in coords.tolist()]
+            self.assertGreaterEqual(
+                d2 ** 0.5, bf_closest_pair_kd(points)["distance"] - 1e-12)
+
+    def test_closest_pair_array_curve(self):
+        """Curve order and seed keep the closest pair exact"""
+        for dim in range(1, 6):
+            for coords in (self.rng.random((500, dim)),
+                           np.round(self.rng.random((500, dim)) * 10)):
+                points = [tuple(row) for row in coords.tolist()]
+                for precision in ("float64", "float32"):
+                    result = closest_pair_array(coords, precision=precision,
+                                                curve=True)
+                    i, j = result["pair"]
+
+                    self.assertLess(i, j)
+                    self.assertEqual(result["distance"],
+                                     closest_pair_array(coords)["distance"])
+                    self.assertAlmostEqual(
+                        result["distance"],
+                        bf_closest_pair_kd(points)["distance"])
+
+
+if __name__ == "__main__":
+    unittest.main()
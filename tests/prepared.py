@@ -0,0 +1,87 @@
+"""
+Unit tests
+"""
+import random
+import unittest
+
+from closest_pair import Point, PreparedPoints, bf_closest_pair_2d,\
+    bf_closest_pair_kd, gen_unique_kd_points
+
+
+class TestPreparedPoints(unittest.TestCase):
+    """
+    Tests for prepared points
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.dimensions = 4
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            PreparedPoints(gen_unique_kd_points(1, 2)).closest_pair()
+        with self.assertRaises(IndexError):
+            PreparedPoints(gen_unique_kd_points(5, 2)).closest_pair_subset(
+                [3])
+
+    def test_orders_are_sorted(self):
+        """Every ordering sorts the points on its axis"""
+        for dim in range(1, self.dimensions + 1):
+            prepared = PreparedPoints(gen_unique_kd_points(50, dim))
+            prepared.extend(gen_unique_kd_points(10, dim))
+
+            for d in range(dim):
+                keys = [prepared[i][d] for i in prepared.order(d)]
+                self.assertEqual(keys, sorted(keys))
+                self.assertEqual(sorted(prepared.order(d)), list(range(60)))
+
+    def test_bruteforce_matches_prepared(self):
+        """Dimension=1 to 4 for points size n from 2 to 100"""
+        for dim in range(1, self.dimensions + 1):
+            for n in range(2, 101):
+                points = gen_unique_kd_points(n, dim)
+                prepared = PreparedPoints(points)
+
+                self.assertEqual(prepared.closest_pair()["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+
+    def test_bruteforce_matches_subset(self):
+        """Random subsets of Point and tuple points"""
+        points_2d = Point.get_unique_points(300)
+        points_kd = gen_unique_kd_points(300, 3)
+
+        for points, bf in ((points_2d, bf_closest_pair_2d),
+                           (points_kd, bf_closest_pair_kd)):
+            prepared = PreparedPoints(points)
+            for i in range(20):
+                indices = random.sample(range(300), random.randint(2, 300))
+                subset = [points[i] for i in indices]
+
+                self.assertEqual(
+                    prepared.closest_pair_subset(indices)["distance"],
+                    bf(subset)["distance"])
+
+    def test_bruteforce_matches_extend(self):
+        """Batches appended after a query update the cached pair"""
+        for dim in range(1, self.dimensions + 1):
+            points = gen_unique_kd_points(400, dim)
+            prepared = PreparedPoints(points[:100])
+            prepared.closest_pair()
+
+            for low in range(100, 400, 30):
+                prepared.extend(points[low:low + 30])
+
+                self.assertEqual(
+                    prepared.closest_pair()["distance"],
+                    bf_closest_pair_kd(points[:low + 30])["distance"])
+
+            prepared.extend([points[7]])
+            self.assertEqual(prepared.closest_pair()["distance"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
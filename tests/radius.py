@@ -0,0 +1,92 @@
+"""
+Unit tests
+"""
+import copy
+import random
+import types
+import unittest
+
+from closest_pair import Point, bf_pairlist_kd, fixed_radius_pairs,\
+    gen_unique_kd_points, k_closest_pairs
+
+
+class TestFixedRadius(unittest.TestCase):
+    """
+    Tests for fixed-radius near neighbors
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.dimensions = 3
+
+    def test_negative_radius_raise_exception(self):
+        """Negative radius should raise exception"""
+        with self.assertRaises(ValueError):
+            list(fixed_radius_pairs([(0,), (1,)], -1))
+
+    def test_empty_and_one(self):
+        """0 or 1 point has no pairs"""
+        self.assertEqual(list(fixed_radius_pairs([], 1)), [])
+        self.assertEqual(list(fixed_radius_pairs([(0, 0)], 1)), [])
+
+    def test_is_generator(self):
+        """Pairs are streamed"""
+        points = gen_unique_kd_points(10, 2)
+        self.assertIsInstance(fixed_radius_pairs(points, 5),
+                              types.GeneratorType)
+
+    def test_bruteforce_matches_radius_kd(self):
+        """Dimension=1, 2, 3 for points size n from 2 to 60"""
+        for dim in range(1, self.dimensions + 1):
+            for n in range(2, 61):
+                points = gen_unique_kd_points(n, dim)
+                r = random.uniform(0, n * 5)
+
+                bf_pairs = [pair for pair in bf_pairlist_kd(points)
+                            if pair[2] <= r]
+                pairs = list(fixed_radius_pairs(points, r))
+
+                self.assertEqual(sorted(bf_pairs), sorted(pairs))
+
+    def test_bruteforce_matches_radius_2d(self):
+        """Point objects for points size n from 2 to 60"""
+        for n in range(2, 61):
+            points = Point.get_unique_points(n)
+            r = random.uniform(0, n * 5)
+
+            bf_dists = sorted(pair[2] for pair in bf_pairlist_kd(points)
+                              if pair[2] <= r)
+            dists = sorted(pair[2] for pair in fixed_radius_pairs(points, r))
+
+            self.assertEqual(bf_dists, dists)
+
+    def test_bruteforce_matches_radius_high_dim(self):
+        """Dimension=12, 24 probe occupied cells, not all 3^k neighbors"""
+        for dim in (12, 24):
+            points = gen_unique_kd_points(150, dim)
+            r = random.uniform(0, 150 * 20)
+
+            bf_pairs = [pair for pair in bf_pairlist_kd(points)
+                        if pair[2] <= r]
+            pairs = list(fixed_radius_pairs(points, r))
+
+            self.assertEqual(sorted(bf_pairs), sorted(pairs))
+            self.assertEqual(
+                [pair[2] for pair in k_closest_pairs(points, 5)],
+                sorted(pair[2] for pair in bf_pairlist_kd(points))[:5])
+
+    def test_zero_radius_duplicates(self):
+        """Radius 0 returns only duplicate points"""
+        points = gen_unique_kd_points(50, 2)
+        points.append(copy.deepcopy(points[3]))
+
+        pairs = list(fixed_radius_pairs(points, 0))
+
+        self.assertEqual(pairs, [(points[3], points[-1], 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests
+"""
+import random
+import sys
+import unittest
+
+from closest_pair import Point, RangeIndex, bf_closest_pair_kd,\
+    gen_unique_kd_points
+
+closest_kd = sys.modules["closest_pair.closest_pair_kd"]
+
+
+class TestRangeIndex(unittest.TestCase):
+    """
+    Tests for range closest pair queries
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.dimensions = 3
+
+    def random_box(self, n, dim):
+        """Random box inside the range of gen_unique_kd_points()"""
+        corners = [sorted(random.uniform(-n * 10, n * 10) for i in range(2))
+                   for d in range(dim)]
+        return tuple(c[0] for c in corners), tuple(c[1] for c in corners)
+
+    def check(self, index, points, low, high):
+        """Range query matches brute force on the filtered points"""
+        inside = [p for p in points
+                  if all(low[d] <= p[d] <= high[d] for d in range(len(low)))]
+        result = index.closest_pair_in_range(low, high)
+
+        if len(inside) < 2:
+            self.assertIsNone(result)
+        else:
+            self.assertEqual(result["distance"],
+                             bf_closest_pair_kd(inside)["distance"])
+            for point in result["pair"]:
+                self.assertIn(point, inside)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception"""
+        with self.assertRaises(IndexError):
+            RangeIndex([])
+        with self.assertRaises(IndexError):
+            RangeIndex(gen_unique_kd_points(1, 2))
+
+    def test_bruteforce_matches_range_kd(self):
+        """Dimension=1, 2, 3 for random boxes"""
+        for dim in range(1, self.dimensions + 1):
+            for n in (2, 5, 40, 500):
+                points = gen_unique_kd_points(n, dim)
+                index = RangeIndex(points)
+
+                self.assertEqual(index.closest_pair()["distance"],
+                                 bf_closest_pair_kd(points)["distance"])
+                for i in range(30):
+                    self.check(index, points, *self.random_box(n, dim))
+
+    def test_bruteforce_matches_range_2d(self):
+        """Point objects with duplicates and the whole plane"""
+        points = Point.get_unique_points(400)
+        points += [Point(p.x, p.y) for p in random.sample(points, 3)]
+        index = RangeIndex(points, leaf_size=4)
+
+        for i in range(30):
+            self.check(index, points, *self.random_box(400, 2))
+        self.check(index, points, (-1e9, -1e9), (1e9, 1e9))
+        self.check(index, points, (1e8, 1e8), (1e9, 1e9))
+
+    def test_bruteforce_matches_small_leaves(self):
+        """Deep trees, every node pair checked through whole range queries"""
+        for dim in (2, 3):
+            for n in (100, 1000):
+                points = gen_unique_kd_points(n, dim)
+                index = RangeIndex(points, leaf_size=3)
+
+                self.check(index, points, (-n * 10,) * dim, (n * 10,) * dim)
+                for i in range(20):
+                    self.check(index, points, *self.random_box(n, dim))
+
+    def test_strip_split_axis(self):
+        """Strips of a split on axis 1 are gridded on the other axes"""
+        left = [(x * 10.0, -0.5) for x in range(200)]
+        right = [(x * 10.0 + 0.3, 0.5) for x in range(200)]
+        points = left + right
+        calls = []
+        distance = closest_kd.distance
+
+        def counting(a, b):
+            calls.append(1)
+            return distance(a, b)
+
+        closest_kd.distance = counting
+        try:
+            best = closest_kd.strip_closest_kd(
+                left, right, (10.0, left[0], left[1]), 2, axis=1)
+        finally:
+            closest_kd.distance = distance
+
+        self.assertEqual(best[0], bf_closest_pair_kd(points)["distance"])
+        self.assertLessEqual(len(calls), 3 * len(right))
+
+        index = RangeIndex(points, leaf_size=3)
+        self.check(index, points, (-1e9, -1e9), (1e9, 1e9))
+
+
+if __name__ == "__main__":
+    unittest.main()
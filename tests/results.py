@@ -0,0 +1,116 @@
+"""
+Unit tests
+"""
+import shutil
+import tempfile
+import unittest
+
+from closest_pair.results import environment, group_axes, load_runs,\
+    save_run
+
+
+class Line(object):
+    """Line of a plot, read like a matplotlib Line2D"""
+
+    def __init__(self, label, x, y):
+        self.label, self.x, self.y = label, x, y
+
+    def get_label(self):
+        return self.label
+
+    def get_xdata(self):
+        return self.x
+
+    def get_ydata(self):
+        return self.y
+
+
+class Axes(object):
+    """Axes of a plot, read like matplotlib Axes"""
+
+    def __init__(self, title, lines):
+        self.title, self.lines = title, lines
+
+    def get_title(self):
+        return self.title
+
+    def get_xlabel(self):
+        return "input size (n)"
+
+    def get_ylabel(self):
+        return "timings (seconds)"
+
+    def get_lines(self):
+        return self.lines
+
+
+class Figure(object):
+    """Figure of axes"""
+
+    def __init__(self, *axes):
+        self.axes = list(axes)
+
+
+class TestResults(unittest.TestCase):
+    """
+    Tests for the benchmark results store
+    """
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.directory = tempfile.mkdtemp()
+        self.figure = Figure(Axes("Growth Rates: Recursion", [
+            Line("Recursion", [2, 4, 8], [0.1, 0.2, 0.4]),
+            Line("Bruteforce", [2, 4, 8], [0.1, 0.4, 1.6])]))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_environment(self):
+        """Environment has the CPU, Python version and commit"""
+        env = environment()
+        for key in ("time", "cpu", "cpus", "python", "numpy", "commit"):
+            self.assertIn(key, env)
+        self.assertTrue(env["python"])
+
+    def test_save_load(self):
+        """Saved runs load oldest first with their series"""
+        for time, commit in (("2024-02-01T10:00:00", "bbbbbbbbb"),
+                             ("2024-01-01T10:00:00", None)):
+            env = dict(environment(), time=time, commit=commit)
+            save_run("recursion_2d", [self.figure], self.directory, env)
+        save_run("bruteforce_2d", [self.figure], self.directory)
+
+        runs = load_runs(self.directory, "recursion_2d")
+        self.assertEqual([run["id"] for run in runs],
+                         ["20240101-100000-nocommit",
+                          "20240201-100000-bbbbbbb"])
+
+        axes = runs[0]["axes"][0]
+        self.assertEqual(axes["title"], "Growth Rates: Recursion")
+        self.assertEqual(axes["series"][1],
+                         {"label": "Bruteforce", "x": [2, 4, 8],
+                          "y": [0.1, 0.4, 1.6]})
+
+        self.assertEqual(len(load_runs(self.directory)), 3)
+        self.assertEqual(load_runs(self.directory, "missing"), [])
+
+    def test_group_axes(self):
+        """Axes of the same task and position are overlaid"""
+        for time in ("2024-01-01T10:00:00", "2024-01-02T10:00:00"):
+            env = dict(environment(), time=time)
+            save_run("hook_overhead", [self.figure, self.figure],
+                     self.directory, env)
+        runs = load_runs(self.directory)
+
+        groups = group_axes(runs)
+        self.assertEqual(list(groups), [("hook_overhead", 0),
+                                        ("hook_overhead", 1)])
+        self.assertEqual([run["id"] for run, _ in groups[
+            ("hook_overhead", 1)]], [run["id"] for run in runs])
+
+
+if __name__ == "__main__":
+    unittest.main()
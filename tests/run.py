@@ -0,0 +1,42 @@
+"""
+Unit tests
+"""
+import unittest
+
+from closest_pair import gen_unique_kd_points
+from run import Run
+
+
+class TestRun(unittest.TestCase):
+    """
+    Tests for loading points into the interactive runner
+    """
+
+    def test_add_points_matches_add_point(self):
+        """Same points, padding and duplicates as adding one at a time"""
+        for points in ([(1,), (2, 0), (1, 0), (3,), (2,), (4, 5, 6)],
+                       gen_unique_kd_points(200, 3) * 2):
+            run, each = Run(), Run()
+            duplicates = []
+            for i, point in enumerate(points):
+                try:
+                    each.add_point(point)
+                except ValueError:
+                    duplicates.append(i)
+
+            self.assertEqual(run.add_points(points), duplicates)
+            self.assertEqual(run.points, each.points)
+            self.assertEqual(run.dim, each.dim)
+
+    def test_add_points_pads_loaded_points(self):
+        """Points already loaded are padded to a greater dimension"""
+        run = Run()
+        run.add_point((1,))
+
+        self.assertEqual(run.add_points([(1, 0), (2, 3)]), [0])
+        self.assertEqual(run.points, [(1, 0), (2, 3)])
+        self.assertEqual(run.dim, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Unit tests
+"""
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+
+from closest_pair import bf_closest_pair_kd, bf_pairlist_kd,\
+    closest_pair_kd, gen_unique_kd_points, k_closest_pairs,\
+    nearest_neighbor_kd, distance
+from closest_pair.service import ClosestPairClient, ClosestPairServer,\
+    OP_CLOSEST, OP_K_CLOSEST, REQUEST, RESPONSE, STATUS_ERROR, ServiceError,\
+    encode_request
+
+service = sys.modules["closest_pair.service"]
+
+
+class TestQueries(unittest.TestCase):
+    """
+    Tests for k closest pairs and nearest neighbor
+    """
+    random.seed(0)
+
+    def test_k_closest_matches_bruteforce(self):
+        """Dimension=1, 2, 3 for k up to every pair"""
+        for dim in range(1, 4):
+            for n in (2, 3, 20, 80):
+                points = gen_unique_kd_points(n, dim)
+                bf_dists = sorted(pair[2] for pair in bf_pairlist_kd(points))
+
+                for k in (1, 5, 100, 10000):
+                    dists = [pair[2] for pair in k_closest_pairs(points, k)]
+                    self.assertEqual(dists, bf_dists[:k])
+
+    def test_k_closest_duplicates(self):
+        """All duplicate points"""
+        points = [(1, 1), (1, 1), (1, 1)]
+        self.assertEqual([pair[2] for pair in k_closest_pairs(points, 5)],
+                         [0, 0, 0])
+
+    def test_nearest_neighbor(self):
+        """Nearest point to a query point"""
+        points = gen_unique_kd_points(100, 3)
+        query = (1, 2, 3)
+
+        result = nearest_neighbor_kd(points, query)
+
+        self.assertEqual(result["distance"],
+                         min(distance(p, query) for p in points))
+        self.assertIs(result["pair"][1], query)
+
+
+class TestService(unittest.TestCase):
+    """
+    Tests for the local query service
+    """
+    random.seed(0)
+
+    def setUp(self):
+        """
+        Test setup
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "closest_pair.sock")
+        self.server = ClosestPairServer(self.path, heavy_size=3000)
+        self.server.start_in_thread()
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def test_queries(self):
+        """Each query matches the library answer"""
+        points = gen_unique_kd_points(200, 3)
+
+        with ClosestPairClient(self.path) as client:
+            result = client.closest_pair(points)
+            i, j = result["pair"]
+            self.assertEqual(result["distance"],
+                             bf_closest_pair_kd(points)["distance"])
+            self.assertEqual(result["distance"],
+                             distance(points[i], points[j]))
+
+            pairs = client.k_closest_pairs(points, 10)
+            self.assertEqual([pair[2] for pair in pairs],
+                             [pair[2] for pair in
+                              k_closest_pairs(points, 10)])
+
+            result = client.nearest_neighbor(points, (0, 0, 0))
+            self.assertEqual(result["pair"], (
+                points.index(nearest_neighbor_kd(points, (0, 0, 0))
+                             ["pair"][0]), 200))
+
+    def test_error(self):
+        """Server errors are raised and the connection stays usable"""
+        with ClosestPairClient(self.path) as client:
+            with self.assertRaises(ServiceError):
+                client.closest_pair([(1, 1)])
+
+            points = gen_unique_kd_points(10, 2)
+            self.assertEqual(client.closest_pair(points)["distance"],
+                             bf_closest_pair_kd(points)["distance"])
+
+    def test_batch_matches_execute(self):
+        """Closest pairs of a batch run in one call match single requests"""
+        requests = []
+        for n, dim, op in ((20, 2, OP_CLOSEST), (50, 2, OP_CLOSEST),
+                           (1, 2, OP_CLOSEST), (30, 3, OP_CLOSEST),
+                           (40, 3, OP_CLOSEST), (60, 2, OP_CLOSEST),
+                           (25, 4, OP_CLOSEST), (30, 2, OP_K_CLOSEST)):
+            points = gen_unique_kd_points(n, dim)
+            data = encode_request(op, points, dim, 3)
+            requests.append((op, n, dim, 3, data[REQUEST.size:]))
+
+        for request, (ok, value) in zip(requests,
+                                        service.execute_batch(requests)):
+            if request[1] < 2:
+                self.assertFalse(ok)
+                self.assertIsInstance(value, IndexError)
+                continue
+
+            self.assertTrue(ok)
+            expected = service.execute(*request)
+            self.assertEqual([r[2] for r in value], [r[2] for r in expected])
+            if request[0] == OP_CLOSEST:
+                self.assertEqual(sorted(value[0][:2]),
+                                 sorted(expected[0][:2]))
+
+    def test_failed_batch(self):
+        """A batch that fails as a whole fails each of its requests"""
+        execute_batch = service.execute_batch
+
+        def broken(requests):
+            raise RuntimeError("worker died")
+
+        service.execute_batch = broken
+        try:
+            with ClosestPairClient(self.path, timeout=10) as client:
+                with self.assertRaises(ServiceError):
+                    client.closest_pair(gen_unique_kd_points(10, 2))
+        finally:
+            service.execute_batch = execute_batch
+
+    def test_max_size(self):
+        """Oversized requests get an error without sending the payload"""
+        for n, dim in ((1 << 28, 8), (20000000, 0), (5, 0)):
+            status, count = self._send_header(REQUEST.pack(OP_CLOSEST, n,
+                                                           dim, 0))
+            self.assertEqual(status, STATUS_ERROR)
+            self.assertGreater(count, 0)
+
+    def _send_header(self, header):
+        """Send a request header alone, return the response header"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(10)
+        sock.connect(self.path)
+        try:
+            sock.sendall(header)
+            data = b""
+            while len(data) < RESPONSE.size:
+                chunk = sock.recv(RESPONSE.size - len(data))
+                self.assertTrue(chunk)
+                data += chunk
+        finally:
+            sock.close()
+
+        return RESPONSE.unpack(data)
+
+    def test_concurrent_and_heavy(self):
+        """Concurrent small requests are batched, heavy go to processes"""
+        errors = []
+
+        def work(n):
+            try:
+                with ClosestPairClient(self.path) as client:
+                    for _ in range(5):
+                        points = gen_unique_kd_points(n, 2)
+                        result = client.closest_pair(points)
+                        expected = closest_pair_kd(points)["distance"]
+                        if result["distance"] != expected:
+                            errors.append((n, result))
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=work, args=(n,))
+                   for n in (20, 30, 40, 50, 2000)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
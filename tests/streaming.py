@@ -0,0 +1,90 @@
+"""
+Unit tests
+"""
+import copy
+import random
+import unittest
+
+from closest_pair import Point, SlidingWindowClosestPair, bf_closest_pair_kd,\
+    gen_unique_kd_points
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """
+    Tests for sliding window closest pair of points
+    """
+    random.seed(0)
+
+    def test_invalid_window_raise_exception(self):
+        """Window needs a size of 2 or more, or a duration"""
+        with self.assertRaises(ValueError):
+            SlidingWindowClosestPair()
+        with self.assertRaises(ValueError):
+            SlidingWindowClosestPair(size=1)
+
+    def test_less_than_two_points(self):
+        """0 or 1 point has no pair"""
+        window = SlidingWindowClosestPair(size=5)
+        self.assertIsNone(window.result())
+        self.assertIsNone(window.push((0, 0), 0))
+
+    def test_bruteforce_matches_size_window_kd(self):
+        """Dimension=1, 2, 3 for window size 2 to 40 over 200 points"""
+        for dim in range(1, 4):
+            for size in (2, 3, 7, 40):
+                points = gen_unique_kd_points(200, dim)
+                window = SlidingWindowClosestPair(size=size)
+
+                for i, point in enumerate(points):
+                    result = window.push(point, i)
+                    last = points[max(0, i - size + 1):i + 1]
+
+                    if len(last) < 2:
+                        self.assertIsNone(result)
+                    else:
+                        self.assertEqual(result["distance"],
+                                         bf_closest_pair_kd(last)["distance"])
+
+    def test_bruteforce_matches_time_window_2d(self):
+        """Point objects with duration window and duplicates"""
+        points = Point.get_unique_points(300)
+        points[150] = copy.deepcopy(points[140])
+        times = sorted(random.uniform(0, 100) for _ in points)
+        window = SlidingWindowClosestPair(duration=5)
+
+        for i, point in enumerate(points):
+            result = window.push(point, times[i])
+            last = [p for p, t in zip(points[:i + 1], times)
+                    if t > times[i] - 5]
+
+            self.assertEqual(len(window), len(last))
+            if len(last) < 2:
+                self.assertIsNone(result)
+            else:
+                self.assertEqual(result["distance"],
+                                 bf_closest_pair_kd(last)["distance"])
+
+    def test_expire(self):
+        """Expire drops old points without a push"""
+        window = SlidingWindowClosestPair(duration=10)
+        window.push((0, 0), 0)
+        window.push((1, 0), 1)
+        window.push((5, 0), 5)
+
+        self.assertEqual(window.result()["distance"], 1)
+        window.expire(10.5)
+        self.assertEqual(window.result()["distance"], 4)
+        window.expire(20)
+        self.assertIsNone(window.result())
+
+    def test_decreasing_timestamp_raise_exception(self):
+        """Timestamps must not go back in time"""
+        window = SlidingWindowClosestPair(duration=10)
+        window.push((0, 0), 5)
+
+        with self.assertRaises(ValueError):
+            window.push((1, 1), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Unit tests
+"""
+import random
+import unittest
+
+from closest_pair import Point, bf_closest_pair_2d, bf_closest_pair_kd,\
+    closest_pair_sweep, gen_unique_kd_points, sweep_closest_pairs
+
+
+class TestSweep(unittest.TestCase):
+    """
+    Tests for sweep line closest pair of points
+    """
+    random.seed(0)
+
+    def test_list_invalid_raise_exception(self):
+        """0 or 1 point should raise exception, unsorted points too"""
+        with self.assertRaises(IndexError):
+            closest_pair_sweep([])
+        with self.assertRaises(IndexError):
+            closest_pair_sweep([(1, 2)])
+        with self.assertRaises(ValueError):
+            closest_pair_sweep([(1, 2), (3, 4), (2, 5)])
+
+    def test_bruteforce_matches_sweep(self):
+        """Points size n from 2 to 200 from a generator"""
+        for n in range(2, 201):
+            points = sorted(gen_unique_kd_points(n, 2))
+            result = closest_pair_sweep(p for p in points)
+
+            self.assertEqual(result["distance"],
+                             bf_closest_pair_kd(points)["distance"])
+
+    def test_bruteforce_matches_sweep_2d(self):
+        """Point objects with shared x-coordinates and duplicates"""
+        for n in (10, 100, 1000):
+            points = [Point(random.randint(0, n // 5), random.randint(0, n))
+                      for i in range(n)]
+            points.sort(key=lambda p: p.x)
+
+            self.assertEqual(closest_pair_sweep(points)["distance"],
+                             bf_closest_pair_2d(points)["distance"])
+
+    def test_generator_stage(self):
+        """Running pairs get closer and end at the closest pair"""
+        points = sorted(gen_unique_kd_points(500, 2))
+        results = list(sweep_closest_pairs(iter(points)))
+        distances = [r["distance"] for r in results]
+
+        self.assertEqual(distances, sorted(distances, reverse=True))
+        self.assertEqual(len(set(distances)), len(distances))
+        self.assertEqual(distances[-1],
+                         bf_closest_pair_kd(points)["distance"])
+
+
+if __name__ == "__main__":
+    unittest.main()